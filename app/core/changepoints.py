@@ -0,0 +1,170 @@
+"""
+In-run change-point detection.
+Finds the moments where latency or throughput shifted during a run using binary
+segmentation on a mean-shift (CUSUM) statistic. Every candidate split of a segment
+is scored at once from cumulative sums, so a 24h, 1s-resolution history takes
+milliseconds.
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# metric key -> candidate history columns
+CHANGE_POINT_METRICS = {
+    "p95_ms": ["95%", "95%ile"],
+    "median_ms": ["50%", "Total Median Response Time"],
+    "rps": ["Requests/s", "RPS", "requests/s"],
+}
+
+
+def _first_col(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
+    for c in candidates:
+        if c in df.columns:
+            return c
+    return None
+
+
+def parse_history_timestamps(ts: pd.Series) -> pd.Series:
+    """Locust writes history timestamps as epoch seconds; older exports used date strings."""
+    if pd.api.types.is_numeric_dtype(ts):
+        return pd.to_datetime(ts, unit="s", utc=True)
+    return pd.to_datetime(ts, utc=True, errors="coerce")
+
+
+def aggregated_history(history_df: pd.DataFrame) -> pd.DataFrame:
+    """Keep only the aggregated rows of a (full) history CSV and add elapsed seconds.
+
+    With --csv-full-history Locust writes one row per endpoint per interval; the
+    aggregated series is the one charts and analysis should use.
+    """
+    df = history_df
+    name_col = _first_col(df, ["Name", "name"])
+    if name_col is not None:
+        agg = df[df[name_col].astype(str).str.lower() == "aggregated"]
+        if not agg.empty:
+            df = agg
+    df = df.copy()
+    ts_col = _first_col(df, ["Timestamp", "Time", "timestamp", "time"])
+    if ts_col is None:
+        return df
+    df["_ts"] = parse_history_timestamps(df[ts_col])
+    df = df.sort_values("_ts")
+    df["_elapsed_s"] = (df["_ts"] - df["_ts"].min()).dt.total_seconds()
+    return df.reset_index(drop=True)
+
+
+def _noise_variance(x: np.ndarray) -> float:
+    """Robust noise variance from first differences (insensitive to the shifts themselves)."""
+    if len(x) < 3:
+        return float(np.var(x)) or 1.0
+    mad = np.median(np.abs(np.diff(x) - np.median(np.diff(x))))
+    sigma = 1.4826 * mad / np.sqrt(2)
+    if sigma == 0:
+        sigma = np.std(x) or 1.0
+    return float(sigma ** 2)
+
+
+def _best_split(csum: np.ndarray, start: int, end: int, min_size: int):
+    """Best mean-shift split of x[start:end], scored for every k at once from cumulative sums."""
+    n = end - start
+    if n < 2 * min_size:
+        return None, 0.0
+    k = np.arange(start + min_size, end - min_size + 1)
+    left = csum[k] - csum[start]
+    right = csum[end] - csum[k]
+    total = csum[end] - csum[start]
+    gain = left ** 2 / (k - start) + right ** 2 / (end - k) - total ** 2 / n
+    i = int(np.argmax(gain))
+    return int(k[i]), float(gain[i])
+
+
+def detect_change_points(
+    values: np.ndarray,
+    max_points: int = 5,
+    min_size: int = 30,
+    penalty: float = 3.0,
+) -> List[int]:
+    """Indices where the mean of `values` shifts.
+
+    Args:
+        values: Series to analyse (NaNs must be removed beforehand)
+        max_points: Maximum number of change points to return
+        min_size: Minimum number of samples on either side of a change point
+        penalty: Multiplier of sigma^2 * log(n) a split must gain to be accepted
+
+    Returns:
+        Sorted sample indices at which a new segment starts
+    """
+    x = np.asarray(values, dtype=float)
+    n = len(x)
+    if n < 2 * min_size:
+        return []
+    csum = np.concatenate([[0.0], np.cumsum(x - x.mean())])
+    threshold = penalty * _noise_variance(x) * np.log(n)
+
+    segments = [(0, n)]
+    candidates = {(0, n): _best_split(csum, 0, n, min_size)}
+    points: List[int] = []
+    while len(points) < max_points:
+        seg = max(segments, key=lambda s: candidates[s][1])
+        split, gain = candidates[seg]
+        if split is None or gain <= threshold:
+            break
+        points.append(split)
+        segments.remove(seg)
+        for child in ((seg[0], split), (split, seg[1])):
+            segments.append(child)
+            candidates[child] = _best_split(csum, child[0], child[1], min_size)
+    return sorted(points)
+
+
+def analyze_history(history_df: pd.DataFrame, max_points: int = 5) -> List[Dict[str, Any]]:
+    """Detect change points of every metric in CHANGE_POINT_METRICS.
+
+    Returns:
+        One record per change point with the metric, timestamp, elapsed seconds,
+        user count and RPS at that moment, and the mean before and after.
+    """
+    df = aggregated_history(history_df)
+    if "_elapsed_s" not in df.columns or df.empty:
+        return []
+    users_col = _first_col(df, ["User Count", "Users", "users"])
+    rps_col = _first_col(df, CHANGE_POINT_METRICS["rps"])
+
+    # Ignore the very short runs and keep segments at least ~1% of the run long
+    min_size = max(10, len(df) // 100)
+    results = []
+    for metric, candidates in CHANGE_POINT_METRICS.items():
+        col = _first_col(df, candidates)
+        if col is None:
+            continue
+        series = pd.to_numeric(df[col], errors="coerce")
+        valid = series.notna().to_numpy()
+        x = series.to_numpy()[valid]
+        rows = np.flatnonzero(valid)
+        points = detect_change_points(x, max_points=max_points, min_size=min_size)
+        bounds = [0] + points + [len(x)]
+        for j, p in enumerate(points):
+            row = df.iloc[rows[p]]
+            results.append(
+                {
+                    "metric": metric,
+                    "timestamp": row["_ts"].isoformat(),
+                    "elapsed_s": float(row["_elapsed_s"]),
+                    "user_count": int(row[users_col]) if users_col and pd.notna(row[users_col]) else None,
+                    "rps": float(row[rps_col]) if rps_col and pd.notna(row[rps_col]) else None,
+                    "before": float(x[bounds[j]:p].mean()),
+                    "after": float(x[p:bounds[j + 2]].mean()),
+                }
+            )
+    return sorted(results, key=lambda r: r["elapsed_s"])
+
+
+def analyze_run(run_dir: Path, prefix: str = "stats") -> List[Dict[str, Any]]:
+    """Change points of a finished run, read from its history CSV."""
+    history_path = run_dir / f"{prefix}_stats_history.csv"
+    if not history_path.exists():
+        return []
+    return analyze_history(pd.read_csv(history_path))
@@ -0,0 +1,232 @@
+"""
+Connection profiles for BaseLocustUser.
+A profile decides how simulated clients hold their connections: one pool per
+user (like browsers and SDKs) or one pool shared by every user of a worker
+process (like clients behind a gateway), how big that pool is, whether
+connections are kept alive, whether TLS sessions are resumed instead of doing
+a full handshake per connection, and whether DNS answers are cached.
+
+Built-in profiles are below; LOCUST_CONNECTION_PROFILES can point to a JSON
+file that adds or overrides profiles ({"name": {"pool_size": 50, ...}}). The
+profile of a run is chosen with LOCUST_CONNECTION_PROFILE.
+"""
+import json
+import logging
+import time
+import weakref
+from dataclasses import asdict, dataclass, fields, replace
+from functools import wraps
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConnectionProfile:
+    """How users of a run open and reuse connections.
+
+    Args:
+        name: Profile name
+        description: Shown in the Run tab
+        shared_pool: One connection pool per worker process shared by all users,
+            instead of one per user
+        pool_size: Connections per host in a pool (per user, or per worker when shared)
+        keep_alive: Reuse connections between requests (sends "Connection: close" if False)
+        tls_session_reuse: Resume TLS sessions on new connections (one context per worker)
+        dns_cache_ttl: Seconds to cache DNS answers per worker (0 = resolve every connection)
+        connection_timeout: Seconds to establish a connection
+        network_timeout: Seconds to wait on a socket read/write
+        max_retries: Retries of failed requests
+    """
+
+    name: str
+    description: str = ""
+    shared_pool: bool = False
+    pool_size: int = 10
+    keep_alive: bool = True
+    tls_session_reuse: bool = False
+    dns_cache_ttl: float = 0.0
+    connection_timeout: float = 5.0
+    network_timeout: float = 10.0
+    max_retries: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+DEFAULT_PROFILE = "default"
+
+BUILTIN_PROFILES: Dict[str, ConnectionProfile] = {
+    p.name: p
+    for p in (
+        ConnectionProfile(
+            name="default",
+            description="Own pool per user, keep-alive, full TLS handshake per connection",
+        ),
+        ConnectionProfile(
+            name="browser",
+            description="Own pool of 6 per user, keep-alive, TLS resumption, DNS cached for 60s",
+            pool_size=6,
+            tls_session_reuse=True,
+            dns_cache_ttl=60.0,
+        ),
+        ConnectionProfile(
+            name="gateway",
+            description="One shared pool of 100 per worker, keep-alive, TLS resumption, DNS cached for 60s",
+            shared_pool=True,
+            pool_size=100,
+            tls_session_reuse=True,
+            dns_cache_ttl=60.0,
+        ),
+        ConnectionProfile(
+            name="no-keepalive",
+            description="New connection, DNS lookup and TLS handshake for every request",
+            pool_size=1,
+            keep_alive=False,
+        ),
+    )
+}
+
+
+def load_profiles(path: Optional[Path] = None) -> Dict[str, ConnectionProfile]:
+    """Built-in profiles plus those from a JSON file (file entries win)."""
+    profiles = dict(BUILTIN_PROFILES)
+    if not path:
+        return profiles
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read connection profiles from {path}: {e}")
+        return profiles
+    known = {f.name for f in fields(ConnectionProfile)} - {"name"}
+    for name, values in data.items():
+        unknown = set(values) - known
+        if unknown:
+            logger.warning(f"Connection profile '{name}': ignoring unknown keys {sorted(unknown)}")
+        values = {k: v for k, v in values.items() if k in known}
+        base = profiles.get(name, profiles[DEFAULT_PROFILE])
+        profiles[name] = replace(base, name=name, **values)
+    return profiles
+
+
+def get_profile(name: Optional[str] = None) -> ConnectionProfile:
+    """The named profile (default: LOCUST_CONNECTION_PROFILE), falling back to "default"."""
+    from .settings import settings
+
+    profiles = load_profiles(settings.locust_connection_profiles)
+    name = name or settings.locust_connection_profile
+    if name not in profiles:
+        logger.warning(f"Unknown connection profile '{name}', using '{DEFAULT_PROFILE}'")
+        name = DEFAULT_PROFILE
+    return profiles[name]
+
+
+# --- Locust-side: applied to BaseLocustUser in the locust process ------------
+
+
+def _session_reuse_context_factory(insecure: bool):
+    """SSLContext factory returning one process-wide context that resumes TLS sessions."""
+    import gevent.ssl
+
+    class SessionReuseContext(gevent.ssl.SSLContext):
+        def wrap_socket(self, sock, *args, server_hostname=None, session=None, **kwargs):
+            if session is None:
+                # TLS 1.3 tickets arrive after the handshake: look at the last socket too
+                latest = self._latest.get(server_hostname)
+                sslsock = latest() if latest else None
+                fresh = getattr(sslsock, "session", None) if sslsock is not None else None
+                if fresh is not None and fresh.has_ticket:
+                    self._sessions[server_hostname] = fresh
+                session = self._sessions.get(server_hostname)
+            sslsock = super().wrap_socket(sock, *args, server_hostname=server_hostname, session=session, **kwargs)
+            self._latest[server_hostname] = weakref.ref(sslsock)
+            return sslsock
+
+    context = SessionReuseContext(gevent.ssl.PROTOCOL_TLS_CLIENT)
+    context._sessions = {}
+    context._latest = {}
+    if insecure:
+        context.check_hostname = False
+        context.verify_mode = gevent.ssl.CERT_NONE
+    else:
+        context.load_default_certs()
+
+    def factory(cafile=None):
+        return context
+
+    return factory
+
+
+def _enable_dns_cache(ttl: float) -> None:
+    """Cache getaddrinfo answers of geventhttpclient pools for `ttl` seconds (process-wide)."""
+    from gevent.event import AsyncResult
+    from geventhttpclient.connectionpool import ConnectionPool
+
+    if getattr(ConnectionPool._resolve, "_dns_cache", False):
+        return
+    resolve = ConnectionPool._resolve
+    cache: Dict[tuple, tuple] = {}
+    in_flight: Dict[tuple, AsyncResult] = {}
+
+    @wraps(resolve)
+    def cached_resolve(pool):
+        key = (pool._connection_host, pool._connection_port, pool.disable_ipv6)
+        hit = cache.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+        # Users spawned together share one lookup instead of each starting their own
+        pending = in_flight.get(key)
+        if pending is not None:
+            return pending.get()
+        pending = in_flight[key] = AsyncResult()
+        try:
+            info = resolve(pool)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            in_flight.pop(key, None)
+        cache[key] = (time.monotonic() + ttl, info)
+        pending.set(info)
+        return info
+
+    cached_resolve._dns_cache = True
+    ConnectionPool._resolve = cached_resolve
+
+
+def apply_profile(user_cls, profile: ConnectionProfile) -> None:
+    """Set a FastHttpUser class's connection attributes from a profile.
+
+    Subclasses that set these attributes themselves keep their own values.
+    """
+    user_cls.connection_timeout = profile.connection_timeout
+    user_cls.network_timeout = profile.network_timeout
+    user_cls.max_retries = profile.max_retries
+    user_cls.concurrency = profile.pool_size
+    if not profile.keep_alive:
+        user_cls.default_headers = {**(user_cls.default_headers or {}), "Connection": "close"}
+    ssl_context_factory = None
+    if profile.tls_session_reuse:
+        ssl_context_factory = _session_reuse_context_factory(user_cls.insecure)
+        user_cls.ssl_context_factory = ssl_context_factory
+    if profile.dns_cache_ttl > 0:
+        _enable_dns_cache(profile.dns_cache_ttl)
+    if profile.shared_pool:
+        from geventhttpclient.client import HTTPClientPool
+
+        pool_kwargs = dict(
+            concurrency=profile.pool_size,
+            connection_timeout=profile.connection_timeout,
+            network_timeout=profile.network_timeout,
+            insecure=user_cls.insecure,
+        )
+        if ssl_context_factory is not None:
+            pool_kwargs["ssl_context_factory"] = ssl_context_factory
+        else:
+            from locust.contrib.fasthttp import insecure_ssl_context_factory
+
+            if user_cls.insecure:
+                pool_kwargs["ssl_context_factory"] = insecure_ssl_context_factory
+        user_cls.client_pool = HTTPClientPool(**pool_kwargs)
+    logger.info(f"Connection profile: {profile.name} ({profile.description})")
@@ -1,5 +1,6 @@
 
 import io
+import json
 import zipfile
 import pandas as pd
 import streamlit as st
@@ -15,6 +16,11 @@ def load_stats(run_dir: Path, prefix: str = "stats") -> Dict[str, pd.DataFrame]:
         "requests": run_dir / f"{prefix}_requests.csv",
         "exceptions": run_dir / f"{prefix}_exceptions.csv",
         "distribution": run_dir / f"{prefix}_distribution.csv",
+        # Written by app/core/latency_correction.py, locustfiles/utils/phases.py and
+        # app/core/warmup.py when enabled
+        "corrected": run_dir / "corrected_stats.csv",
+        "phases": run_dir / "phase_timings.csv",
+        "warmup": run_dir / "warmup_stats.csv",
     }
     data = {}
     for k, p in files.items():
@@ -45,6 +51,163 @@ def run_signature(run_dir: Path) -> Tuple:
 def list_runs() -> list[Path]:
     return sorted([p for p in RUNS_DIR.iterdir() if p.is_dir()], reverse=True)
 
+def runs_signature() -> Tuple:
+    """Signature of every run directory; changes when any run is added, removed or updated."""
+    return tuple((str(r), run_signature(r)) for r in list_runs())
+
+def _first_col(df: pd.DataFrame, candidates: list[str]):
+    for c in candidates:
+        if c in df.columns:
+            return c
+    return None
+
+def _try_number(val, default=None):
+    try:
+        if pd.isna(val):
+            return default
+        return float(val)
+    except Exception:
+        return default
+
+def load_run_meta(run_dir: Path) -> Dict[str, Any]:
+    mp = run_dir / "metadata.json"
+    if mp.exists():
+        try:
+            return json.loads(mp.read_text(encoding="utf-8"))
+        except Exception:
+            pass
+    return {}
+
+def steady_state_history(history_df: pd.DataFrame, meta: Dict[str, Any]) -> pd.DataFrame:
+    """History rows written after the warm-up ended (all rows if there was none)."""
+    ended_at = (meta.get("warmup_window") or {}).get("ended_at")
+    ts_col = _first_col(history_df, ["Timestamp", "timestamp"])
+    if not ended_at or ts_col is None or not pd.api.types.is_numeric_dtype(history_df[ts_col]):
+        return history_df
+    steady = history_df[history_df[ts_col] >= ended_at]
+    return steady if not steady.empty else history_df
+
+def summarize_run(run_dir: Path) -> Dict[str, Any] | None:
+    """Build the dashboard summary row of a run, or None if it has no aggregated stats."""
+    meta = load_run_meta(run_dir)
+    data = load_stats_cached(str(run_dir), "stats", run_signature(run_dir))
+    agg = None
+    if "stats" in data and not data["stats"].empty:
+        sdf = data["stats"]
+        name_col = _first_col(sdf, ["Name", "name"]) or "Name"
+        agg_rows = (
+            sdf[sdf[name_col].astype(str).str.lower() == "aggregated"]
+            if name_col in sdf.columns
+            else pd.DataFrame()
+        )
+        if not agg_rows.empty:
+            agg = agg_rows.iloc[0]
+
+    if agg is None:
+        return None
+
+    # Extract values with multiple possible column names
+    req_count = _try_number(agg.get("Request Count", agg.get("Requests", 0)), 0)
+    fail_count = _try_number(
+        agg.get("Failure Count", agg.get("Failures", 0)), 0
+    )
+    median = _try_number(
+        agg.get("50%ile", agg.get("Median Response Time", agg.get("50%", None)))
+    )
+    p95 = _try_number(agg.get("95%ile", agg.get("95%", None)))
+
+    # Average RPS from history if available (steady state only when warm-up was excluded)
+    avg_rps = None
+    if "history" in data and not data["history"].empty:
+        hdf = steady_state_history(data["history"], meta)
+        rps_col = _first_col(hdf, ["Requests/s", "RPS", "requests/s"])
+        if rps_col:
+            try:
+                avg_rps = float(hdf[rps_col].astype(float).mean())
+            except Exception:
+                avg_rps = None
+
+    return {
+        "run_id": run_dir.name,
+        "path": str(run_dir),
+        "locustfile": meta.get("locustfile"),
+        "host": meta.get("effective_host")
+        or meta.get("typed_host")
+        or meta.get("file_host"),
+        "started_at": meta.get("started_at"),
+        "ended_at": meta.get("ended_at"),
+        "users": meta.get("users"),
+        "spawn_rate": meta.get("spawn_rate"),
+        "run_time": meta.get("run_time"),
+        "requests": req_count,
+        "failures": fail_count,
+        "success_rate": (1 - fail_count / req_count) * 100
+        if req_count and req_count > 0
+        else None,
+        "median_ms": median,
+        "p95_ms": p95,
+        "avg_rps": avg_rps,
+    }
+
+@st.cache_data(show_spinner=False)
+def collect_run_summaries_cached(runs_sig: Tuple) -> list[Dict[str, Any]]:
+    summaries = []
+    for run_dir_str, _ in runs_sig:
+        summary = summarize_run(Path(run_dir_str))
+        if summary is not None:
+            summaries.append(summary)
+    return summaries
+
+def build_report_summary_html(run_dir: Path, prefix: str = "stats") -> str:
+    """Render a slim, self-contained HTML summary of a run.
+    Used instead of the full Locust report when that one is too large to inline.
+    """
+    stats_path = run_dir / f"{prefix}_stats.csv"
+    if not stats_path.exists():
+        return "<p>No statistics found for this run.</p>"
+    df = pd.read_csv(stats_path)
+    keep = [
+        c for c in [
+            "Type", "Name", "Request Count", "Failure Count",
+            "Median Response Time", "Average Response Time",
+            "Min Response Time", "Max Response Time",
+            "95%", "99%", "Requests/s", "Failures/s",
+        ] if c in df.columns
+    ]
+    table = (df[keep] if keep else df).to_html(
+        index=False, float_format=lambda v: f"{v:.2f}", border=0
+    )
+    return (
+        "<style>table{border-collapse:collapse;font-family:sans-serif;font-size:13px}"
+        "th,td{padding:4px 8px;border-bottom:1px solid #ddd;text-align:right}"
+        "th{background:#f5f5f5}td:nth-child(2){text-align:left}</style>"
+        f"<h3 style='font-family:sans-serif'>{run_dir.name}</h3>{table}"
+    )
+
+@st.cache_data(show_spinner=False)
+def load_change_points_cached(run_dir_str: str, prefix: str, sig: Tuple) -> list:
+    """Change points recorded at the end of the run, or computed now for older runs."""
+    from .changepoints import analyze_run
+
+    meta = load_run_meta(Path(run_dir_str))
+    if "change_points" in meta:
+        return meta["change_points"]
+    return analyze_run(Path(run_dir_str), prefix)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def load_failure_index_cached(run_dir_str: str, prefix: str, sig: Tuple) -> Dict[str, Any]:
+    from .failures import load_failure_index
+
+    return load_failure_index(Path(run_dir_str), prefix)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def load_report_summary_cached(run_dir_str: str, prefix: str, sig: Tuple) -> str:
+    return build_report_summary_html(Path(run_dir_str), prefix)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_report_html_cached(html_path_str: str, sig: Tuple) -> str:
+    return Path(html_path_str).read_text(encoding="utf-8")
+
 def create_run_zip(run_dir: Path) -> bytes:
     """Create a ZIP archive of all files in run directory."""
     buffer = io.BytesIO()
@@ -55,3 +218,7 @@ def create_run_zip(run_dir: Path) -> bytes:
                 zf.write(file_path, arcname)
     buffer.seek(0)
     return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def create_run_zip_cached(run_dir_str: str, sig: Tuple) -> bytes:
+    return create_run_zip(Path(run_dir_str))
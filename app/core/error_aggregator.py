@@ -0,0 +1,116 @@
+"""
+Bounded error aggregation.
+Groups request failures by (request type, endpoint, error) fingerprint with a
+fixed upper bound on distinct entries, so memory stays flat on long runs with
+dynamic request names or error texts.
+
+In distributed runs workers forward only what changed since their last report
+(take_delta) and the master folds those deltas into its own aggregator (merge).
+"""
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from .fingerprint import fingerprint
+
+SAMPLE_MAX_LEN = 500
+
+
+class ErrorAggregator:
+    """LRU-capped map of error fingerprint -> count and one sample message."""
+
+    def __init__(self, max_entries: int = 500):
+        self.max_entries = max_entries
+        # key -> [count, request_type, name, sample, count already forwarded]
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self.total = 0
+        self.evicted = 0
+        self.evicted_occurrences = 0
+        self._forwarded = (0, 0, 0)  # total, evicted, evicted_occurrences
+
+    def add(self, request_type: str, name: str, message: str) -> bool:
+        """Count one failure; returns True the first time its fingerprint is seen.
+
+        An evicted fingerprint that comes back counts as new again.
+        """
+        self.total += 1
+        key = f"{request_type} {fingerprint(name)} | {fingerprint(message)}"
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[0] += 1
+            self._entries.move_to_end(key)
+            return False
+        self._entries[key] = [1, request_type, name, str(message)[:SAMPLE_MAX_LEN], 0]
+        if len(self._entries) > self.max_entries:
+            self._evict_oldest()
+        return True
+
+    def _evict_oldest(self):
+        _, old = self._entries.popitem(last=False)
+        self.evicted += 1
+        # Occurrences already forwarded live on in the master's aggregator
+        self.evicted_occurrences += old[0] - old[4]
+
+    def take_delta(self) -> Dict[str, Any]:
+        """Counts added since the previous call, in a compact msgpack-friendly form.
+
+        The sample message is only included the first time a fingerprint is forwarded.
+        """
+        entries = []
+        for key, entry in self._entries.items():
+            count, request_type, name, sample, forwarded = entry
+            if count > forwarded:
+                entries.append([key, count - forwarded, request_type, name, sample if not forwarded else None])
+                entry[4] = count
+        total, evicted, occurrences = self._forwarded
+        delta = {
+            "entries": entries,
+            "total": self.total - total,
+            "evicted": self.evicted - evicted,
+            "evicted_occurrences": self.evicted_occurrences - occurrences,
+        }
+        self._forwarded = (self.total, self.evicted, self.evicted_occurrences)
+        return delta
+
+    def merge(self, delta: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fold a take_delta() result from another process into this aggregator.
+
+        Returns:
+            The fingerprints that were new here, as dicts like top() returns
+        """
+        self.total += delta.get("total", 0)
+        self.evicted += delta.get("evicted", 0)
+        self.evicted_occurrences += delta.get("evicted_occurrences", 0)
+        new = []
+        for key, count, request_type, name, sample in delta.get("entries", []):
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[0] += count
+                self._entries.move_to_end(key)
+                continue
+            self._entries[key] = [count, request_type, name, sample or "", 0]
+            new.append(
+                {"fingerprint": key, "count": count, "request_type": request_type, "name": name, "sample": sample or ""}
+            )
+            if len(self._entries) > self.max_entries:
+                self._evict_oldest()
+        return new
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return self.total > 0
+
+    def top(self, n: int = 10) -> List[Dict[str, Any]]:
+        """The n most frequent fingerprints, most frequent first."""
+        ranked = sorted(self._entries.items(), key=lambda kv: kv[1][0], reverse=True)[:n]
+        return [
+            {
+                "fingerprint": key,
+                "count": count,
+                "request_type": request_type,
+                "name": name,
+                "sample": sample,
+            }
+            for key, (count, request_type, name, sample, _) in ranked
+        ]
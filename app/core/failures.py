@@ -0,0 +1,188 @@
+"""
+Failure and exception index.
+Groups the failures CSV, the exceptions CSV and error lines of locust.log by
+fingerprint, with counts, affected endpoints and first/last seen times. The index
+is built once per run and stored next to the other run files.
+"""
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from .changepoints import parse_history_timestamps
+from .fingerprint import fingerprint
+
+INDEX_FILE = "failure_index.json"
+# 2: locust.log times are read as local time
+INDEX_VERSION = 2
+
+# Locust log format: "[2024-01-01 12:00:00,123] host/ERROR/logger.name: message"
+_LOG_LINE = re.compile(
+    r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})[,.]\d+\] [^/]*/(ERROR|CRITICAL|WARNING)/[^:]*: (.*)$"
+)
+_MAX_LOG_FINGERPRINTS = 1000
+
+
+def _iso(ts: Optional[datetime]) -> Optional[str]:
+    return ts.isoformat() if ts is not None else None
+
+
+def _parse_ts(value) -> Optional[datetime]:
+    if value is None or (isinstance(value, float) and pd.isna(value)) or value == "":
+        return None
+    ts = pd.to_datetime(value, utc=True, errors="coerce")
+    return None if pd.isna(ts) else ts.to_pydatetime()
+
+
+def _touch(entry: Dict[str, Any], first: Optional[datetime], last: Optional[datetime]):
+    if first is not None and (entry["first_seen"] is None or first < entry["first_seen"]):
+        entry["first_seen"] = first
+    if last is not None and (entry["last_seen"] is None or last > entry["last_seen"]):
+        entry["last_seen"] = last
+
+
+def _endpoint_failure_windows(history: Optional[pd.DataFrame]) -> Dict[tuple, tuple]:
+    """(method, name) -> (first, last) time the endpoint's failure counter increased."""
+    if history is None or history.empty or "Total Failure Count" not in history.columns:
+        return {}
+    df = history[history["Name"].astype(str).str.lower() != "aggregated"].copy()
+    if df.empty:
+        return {}
+    df["_ts"] = parse_history_timestamps(df["Timestamp"])
+    windows = {}
+    for (method, name), g in df.sort_values("_ts").groupby(["Type", "Name"], dropna=False):
+        counts = pd.to_numeric(g["Total Failure Count"], errors="coerce").fillna(0).to_numpy()
+        grew = g["_ts"].to_numpy()[(counts[1:] > counts[:-1]).nonzero()[0] + 1]
+        if counts[0] > 0:
+            grew = [g["_ts"].iloc[0]] + list(grew)
+        if len(grew):
+            windows[(str(method), str(name))] = (
+                pd.Timestamp(grew[0]).to_pydatetime(),
+                pd.Timestamp(grew[-1]).to_pydatetime(),
+            )
+    return windows
+
+
+def build_failure_index(run_dir: Path, prefix: str = "stats") -> Dict[str, Any]:
+    """Index the failures of a run by fingerprint.
+
+    Args:
+        run_dir: Run directory
+        prefix: CSV prefix used by the run
+
+    Returns:
+        Dict with a "fingerprints" list (most frequent first) where each entry has
+        fingerprint, kind, count, endpoints, sample, first_seen and last_seen
+    """
+    entries: Dict[tuple, Dict[str, Any]] = {}
+
+    def entry(kind: str, fp: str, sample: str) -> Dict[str, Any]:
+        key = (kind, fp)
+        if key not in entries:
+            entries[key] = {
+                "fingerprint": fp,
+                "kind": kind,
+                "count": 0,
+                "endpoints": {},
+                "sample": sample[:2000],
+                "first_seen": None,
+                "last_seen": None,
+            }
+        return entries[key]
+
+    history_path = run_dir / f"{prefix}_stats_history.csv"
+    history = pd.read_csv(history_path) if history_path.exists() else None
+    windows = _endpoint_failure_windows(history)
+
+    failures_path = run_dir / f"{prefix}_failures.csv"
+    if failures_path.exists():
+        fdf = pd.read_csv(failures_path)
+        for row in fdf.to_dict("records"):
+            error = str(row.get("Error", ""))
+            count = int(row.get("Occurrences", 0) or 0)
+            e = entry("failure", fingerprint(error), error)
+            e["count"] += count
+            endpoint = f"{row.get('Method', '')} {row.get('Name', '')}".strip()
+            e["endpoints"][endpoint] = e["endpoints"].get(endpoint, 0) + count
+            # "First Seen"/"Last Seen" exist since Locust 2.33; fall back to the history
+            first = _parse_ts(row.get("First Seen"))
+            last = _parse_ts(row.get("Last Seen"))
+            if first is None and last is None:
+                first, last = windows.get((str(row.get("Method")), str(row.get("Name"))), (None, None))
+            _touch(e, first, last)
+
+    exceptions_path = run_dir / f"{prefix}_exceptions.csv"
+    if exceptions_path.exists():
+        edf = pd.read_csv(exceptions_path)
+        for row in edf.to_dict("records"):
+            message = str(row.get("Message", ""))
+            e = entry("exception", fingerprint(message), str(row.get("Traceback", message)))
+            e["count"] += int(row.get("Count", 0) or 0)
+            nodes = str(row.get("Nodes", "") or "")
+            if nodes and nodes != "nan":
+                e["endpoints"][f"nodes: {nodes}"] = e["endpoints"].get(f"nodes: {nodes}", 0) + 1
+
+    # locust.log can be large: stream it and only parse error/warning lines
+    log_path = run_dir / "locust.log"
+    log_overflow = 0
+    log_fingerprints = 0
+    if log_path.exists():
+        with log_path.open("r", encoding="utf-8", errors="ignore") as fh:
+            for line in fh:
+                if "/ERROR/" not in line and "/CRITICAL/" not in line and "/WARNING/" not in line:
+                    continue
+                m = _LOG_LINE.match(line.rstrip("\n"))
+                if not m:
+                    continue
+                fp = fingerprint(m.group(3))
+                key = ("log", fp)
+                if key not in entries:
+                    if log_fingerprints >= _MAX_LOG_FINGERPRINTS:
+                        log_overflow += 1
+                        continue
+                    log_fingerprints += 1
+                e = entry("log", fp, m.group(3))
+                e["count"] += 1
+                level = m.group(2)
+                e["endpoints"][level] = e["endpoints"].get(level, 0) + 1
+                # Locust logs the generator's local time; CSV timestamps are epoch-based
+                ts = datetime.strptime(m.group(1), "%Y-%m-%d %H:%M:%S").astimezone().astimezone(timezone.utc)
+                _touch(e, ts, ts)
+
+    fingerprints = sorted(entries.values(), key=lambda e: e["count"], reverse=True)
+    for e in fingerprints:
+        e["first_seen"] = _iso(e["first_seen"])
+        e["last_seen"] = _iso(e["last_seen"])
+        e["endpoints"] = dict(sorted(e["endpoints"].items(), key=lambda kv: kv[1], reverse=True))
+    return {
+        "version": INDEX_VERSION,
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "total_failures": sum(e["count"] for e in fingerprints if e["kind"] == "failure"),
+        "log_overflow": log_overflow,
+        "fingerprints": fingerprints,
+    }
+
+
+def write_failure_index(run_dir: Path, prefix: str = "stats") -> Dict[str, Any]:
+    index = build_failure_index(run_dir, prefix)
+    (run_dir / INDEX_FILE).write_text(json.dumps(index, indent=2), encoding="utf-8")
+    return index
+
+
+def load_failure_index(run_dir: Path, prefix: str = "stats") -> Dict[str, Any]:
+    """Load the stored index, building (and storing) it if missing or outdated."""
+    path = run_dir / INDEX_FILE
+    if path.exists():
+        try:
+            index = json.loads(path.read_text(encoding="utf-8"))
+            if index.get("version") == INDEX_VERSION:
+                return index
+        except Exception:
+            pass
+    try:
+        return write_failure_index(run_dir, prefix)
+    except OSError:
+        return build_failure_index(run_dir, prefix)
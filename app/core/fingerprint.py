@@ -0,0 +1,55 @@
+"""
+Error message fingerprinting.
+Normalises the variable parts of failure and exception messages (URLs, ids,
+UUIDs, timestamps, numbers) so that occurrences of the same error group together.
+"""
+import re
+from functools import lru_cache
+
+_URL = re.compile(r"(https?://[^\s/'\"<>]+)([^\s?#'\"<>]*)(\?[^\s#'\"<>]*)?")
+_UUID = re.compile(
+    r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"
+)
+_TIMESTAMP = re.compile(
+    r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?"
+)
+_HEX = re.compile(r"\b(?:0x[0-9a-fA-F]+|[0-9a-fA-F]*\d[0-9a-fA-F]*[a-fA-F][0-9a-fA-F]*)\b")
+# HTTP status codes followed by their reason phrase ("503 Service Unavailable") are kept
+_NUMBER = re.compile(r"(?<![\w<])(?![1-5]\d\d [A-Z])\d+(?:\.\d+)?")
+_SPACES = re.compile(r"\s+")
+
+# Hex-looking tokens shorter than this are kept (e.g. "e2e", "h2c")
+_MIN_HEX_LEN = 8
+
+
+def _normalize_url(m: re.Match) -> str:
+    query = "?<query>" if m.group(3) else ""
+    return f"{m.group(1)}{m.group(2)}{query}"
+
+
+def _hex_token(m: re.Match) -> str:
+    token = m.group(0)
+    return "<hex>" if len(token) >= _MIN_HEX_LEN or token.startswith("0x") else token
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(message: str, max_len: int = 300) -> str:
+    """Return the normalised form of an error message.
+
+    Identical fingerprints mean "same error", whatever ids, timestamps or query
+    strings the individual occurrences carried.
+
+    Args:
+        message: Raw failure or exception text
+        max_len: Maximum length of the returned fingerprint
+
+    Returns:
+        Normalised message, e.g. "500 Server Error for url: http://api/users/<n>?<query>"
+    """
+    text = _URL.sub(_normalize_url, str(message))
+    text = _UUID.sub("<uuid>", text)
+    text = _TIMESTAMP.sub("<ts>", text)
+    text = _HEX.sub(_hex_token, text)
+    text = _NUMBER.sub("<n>", text)
+    text = _SPACES.sub(" ", text).strip()
+    return text[:max_len]
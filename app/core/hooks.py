@@ -1,6 +1,7 @@
 """
 Locust ReportPortal Hook
-This file is automatically loaded by Locust and starts ReportPortal listener.
+This file is automatically loaded by Locust and starts ReportPortal listener,
+plus the optional OpenMetrics endpoint.
 """
 import os
 import logging
@@ -35,3 +36,76 @@ def on_locust_init(environment, **kwargs):
             logger.error(f"❌ Failed to initialize ReportPortal: {e}", exc_info=True)
     else:
         logger.warning("⚠️  ReportPortal config missing, listener disabled")
+
+
+@events.init.add_listener
+def on_locust_init_metrics(environment, **kwargs):
+    """Starts the OpenMetrics endpoint when LOCUST_METRICS_PORT is set (master/standalone only)."""
+    from app.core.settings import settings
+
+    if not settings.locust_metrics_port:
+        return
+    from locust.runners import WorkerRunner
+
+    # Workers report to the master, whose stats are the aggregated view
+    if isinstance(environment.runner, WorkerRunner):
+        return
+    try:
+        from app.core.metrics_exporter import MetricsExporter
+
+        MetricsExporter(
+            environment,
+            host=settings.locust_metrics_host,
+            port=settings.locust_metrics_port,
+            refresh_interval=settings.locust_metrics_refresh_interval,
+        ).start()
+    except Exception as e:
+        logger.error(f"❌ Failed to start metrics endpoint: {e}", exc_info=True)
+
+
+@events.init.add_listener
+def on_locust_init_latency_correction(environment, **kwargs):
+    """Keeps a coordinated-omission-corrected histogram when LOCUST_CO_CORRECTION is set."""
+    from app.core.settings import settings
+
+    if not settings.locust_co_correction:
+        return
+    try:
+        from app.core.latency_correction import LatencyCorrector
+
+        environment.latency_corrector = LatencyCorrector(environment)
+    except Exception as e:
+        logger.error(f"❌ Failed to set up latency correction: {e}", exc_info=True)
+
+
+@events.init.add_listener
+def on_locust_init_warmup(environment, **kwargs):
+    """Excludes the warm-up (LOCUST_WARMUP: "rampup" or a time span) from the statistics."""
+    from app.core.settings import settings
+
+    if not settings.locust_warmup:
+        return
+    try:
+        from app.core.warmup import WarmupController
+
+        environment.warmup = WarmupController(environment, settings.locust_warmup)
+    except Exception as e:
+        logger.error(f"❌ Failed to set up warm-up exclusion: {e}", exc_info=True)
+
+
+@events.init.add_listener
+def on_locust_init_slo(environment, **kwargs):
+    """Evaluates the run's SLOs (LOCUST_SLO_FILE or the defaults) live on master/standalone."""
+    from locust.runners import WorkerRunner
+
+    from app.core.settings import settings
+
+    # The master sees every worker's stats; workers only apply the SLOs to their summary
+    if isinstance(environment.runner, WorkerRunner):
+        return
+    try:
+        from app.core.slo import SloEvaluator, load_slo_spec
+
+        environment.slo_evaluator = SloEvaluator(environment, load_slo_spec(settings.locust_slo_file))
+    except Exception as e:
+        logger.error(f"❌ Failed to set up SLO evaluation: {e}", exc_info=True)
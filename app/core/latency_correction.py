@@ -0,0 +1,184 @@
+"""
+Coordinated-omission correction.
+A user waits for its response before sending the next request, so while the
+target stalls it sends fewer requests instead of recording slow ones, and the
+raw percentiles look better than what a steady stream of clients would see.
+A second, corrected histogram is kept next to Locust's raw one:
+
+- open model (locustfiles/utils/arrival.py): latency is measured from the
+  scheduled send time, so time spent waiting for a free user counts
+- closed model: a response slower than the user's usual send interval is
+  back-filled with the samples it would have sent meanwhile
+  (value - k * interval), the HdrHistogram "expected interval" correction;
+  needs the "user_id" that BaseLocustUser puts into the request context
+
+Written as corrected_stats.csv into LOCUST_RUN_DIR when the test stops; in
+distributed runs the workers send their corrected histograms to the master.
+"""
+import csv
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from locust.runners import MasterRunner, WorkerRunner
+from locust.stats import RequestStats, StatsEntry, bucket_response_time
+
+from .stats_summary import histogram_percentiles
+
+logger = logging.getLogger(__name__)
+
+CORRECTED_STATS_FILE = "corrected_stats.csv"
+CORRECTED_MESSAGE = "co_corrected_stats"
+CSV_PERCENTILES = (0.50, 0.95, 0.99)
+# Upper bound on back-filled samples for a single slow response
+MAX_BACKFILL = 10000
+# Send intervals between re-computations of a user's expected interval
+INTERVAL_REFRESH = 100
+
+
+def _record(entry: StatsEntry, response_time: float, count: int = 1):
+    entry.num_requests += count
+    entry.total_response_time += response_time * count
+    if entry.min_response_time is None or response_time < entry.min_response_time:
+        entry.min_response_time = response_time
+    if response_time > entry.max_response_time:
+        entry.max_response_time = response_time
+    entry.response_times[bucket_response_time(response_time)] += count
+
+
+class LatencyCorrector:
+    """Keeps the corrected histogram for one Locust environment.
+
+    Args:
+        environment: Locust environment
+    """
+
+    def __init__(self, environment):
+        self.env = environment
+        self.stats = RequestStats()
+        # user id -> [last send time, interval histogram, count, expected interval ms]
+        self._users: Dict[int, list] = {}
+
+        runner = environment.runner
+        environment.events.request.add_listener(self.on_request)
+        environment.events.test_start.add_listener(lambda **kw: self.reset())
+        environment.events.reset_stats.add_listener(self.reset)
+        if isinstance(runner, WorkerRunner):
+            # Sent before "client_stopped", so the master has it before its test_stop
+            environment.events.test_stop.add_listener(lambda **kw: self._send_to_master())
+        else:
+            if isinstance(runner, MasterRunner):
+                runner.register_message(CORRECTED_MESSAGE, self.on_worker_stats)
+            environment.events.test_stop.add_listener(lambda **kw: self.write_csv())
+
+    def reset(self):
+        self.stats.clear_all()
+        self._users.clear()
+
+    def _expected_interval(self, user_id: int, start_time: float) -> float:
+        """Median time between the user's sends, refreshed every INTERVAL_REFRESH sends."""
+        user = self._users.get(user_id)
+        if user is None:
+            self._users[user_id] = [start_time, defaultdict(int), 0, 0.0]
+            return 0.0
+        interval = (start_time - user[0]) * 1000
+        user[0] = start_time
+        user[1][bucket_response_time(interval)] += 1
+        user[2] += 1
+        if user[2] < INTERVAL_REFRESH or user[2] % INTERVAL_REFRESH == 0:
+            user[3] = histogram_percentiles(user[1], user[2], (0.5,))[0.5]
+        return user[3]
+
+    def on_request(self, request_type, name, response_time, context=None, start_time=None, **kwargs):
+        if response_time is None:
+            return
+        entry = self.stats.get(name, request_type)
+        total = self.stats.total
+        context = context or {}
+        intended = context.get("intended_start")
+        if intended is not None and start_time is not None:
+            # Open model: latency as seen from the scheduled send time
+            corrected = response_time + max(0.0, (start_time - intended) * 1000)
+            _record(entry, corrected)
+            _record(total, corrected)
+            return
+
+        _record(entry, response_time)
+        _record(total, response_time)
+        user_id = context.get("user_id")
+        if user_id is None or start_time is None:
+            return
+        interval = self._expected_interval(user_id, start_time)
+        if interval <= 0 or response_time <= 2 * interval:
+            return
+        missed = response_time - interval
+        for _ in range(MAX_BACKFILL):
+            if missed < interval:
+                break
+            _record(entry, missed)
+            _record(total, missed)
+            missed -= interval
+
+    def _send_to_master(self):
+        entries = [e.serialize() for e in self.stats.entries.values() if e.num_requests]
+        if entries:
+            self.env.runner.send_message(
+                CORRECTED_MESSAGE, {"entries": entries, "total": self.stats.total.serialize()}
+            )
+
+    def on_worker_stats(self, environment, msg, **kwargs):
+        for data in msg.data["entries"]:
+            self.stats.get(data["name"], data["method"]).extend(StatsEntry.unserialize(data, self.stats))
+        self.stats.total.extend(StatsEntry.unserialize(msg.data["total"], self.stats))
+
+    def rows(self) -> List[dict]:
+        """Raw and corrected percentiles per endpoint, plus an "Aggregated" row."""
+        raw_stats = self.env.stats
+        pairs = [
+            (e, raw_stats.entries.get((e.name, e.method)))
+            for e in sorted(self.stats.entries.values(), key=lambda e: (e.name, e.method))
+            if e.num_requests
+        ]
+        pairs.append((self.stats.total, raw_stats.total))
+        rows = []
+        for corrected, raw in pairs:
+            row = {
+                "Type": corrected.method or "",
+                "Name": corrected.name,
+                "Request Count": raw.num_requests if raw is not None else 0,
+                "Corrected Count": corrected.num_requests,
+            }
+            raw_pcts = (
+                histogram_percentiles(raw.response_times, sum(raw.response_times.values()), CSV_PERCENTILES)
+                if raw is not None
+                else dict.fromkeys(CSV_PERCENTILES, 0)
+            )
+            corr_pcts = histogram_percentiles(corrected.response_times, corrected.num_requests, CSV_PERCENTILES)
+            for p in CSV_PERCENTILES:
+                row[f"Raw {p * 100:g}%"] = raw_pcts[p]
+            for p in CSV_PERCENTILES:
+                row[f"Corrected {p * 100:g}%"] = corr_pcts[p]
+            row["Corrected Max"] = round(corrected.max_response_time)
+            rows.append(row)
+        return rows
+
+    def write_csv(self):
+        from .settings import settings
+
+        if not self.stats.total.num_requests or not settings.locust_run_dir:
+            return
+        path = Path(settings.locust_run_dir) / CORRECTED_STATS_FILE
+        try:
+            rows = self.rows()
+            with path.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+                writer.writeheader()
+                writer.writerows(rows)
+        except OSError as e:
+            logger.warning(f"Failed to write {CORRECTED_STATS_FILE}: {e}")
+
+
+def get_corrector(environment) -> Optional[LatencyCorrector]:
+    """The environment's corrector, if coordinated-omission correction is enabled."""
+    return getattr(environment, "latency_corrector", None)
@@ -0,0 +1,136 @@
+"""
+OpenMetrics exporter.
+Serves a /metrics endpoint from the locust process on a gevent WSGI server (no
+extra OS threads). A greenlet renders the exposition text from environment.stats
+every few seconds; scrapes only return the last rendered snapshot, so scrape
+frequency never adds work on the hub. On a master, environment.stats is the
+aggregate of all workers.
+"""
+import logging
+import time
+from typing import List, Optional
+
+import gevent
+from gevent.pywsgi import WSGIServer
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Histogram bucket upper bounds in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _bucket_counts(response_times: dict, bounds_ms: List[float]) -> List[int]:
+    """Cumulative request counts at or below each bound, from a Locust histogram."""
+    counts = [0] * len(bounds_ms)
+    for rt, n in response_times.items():
+        for i, bound in enumerate(bounds_ms):
+            if rt <= bound:
+                counts[i] += n
+                break
+    for i in range(1, len(counts)):
+        counts[i] += counts[i - 1]
+    return counts
+
+
+def render_metrics(environment) -> bytes:
+    """Render environment.stats in the OpenMetrics text format."""
+    stats = environment.stats
+    runner = environment.runner
+    bounds_ms = [b * 1000 for b in DURATION_BUCKETS]
+    entries = [s for s in stats.entries.values() if s.num_requests > 0]
+
+    requests = ["# TYPE locust_requests counter", "# HELP locust_requests Requests sent."]
+    failures = ["# TYPE locust_failures counter", "# HELP locust_failures Failed requests."]
+    durations = [
+        "# TYPE locust_request_duration_seconds histogram",
+        "# UNIT locust_request_duration_seconds seconds",
+        "# HELP locust_request_duration_seconds Response time of requests.",
+    ]
+    for s in entries:
+        labels = f'method="{_label(s.method or "")}",name="{_label(s.name)}"'
+        requests.append(f"locust_requests_total{{{labels}}} {s.num_requests}")
+        failures.append(f"locust_failures_total{{{labels}}} {s.num_failures}")
+        counts = _bucket_counts(s.response_times, bounds_ms)
+        for bound, count in zip(DURATION_BUCKETS, counts):
+            durations.append(f'locust_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+        timed = sum(s.response_times.values())
+        durations.append(f'locust_request_duration_seconds_bucket{{{labels},le="+Inf"}} {timed}')
+        durations.append(f"locust_request_duration_seconds_count{{{labels}}} {timed}")
+        durations.append(f"locust_request_duration_seconds_sum{{{labels}}} {s.total_response_time / 1000:.6f}")
+
+    total = stats.total
+    gauges = [
+        "# TYPE locust_users gauge",
+        f"locust_users {runner.user_count if runner else 0}",
+        "# TYPE locust_current_rps gauge",
+        f"locust_current_rps {total.current_rps:.3f}",
+        "# TYPE locust_current_fail_per_sec gauge",
+        f"locust_current_fail_per_sec {total.current_fail_per_sec:.3f}",
+    ]
+    if runner is not None and hasattr(runner, "worker_count"):
+        gauges += ["# TYPE locust_workers gauge", f"locust_workers {runner.worker_count}"]
+    gauges += [
+        "# TYPE locust_snapshot_timestamp_seconds gauge",
+        f"locust_snapshot_timestamp_seconds {time.time():.3f}",
+    ]
+    return ("\n".join(requests + failures + durations + gauges) + "\n# EOF\n").encode("utf-8")
+
+
+class MetricsExporter:
+    """Serves the latest rendered snapshot on /metrics and refreshes it periodically.
+
+    Args:
+        environment: Locust environment
+        host: Interface to bind
+        port: TCP port to bind
+        refresh_interval: Seconds between snapshot renders
+    """
+
+    def __init__(self, environment, host: str = "0.0.0.0", port: int = 9646, refresh_interval: float = 2.0):
+        self.environment = environment
+        self.host = host
+        self.port = port
+        self.refresh_interval = refresh_interval
+        self._snapshot = b"# EOF\n"
+        self._server: Optional[WSGIServer] = None
+        self._refresher = None
+
+    def refresh(self):
+        try:
+            self._snapshot = render_metrics(self.environment)
+        except Exception as e:
+            logger.error(f"Failed to render metrics: {e}")
+
+    def _refresh_loop(self):
+        while True:
+            self.refresh()
+            gevent.sleep(self.refresh_interval)
+
+    def _app(self, environ, start_response):
+        if environ.get("PATH_INFO") != "/metrics":
+            start_response("404 Not Found", [("Content-Type", "text/plain")])
+            return [b"Not found"]
+        body = self._snapshot
+        start_response("200 OK", [("Content-Type", CONTENT_TYPE), ("Content-Length", str(len(body)))])
+        return [body]
+
+    def start(self) -> "MetricsExporter":
+        self._server = WSGIServer((self.host, self.port), self._app, log=None)
+        self._server.start()
+        self._refresher = gevent.spawn(self._refresh_loop)
+        # Final counters are visible right after the test, not up to one interval later
+        self.environment.events.test_stop.add_listener(lambda **kwargs: self.refresh())
+        logger.info(f"📈 Metrics endpoint: http://{self.host}:{self.port}/metrics")
+        return self
+
+    def stop(self):
+        if self._refresher is not None:
+            self._refresher.kill()
+        if self._server is not None:
+            self._server.stop()
@@ -0,0 +1,82 @@
+"""
+Post-run stages.
+Run by the Run tab once the locust process has exited. Each stage enriches the
+run metadata (saved as metadata.json) or writes derived files into the run
+directory; a failing stage is logged and never fails the run.
+"""
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _change_points_stage(run_dir: Path, meta: Dict[str, Any]) -> None:
+    from .changepoints import analyze_run
+
+    meta["change_points"] = analyze_run(run_dir, meta.get("csv_prefix", "stats"))
+
+
+def _failure_index_stage(run_dir: Path, meta: Dict[str, Any]) -> None:
+    from .failures import write_failure_index
+
+    index = write_failure_index(run_dir, meta.get("csv_prefix", "stats"))
+    meta["failure_fingerprints"] = len(index["fingerprints"])
+
+
+def _arrival_lag_stage(run_dir: Path, meta: Dict[str, Any]) -> None:
+    # Written by locustfiles/utils/arrival.py in open-model runs
+    path = run_dir / "arrival_lag.json"
+    if path.exists():
+        meta["arrival_lag"] = json.loads(path.read_text(encoding="utf-8"))
+
+
+def _warmup_stage(run_dir: Path, meta: Dict[str, Any]) -> None:
+    # Written by app/core/warmup.py when the warm-up ends
+    from .warmup import WARMUP_FILE
+
+    path = run_dir / WARMUP_FILE
+    if path.exists():
+        meta["warmup_window"] = json.loads(path.read_text(encoding="utf-8"))
+
+
+def _slo_stage(run_dir: Path, meta: Dict[str, Any]) -> None:
+    # Written by app/core/slo.py when the test stops
+    from .slo import SLO_VERDICT_FILE
+
+    path = run_dir / SLO_VERDICT_FILE
+    if path.exists():
+        meta["slo"] = json.loads(path.read_text(encoding="utf-8"))
+
+
+POST_RUN_STAGES: List[Tuple[str, Callable[[Path, Dict[str, Any]], None]]] = [
+    ("change_points", _change_points_stage),
+    ("failure_index", _failure_index_stage),
+    ("arrival_lag", _arrival_lag_stage),
+    ("slo", _slo_stage),
+    ("warmup", _warmup_stage),
+]
+
+
+def finalize_run(run_dir: Path, meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Run every post-run stage against a finished run.
+
+    Args:
+        run_dir: Run directory containing the Locust CSV/HTML output
+        meta: Run metadata; updated in place by the stages
+
+    Returns:
+        The updated metadata, including per-stage durations
+    """
+    timings = {}
+    for name, stage in POST_RUN_STAGES:
+        start = time.perf_counter()
+        try:
+            stage(run_dir, meta)
+        except Exception as e:
+            logger.error(f"Post-run stage '{name}' failed for {run_dir}: {e}", exc_info=True)
+        timings[name] = round(time.perf_counter() - start, 3)
+    meta["post_run_timings_s"] = timings
+    return meta
@@ -0,0 +1,62 @@
+"""
+Static report file server.
+Serves the HTML reports under RUNS_DIR read-only, so the Reporting tab can embed
+them through an iframe instead of pushing megabytes through the Streamlit websocket.
+"""
+import logging
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+SERVED_SUFFIXES = {".html"}
+
+
+class _ReportRequestHandler(SimpleHTTPRequestHandler):
+    """GET/HEAD handler that only exposes HTML files and never lists directories."""
+
+    def send_head(self):
+        path = Path(self.translate_path(self.path))
+        if path.is_dir() or path.suffix.lower() not in SERVED_SUFFIXES:
+            self.send_error(404, "Not found")
+            return None
+        return super().send_head()
+
+    def end_headers(self):
+        # Reports are immutable once a run finishes; let the browser cache them.
+        self.send_header("Cache-Control", "private, max-age=300")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        logger.debug("report-server: " + format, *args)
+
+
+def start_report_server(root: Path, host: str, port: int) -> ThreadingHTTPServer:
+    """Start a daemon HTTP server serving HTML files under root.
+
+    Args:
+        root: Directory to serve (normally RUNS_DIR)
+        host: Interface to bind
+        port: TCP port to bind
+
+    Returns:
+        The running server instance
+    """
+    handler = partial(_ReportRequestHandler, directory=str(root))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, name="report-server", daemon=True
+    )
+    thread.start()
+    logger.info(f"Report server listening on {host}:{port} (root={root})")
+    return server
+
+
+def report_url(base_url: str, run_dir: Path, root: Path, filename: str = "report.html") -> str:
+    """Build the browser-facing URL of a run's report file."""
+    rel = (run_dir / filename).relative_to(root).as_posix()
+    return f"{base_url.rstrip('/')}/{quote(rel)}"
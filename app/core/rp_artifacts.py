@@ -0,0 +1,179 @@
+"""
+ReportPortal artifact upload.
+Attaches the files of a finished run (CSVs, HTML report, logs) to its RP launch.
+Each file is gzip-compressed while it is streamed into the multipart request, so
+neither the raw nor the compressed file is ever held in memory. Uploads run on a
+small background pool and are retried with backoff, so the UI (and the next test)
+never waits for them.
+"""
+import json
+import logging
+import time
+import uuid
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+from reportportal_client.helpers import timestamp
+
+logger = logging.getLogger(__name__)
+
+LAUNCH_REF_FILE = "rp_launch.json"
+UPLOAD_STATUS_FILE = "rp_upload.json"
+ARTIFACT_PATTERNS = ["*.csv", "*.html", "*.log", "*.jsonl", "failure_index.json", "metadata.json"]
+
+_CHUNK_SIZE = 256 * 1024
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def write_launch_ref(
+    run_dir: Path, endpoint: str, project: str, launch_uuid: str, item_uuid: Optional[str]
+) -> None:
+    """Record where the run was reported, so artifacts can be attached after the run.
+
+    The API token is deliberately not written; the uploader takes it from settings.
+    """
+    ref = {
+        "endpoint": endpoint,
+        "project": project,
+        "launch_uuid": launch_uuid,
+        "item_uuid": item_uuid,
+    }
+    (Path(run_dir) / LAUNCH_REF_FILE).write_text(json.dumps(ref, indent=2), encoding="utf-8")
+
+
+def load_launch_ref(run_dir: Path) -> Optional[Dict[str, Any]]:
+    path = Path(run_dir) / LAUNCH_REF_FILE
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def collect_artifacts(run_dir: Path) -> List[Path]:
+    files = set()
+    for pattern in ARTIFACT_PATTERNS:
+        files.update(p for p in Path(run_dir).glob(pattern) if p.is_file())
+    return sorted(files)
+
+
+def _gzip_chunks(path: Path) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    with path.open("rb") as fh:
+        while True:
+            chunk = fh.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            out = compressor.compress(chunk)
+            if out:
+                yield out
+    yield compressor.flush()
+
+
+def _multipart_body(boundary: str, log_entry: Dict[str, Any], path: Path, filename: str) -> Iterator[bytes]:
+    """RP v2 log request: a JSON part describing the log entry plus the file part."""
+    yield (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="json_request_part"\r\n'
+        "Content-Type: application/json\r\n\r\n"
+    ).encode()
+    yield json.dumps([log_entry]).encode()
+    yield (
+        f"\r\n--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        "Content-Type: application/gzip\r\n\r\n"
+    ).encode()
+    yield from _gzip_chunks(path)
+    yield f"\r\n--{boundary}--\r\n".encode()
+
+
+def upload_artifact(
+    session: requests.Session,
+    ref: Dict[str, Any],
+    token: str,
+    path: Path,
+    retries: int = 3,
+    backoff: float = 2.0,
+    timeout: float = 60.0,
+) -> Dict[str, Any]:
+    """Upload one file as a gzip attachment of the launch's test item.
+
+    Returns:
+        Dict with file, size_bytes, status ("uploaded"/"failed"), attempts and error
+    """
+    filename = f"{path.name}.gz"
+    url = f"{ref['endpoint'].rstrip('/')}/api/v2/{ref['project']}/log"
+    result = {"file": path.name, "size_bytes": path.stat().st_size, "status": "failed", "attempts": 0, "error": None}
+    for attempt in range(1, retries + 1):
+        result["attempts"] = attempt
+        boundary = uuid.uuid4().hex
+        log_entry = {
+            "launchUuid": ref["launch_uuid"],
+            "itemUuid": ref.get("item_uuid"),
+            "time": timestamp(),
+            "message": f"📎 Artifact: {path.name} ({result['size_bytes'] / 1024:.0f} KB, gzip)",
+            "level": "INFO",
+            "file": {"name": filename},
+        }
+        try:
+            # A generator body is sent with chunked transfer encoding; the file is
+            # re-read from disk on every attempt
+            resp = session.post(
+                url,
+                data=_multipart_body(boundary, log_entry, path, filename),
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": f"multipart/form-data; boundary={boundary}",
+                },
+                timeout=timeout,
+            )
+            if resp.status_code < 300:
+                result["status"] = "uploaded"
+                result["error"] = None
+                return result
+            result["error"] = f"HTTP {resp.status_code}: {resp.text[:200]}"
+            if 400 <= resp.status_code < 500 and resp.status_code != 429:
+                break  # client errors will not succeed on retry
+        except requests.RequestException as e:
+            result["error"] = str(e)
+        if attempt < retries:
+            time.sleep(backoff * 2 ** (attempt - 1))
+    return result
+
+
+def upload_run_artifacts(run_dir: Path, token: str, retries: int = 3) -> Dict[str, Any]:
+    """Upload every artifact of a run and write the outcome to rp_upload.json."""
+    run_dir = Path(run_dir)
+    ref = load_launch_ref(run_dir)
+    if not ref or not ref.get("launch_uuid"):
+        return {"status": "skipped", "reason": f"no {LAUNCH_REF_FILE}"}
+    started = time.perf_counter()
+    with requests.Session() as session:
+        files = [upload_artifact(session, ref, token, p, retries=retries) for p in collect_artifacts(run_dir)]
+    failed = [f for f in files if f["status"] != "uploaded"]
+    status = {
+        "status": "failed" if failed else "uploaded",
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+        "duration_s": round(time.perf_counter() - started, 3),
+        "files": files,
+    }
+    (run_dir / UPLOAD_STATUS_FILE).write_text(json.dumps(status, indent=2), encoding="utf-8")
+    if failed:
+        logger.warning(f"RP artifact upload: {len(failed)}/{len(files)} files failed for {run_dir}")
+    else:
+        logger.info(f"RP artifact upload: {len(files)} files uploaded for {run_dir}")
+    return status
+
+
+def schedule_artifact_upload(run_dir: Path, token: str, retries: int = 3, workers: int = 2) -> Future:
+    """Queue the upload of a run's artifacts on the background pool and return immediately."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rp-upload")
+    return _executor.submit(upload_run_artifacts, Path(run_dir), token, retries)
@@ -1,13 +1,32 @@
+import json
 import logging
 
 from datetime import datetime
+from pathlib import Path
 from reportportal_client import RPClient
 from reportportal_client.helpers import timestamp
 import gevent
 import re
+from locust.runners import MasterRunner, WorkerRunner
+
+from app.core.error_aggregator import ErrorAggregator
+from app.core.latency_correction import get_corrector
+from app.core.rp_artifacts import write_launch_ref
+from app.core.rp_shipper import RPLogShipper
+from app.core.slo import format_check, slo_verdict
+from app.core.stats_summary import (
+    INTERVAL_STATS_FILE,
+    REPORT_PERCENTILES,
+    summarize_stats,
+    take_snapshot,
+    window_summary,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
+
+# Custom locust message carrying ErrorAggregator deltas from workers to master
+WORKER_ERRORS_MESSAGE = "rp_errors"
 # DETAILED_LOG removed, using settings.rp_detailed_log
 
 
@@ -18,12 +37,14 @@ class ReportPortalListener:
         self.launch_uuid = None
         self.test_item_uuid = None
         self.running = False
-        self.last_stats = {}
         self.start_time = None
+        self.shipper = None
+        self.last_snapshot = None
 
         # Load typed settings
         from app.core.settings import settings
         self.settings = settings
+        self.errors = ErrorAggregator(max_entries=settings.rp_error_cap)
 
         self.rp_endpoint = settings.rp_endpoint
         self.rp_project = settings.rp_project
@@ -39,6 +60,17 @@ class ReportPortalListener:
             logger.warning("ReportPortal config missing or incomplete. Listener disabled.")
             return
 
+        if isinstance(env.runner, WorkerRunner):
+            # Workers only pre-aggregate failures and forward them; the master
+            # owns the launch, the logs and the summary
+            self.env.events.test_start.add_listener(self.on_worker_test_start)
+            self.env.events.test_stop.add_listener(self.on_worker_test_stop)
+            self.env.events.request.add_listener(self.on_request)
+            logger.info("✅ Worker mode: forwarding error fingerprints to master")
+            return
+        if isinstance(env.runner, MasterRunner):
+            env.runner.register_message(WORKER_ERRORS_MESSAGE, self.on_worker_errors)
+
         self.env.events.test_start.add_listener(self.on_test_start)
         self.env.events.test_stop.add_listener(self.on_test_stop)
         self.env.events.request.add_listener(self.on_request)
@@ -50,8 +82,46 @@ class ReportPortalListener:
 
         return re.sub(pattern, "", name)
 
+    def on_worker_test_start(self, **kwargs):
+        self.errors = ErrorAggregator(max_entries=self.settings.rp_error_cap)
+        self.running = True
+        gevent.spawn(self._forward_errors_loop)
+
+    def on_worker_test_stop(self, **kwargs):
+        self.running = False
+        # Sent before the worker reports "client_stopped", so the master has
+        # every delta before its own test_stop fires
+        self._forward_errors()
+
+    def _forward_errors_loop(self):
+        while self.running:
+            gevent.sleep(self.settings.rp_worker_report_interval)
+            if self.running:
+                self._forward_errors()
+
+    def _forward_errors(self):
+        delta = self.errors.take_delta()
+        if not delta["entries"] and not delta["total"]:
+            return
+        try:
+            self.env.runner.send_message(WORKER_ERRORS_MESSAGE, delta)
+        except Exception as e:
+            logger.error(f"Failed to forward errors to master: {e}")
+
+    def on_worker_errors(self, environment, msg, **kwargs):
+        """Master: merge a worker's error delta and log fingerprints seen for the first time."""
+        for err in self.errors.merge(msg.data):
+            if self.shipper and self.test_item_uuid:
+                self.shipper.submit(
+                    f"❌ First Failure: {err['request_type']} {err['name']} (worker {msg.node_id})\n"
+                    f"Error: {err['sample']}",
+                    level="ERROR",
+                    item_id=self.test_item_uuid,
+                )
+
     def on_test_start(self, **kwargs):
         logger.info("🚀 Test starting, initializing ReportPortal...")
+        self.errors = ErrorAggregator(max_entries=self.settings.rp_error_cap)
         try:
             # Get host info from settings or locust env
             effective_host = self.settings.rp_test_host or self.env.host or "Unknown"
@@ -88,18 +158,41 @@ class ReportPortalListener:
             )
             logger.info(f"✅ Test item started: {self.test_item_uuid}")
 
+            # Lets the runner attach the run artifacts to this launch afterwards
+            if self.settings.locust_run_dir:
+                try:
+                    write_launch_ref(
+                        self.settings.locust_run_dir,
+                        self.rp_endpoint,
+                        self.rp_project,
+                        self.launch_uuid,
+                        self.test_item_uuid,
+                    )
+                except OSError as e:
+                    logger.warning(f"Failed to write launch reference: {e}")
+
             # Save start time
             self.start_time = datetime.now()
 
+            # All logs from here on go through the shipper's native thread
+            self.shipper = RPLogShipper(
+                self.rp_client,
+                max_queue=self.settings.rp_queue_size,
+                batch_size=self.settings.rp_batch_size,
+                flush_interval=self.settings.rp_flush_interval,
+            )
+            self.shipper.start()
+
             # Log test start with detailed info
-            self.rp_client.log(
-                time=timestamp(),
-                message=f"🚀 Load Test Started\n{'=' * 50}\nLocustfile: {locustfile}\nHost: {effective_host}\nHost Source: {host_source}\nLaunch: {self.rp_launch_name}\n{'=' * 50}",
+            self.shipper.submit(
+                f"🚀 Load Test Started\n{'=' * 50}\nLocustfile: {locustfile}\nHost: {effective_host}\nHost Source: {host_source}\nLaunch: {self.rp_launch_name}\n{'=' * 50}",
                 level="INFO",
                 item_id=self.test_item_uuid,
+                critical=True,
             )
 
             # Start periodic stats logging
+            self.last_snapshot = take_snapshot(self.env.stats)
             self.running = True
             gevent.spawn(self._periodic_stats_logger)
 
@@ -107,48 +200,77 @@ class ReportPortalListener:
             logger.error(f"❌ Failed to start ReportPortal: {e}", exc_info=True)
             
     def _periodic_stats_logger(self):
-        """Log endpoint stats every 30 seconds"""
+        """Log the stats of each interval (RP_STATS_INTERVAL seconds, 0 = off)"""
+        interval = self.settings.rp_stats_interval
+        if interval <= 0:
+            return
         while self.running:
-            gevent.sleep(30)
-            if self.running and self.rp_client and self.test_item_uuid:
+            gevent.sleep(interval)
+            if self.running and self.shipper and self.test_item_uuid:
                 try:
-                    # Endpoint bazlı özet
-                    lines = ["📊 Endpoint Statistics"]
-                    lines.append("=" * 80)
-                    lines.append(
-                        f"{'Method':<8} {'Name':<40} {'Reqs':<8} {'Fails':<8} {'Avg(ms)':<10} {'RPS':<8}"
-                    )
-                    lines.append("-" * 80)
-
-                    for stat in self.env.stats.entries.values():
-                        if stat.num_requests > 0:
-                            lines.append(
-                                f"{stat.method:<8} {stat.name[:40]:<40} "
-                                f"{stat.num_requests:<8} {stat.num_failures:<8} "
-                                f"{stat.avg_response_time:<10.0f} {stat.current_rps:<8.1f}"
-                            )
-
-                    # Total
-                    total = self.env.stats.total
-                    lines.append("-" * 80)
-                    lines.append(
-                        f"{'TOTAL':<8} {'':<40} "
-                        f"{total.num_requests:<8} {total.num_failures:<8} "
-                        f"{total.avg_response_time:<10.0f} {total.total_rps:<8.1f}"
-                    )
-                    lines.append("=" * 80)
-
-                    self.rp_client.log(
-                        time=timestamp(),
-                        message="\n".join(lines),
+                    window = self._record_interval()
+                    self.shipper.submit(
+                        self._format_interval(window),
                         level="INFO",
                         item_id=self.test_item_uuid,
                     )
                 except Exception as e:
                     logger.error(f"Failed to log periodic stats: {e}")
 
+    def _record_interval(self):
+        """Close the current interval: diff against the previous snapshot and persist it."""
+        snapshot = take_snapshot(self.env.stats)
+        window = window_summary(self.last_snapshot, snapshot)
+        self.last_snapshot = snapshot
+        run_dir = self.settings.locust_run_dir
+        if run_dir:
+            try:
+                with open(Path(run_dir) / INTERVAL_STATS_FILE, "a", encoding="utf-8") as fh:
+                    fh.write(json.dumps(window.as_dict()) + "\n")
+            except OSError as e:
+                logger.warning(f"Failed to write interval stats: {e}")
+        return window
+
+    def _format_interval(self, window):
+        start = datetime.fromtimestamp(window.ended_at - window.duration_s)
+        end = datetime.fromtimestamp(window.ended_at)
+        pct_headers = "".join(f"{'p' + format(p * 100, 'g'):<8}" for p in window.percentiles)
+
+        lines = [
+            f"📊 Interval Statistics ({start:%H:%M:%S} - {end:%H:%M:%S}, {window.duration_s:.0f}s)"
+        ]
+        lines.append("=" * 100)
+        lines.append(
+            f"{'Method':<8} {'Name':<40} {'Reqs':<8} {'Fails':<8} {'RPS':<8} {pct_headers}"
+        )
+        lines.append("-" * 100)
+
+        def row(method, name, entry):
+            pcts = "".join(f"{entry.percentile(p):<8}" for p in window.percentiles)
+            return (
+                f"{method:<8} {name[:40]:<40} {entry.num_requests:<8} "
+                f"{entry.num_failures:<8} {entry.rps:<8.1f} {pcts}"
+            )
 
+        top_n = self.settings.rp_stats_top_n
+        for entry in window.entries[:top_n]:
+            lines.append(row(entry.method, self.clean_http_name(entry.name), entry))
+        rest = window.entries[top_n:]
+        if rest:
+            lines.append(
+                f"... {len(rest)} more endpoints, "
+                f"{sum(e.num_requests for e in rest)} requests, "
+                f"{sum(e.num_failures for e in rest)} failures"
+            )
 
+        lines.append("-" * 100)
+        lines.append(row("TOTAL", "", window.total))
+        lines.append("=" * 100)
+        m = self.shipper.metrics()
+        lines.append(
+            f"RP log queue: depth={m['queue_depth']} sent={m['sent']} dropped={m['dropped']}"
+        )
+        return "\n".join(lines)
 
     def on_request(
         self,
@@ -171,35 +293,20 @@ class ReportPortalListener:
             )
 
         if has_exception or has_manual_failure:
-            error_key = f"{request_type}:{name}"
-
-            # İlk kez görülen hata mı?
-            if error_key not in self.last_stats:
-                self.last_stats[error_key] = {"count": 0, "logged": False}
-
-            self.last_stats[error_key]["count"] += 1
-
-            # İlk hatayı logla
-            if (
-                not self.last_stats[error_key]["logged"]
-                and self.rp_client
-                and self.test_item_uuid
-            ):
+            if has_exception:
+                error_msg = str(exception)
+            else:
+                error_msg = getattr(response, "_manual_result_msg", "Manual failure")
+
+            # İlk kez görülen hata (fingerprint) mı? İlk hatayı logla
+            is_new = self.errors.add(request_type, name, error_msg)
+            if is_new and self.shipper and self.test_item_uuid:
                 try:
-                    if has_exception:
-                        error_msg = str(exception)
-                    else:
-                        error_msg = getattr(
-                            response, "_manual_result_msg", "Manual failure"
-                        )
-
-                    self.rp_client.log(
-                        time=timestamp(),
-                        message=f"❌ First Failure: {request_type} {name}\nError: {error_msg}",
+                    self.shipper.submit(
+                        f"❌ First Failure: {request_type} {name}\nError: {error_msg}",
                         level="ERROR",
                         item_id=self.test_item_uuid,
                     )
-                    self.last_stats[error_key]["logged"] = True
                 except Exception as e:
                     logger.error(f"Failed to log failure: {e}")
 
@@ -211,7 +318,10 @@ class ReportPortalListener:
             return
 
         try:
-            total = self.env.stats.total
+            # Persist the last, partial interval (the summary below covers RP)
+            if self.last_snapshot is not None:
+                self._record_interval()
+
             end_time = datetime.now()
             duration = (
                 (end_time - self.start_time).total_seconds() if self.start_time else 0
@@ -228,8 +338,20 @@ class ReportPortalListener:
             )
             lines.append(f"**Target Host:** {effective_host}")
             lines.append(f"**Script:** {locustfile}")
+            warmup = getattr(self.env, "warmup", None)
+            if warmup is not None and warmup.summary:
+                lines.append(
+                    f"**Warm-up (excluded):** {warmup.summary['duration_s']:.0f}s, "
+                    f"{warmup.summary['requests']} requests ({warmup.summary['reason']})"
+                )
             lines.append("")
 
+            # One pass over each histogram for every column below
+            summary = summarize_stats(
+                self.env.stats, REPORT_PERCENTILES, duration_s=duration
+            )
+            agg = summary.total
+
             # Request Statistics Table
             lines.append("### Request Statistics")
             lines.append("")
@@ -240,143 +362,143 @@ class ReportPortalListener:
                 "|------|------|--------|---------|---------|---------|---------|-----|--------|"
             )
 
-            for stat in self.env.stats.entries.values():
-                if stat.num_requests > 0:
-                    fail_per_sec = stat.num_failures / duration if duration > 0 else 0
-                    sort_name = self.clean_http_name(stat.name)
-                    lines.append(
-                        f"| {stat.method} | {sort_name} | "
-                        f"{stat.num_requests} | {stat.num_failures} | "
-                        f"{stat.avg_response_time:.2f} | {stat.min_response_time or 0:.0f} | "
-                        f"{stat.max_response_time:.0f} | {stat.total_rps:.2f} | {fail_per_sec:.2f} |"
-                    )
+            for entry in summary.entries:
+                lines.append(
+                    f"| {entry.method} | {self.clean_http_name(entry.name)} | "
+                    f"{entry.num_requests} | {entry.num_failures} | "
+                    f"{entry.avg_ms:.2f} | {entry.min_ms:.0f} | "
+                    f"{entry.max_ms:.0f} | {entry.rps:.2f} | {entry.fail_per_s:.2f} |"
+                )
 
             # Aggregated
-            total_fail_per_sec = total.num_failures / duration if duration > 0 else 0
             lines.append(
                 f"| **Aggregated** | | "
-                f"**{total.num_requests}** | **{total.num_failures}** | "
-                f"**{total.avg_response_time:.2f}** | **{total.min_response_time or 0:.0f}** | "
-                f"**{total.max_response_time:.0f}** | **{total.total_rps:.2f}** | **{total_fail_per_sec:.2f}** |"
+                f"**{agg.num_requests}** | **{agg.num_failures}** | "
+                f"**{agg.avg_ms:.2f}** | **{agg.min_ms:.0f}** | "
+                f"**{agg.max_ms:.0f}** | **{agg.rps:.2f}** | **{agg.fail_per_s:.2f}** |"
             )
             lines.append("")
 
             # Response Time Percentiles Table
+            pct_headers = " | ".join(f"{p * 100:g}%" for p in summary.percentiles)
             lines.append("### Response Time Statistics")
             lines.append("")
+            lines.append(f"| Method | Name | {pct_headers} | 100% |")
             lines.append(
-                "| Method | Name | 50% | 60% | 70% | 80% | 90% | 95% | 99% | 100% |"
-            )
-            lines.append(
-                "|--------|------|-----|-----|-----|-----|-----|-----|-----|------|"
+                "|--------|------|" + "-----|" * len(summary.percentiles) + "------|"
             )
 
-            for stat in self.env.stats.entries.values():
-                if stat.num_requests > 0:
-                    name_short = self.clean_http_name(stat.name)
-
-                    lines.append(
-                        f"| {stat.method} | {name_short} | "
-                        f"{stat.get_response_time_percentile(0.50) or 0:.0f} | "
-                        f"{stat.get_response_time_percentile(0.60) or 0:.0f} | "
-                        f"{stat.get_response_time_percentile(0.70) or 0:.0f} | "
-                        f"{stat.get_response_time_percentile(0.80) or 0:.0f} | "
-                        f"{stat.get_response_time_percentile(0.90) or 0:.0f} | "
-                        f"{stat.get_response_time_percentile(0.95) or 0:.0f} | "
-                        f"{stat.get_response_time_percentile(0.99) or 0:.0f} | "
-                        f"{stat.max_response_time or 0:.0f} |"
-                    )
+            for entry in summary.entries:
+                pcts = " | ".join(f"{entry.percentile(p):.0f}" for p in summary.percentiles)
+                lines.append(
+                    f"| {entry.method} | {self.clean_http_name(entry.name)} | "
+                    f"{pcts} | {entry.max_ms:.0f} |"
+                )
 
             # Aggregated percentiles
-            lines.append(
-                f"| **Aggregated** | | "
-                f"**{total.get_response_time_percentile(0.50) or 0:.0f}** | "
-                f"**{total.get_response_time_percentile(0.60) or 0:.0f}** | "
-                f"**{total.get_response_time_percentile(0.70) or 0:.0f}** | "
-                f"**{total.get_response_time_percentile(0.80) or 0:.0f}** | "
-                f"**{total.get_response_time_percentile(0.90) or 0:.0f}** | "
-                f"**{total.get_response_time_percentile(0.95) or 0:.0f}** | "
-                f"**{total.get_response_time_percentile(0.99) or 0:.0f}** | "
-                f"**{total.max_response_time or 0:.0f}** |"
-            )
+            pcts = " | ".join(f"**{agg.percentile(p):.0f}**" for p in summary.percentiles)
+            lines.append(f"| **Aggregated** | | {pcts} | **{agg.max_ms:.0f}** |")
             lines.append("")
+
+            # Raw vs coordinated-omission-corrected tail latency
+            corrector = get_corrector(self.env)
+            if corrector is not None and corrector.stats.total.num_requests:
+                lines.append("### Corrected for Coordinated Omission")
+                lines.append("")
+                lines.append("| Method | Name | p95 raw | p95 corrected | p99 raw | p99 corrected |")
+                lines.append("|--------|------|---------|---------------|---------|---------------|")
+                for row in corrector.rows():
+                    name = row["Name"] if row["Type"] else "**Aggregated**"
+                    lines.append(
+                        f"| {row['Type']} | {self.clean_http_name(name)} | "
+                        f"{row['Raw 95%']:.0f} | {row['Corrected 95%']:.0f} | "
+                        f"{row['Raw 99%']:.0f} | {row['Corrected 99%']:.0f} |"
+                    )
+                lines.append("")
             lines.append("=" * 80)
-            lines.append(f"**Success Rate:** {(1 - total.fail_ratio) * 100:.1f}%")
+            lines.append(f"**Success Rate:** {(1 - agg.fail_ratio) * 100:.1f}%")
 
-            # Error summary
-            if self.last_stats:
+            # Error summary (top fingerprints)
+            if self.errors:
                 lines.append("")
                 lines.append("### ❌ Error Summary")
-                for key, data in self.last_stats.items():
-                    lines.append(f"- **{key}:** {data['count']} failures")
+                lines.append(
+                    f"{self.errors.total} failures, {len(self.errors)} distinct fingerprints tracked"
+                )
+                for err in self.errors.top(self.settings.rp_error_top_n):
+                    sample = err["sample"].replace("\n", " ")[:200]
+                    lines.append(
+                        f"- **{err['request_type']} {self.clean_http_name(err['name'])}:** "
+                        f"{err['count']} failures — `{sample}`"
+                    )
+                if self.errors.evicted:
+                    lines.append(
+                        f"- _{self.errors.evicted} least recently seen fingerprints ({self.errors.evicted_occurrences} "
+                        f"failures) evicted from the {self.errors.max_entries}-entry cap_"
+                    )
 
             # Detailed report similar to log_test_summary
             lines.append("")
             lines.append("=" * 80)
             lines.append("### 📊 Detailed Performance Report")
             lines.append("")
-            lines.append(f"**Total Requests:** {total.num_requests}")
-            lines.append(f"**Average Response Time:** {total.avg_response_time:.2f} ms")
-            lines.append(f"**Max Response Time:** {total.max_response_time:.2f} ms")
-            lines.append(f"**Failed Request Ratio:** {total.fail_ratio:.2%}")
-            lines.append(f"**Requests Per Second (RPS):** {total.total_rps:.2f}")
+            lines.append(f"**Total Requests:** {agg.num_requests}")
+            lines.append(f"**Average Response Time:** {agg.avg_ms:.2f} ms")
+            lines.append(f"**Max Response Time:** {agg.max_ms:.2f} ms")
+            lines.append(f"**Failed Request Ratio:** {agg.fail_ratio:.2%}")
+            lines.append(f"**Requests Per Second (RPS):** {agg.rps:.2f}")
             lines.append("")
 
 
             if self.settings.rp_detailed_log:
                 # Detailed by endpoint
                 lines.append("**Endpoint Performance:**")
-                for stat in self.env.stats.entries.values():
-                    if stat.num_requests > 0:
-                        lines.append("")
+                for entry in summary.entries:
+                    lines.append("")
                     lines.append(
-                        f"- **Endpoint:** {stat.method} {self.clean_http_name(stat.name)}"
+                        f"- **Endpoint:** {entry.method} {self.clean_http_name(entry.name)}"
                     )
-                    lines.append(f"  - Total Requests: {stat.num_requests}")
-                    lines.append(f"  - Failed Requests: {stat.num_failures}")
+                    lines.append(f"  - Total Requests: {entry.num_requests}")
+                    lines.append(f"  - Failed Requests: {entry.num_failures}")
+                    lines.append(f"  - Avg Response Time: {entry.avg_ms:.2f} ms")
+                    lines.append(f"  - Min Response Time: {entry.min_ms:.2f} ms")
+                    lines.append(f"  - Max Response Time: {entry.max_ms:.2f} ms")
                     lines.append(
-                        f"  - Avg Response Time: {stat.avg_response_time:.2f} ms"
-                    )
-                    lines.append(
-                        f"  - Min Response Time: {stat.min_response_time:.2f} ms"
-                    )
-                    lines.append(
-                        f"  - Max Response Time: {stat.max_response_time:.2f} ms"
-                    )
-                    lines.append(
-                        f"  - Avg Response Size: {stat.avg_content_length:.2f} bytes"
+                        f"  - Avg Response Size: {entry.avg_content_length:.2f} bytes"
                     )
 
-            # Performance uyarıları
+            # SLO verdict (the same one behind the console summary and the exit code)
+            verdict = slo_verdict(self.env)
             lines.append("")
-            lines.append("**Performance Warnings:**")
-            has_issue = False
-            if total.avg_response_time > 200:
-                lines.append(
-                    f"⚠️  Average response time exceeds 200ms! (Actual: {total.avg_response_time:.2f} ms)"
-                )
-                has_issue = True
-            if total.fail_ratio > 0.05:
+            lines.append(f"**SLO Verdict:** {verdict['status']} ({verdict['source']})")
+            if verdict["aborted"]:
+                lines.append(f"⛔ Run stopped early: {verdict['abort_reason']}")
+            for check in verdict["checks"]:
+                mark = "✅" if check["passed"] else "⚠️ "
+                lines.append(f"{mark} {format_check(check)}")
+            if verdict["live_breaches"]:
+                lines.append(f"{verdict['live_breaches']} breaching windows during the run")
+
+            if self.shipper:
+                # Taken before this summary is queued and the queue drained; stop()
+                # logs the final counts
+                m = self.shipper.metrics()
+                lines.append("")
                 lines.append(
-                    f"⚠️  Failed request ratio exceeds 5%! (Actual: {total.fail_ratio:.2%})"
+                    f"**RP Log Shipping (before final flush):** {m['sent']} sent, {m['dropped']} dropped, "
+                    f"{m['failed']} failed, peak queue {m['high_watermark']}"
                 )
-                has_issue = True
-            if not has_issue:
-                lines.append(
-                    "✅ No performance issues detected. Failed request ratio is below 5%."
+                self.shipper.submit(
+                    "\n".join(lines),
+                    level="INFO",
+                    item_id=self.test_item_uuid,
+                    critical=True,
                 )
-
-            self.rp_client.log(
-                time=timestamp(),
-                message="\n".join(lines),
-                level="INFO",
-                item_id=self.test_item_uuid,
-            )
+                # Drain everything before the item and launch are finished
+                self.shipper.stop(timeout=self.settings.rp_flush_timeout)
             logger.info("✅ Summary logged")
 
-            # Success rate threshold: 75%
-            success_rate = (1 - total.fail_ratio) * 100
-            status = "PASSED" if success_rate >= 75 else "FAILED"
+            status = verdict["status"]
 
             self.rp_client.finish_test_item(
                 item_id=self.test_item_uuid, end_time=timestamp(), status=status
@@ -0,0 +1,132 @@
+"""
+Asynchronous ReportPortal log shipping.
+Keeps RPClient I/O off the gevent hub: listeners only append to a bounded queue,
+and a native OS thread drains it into the RP client in batches.
+"""
+import logging
+from collections import deque
+from typing import Any, Dict, Optional
+
+from gevent import monkey
+from gevent.threadpool import ThreadPool
+from reportportal_client.helpers import timestamp
+
+logger = logging.getLogger(__name__)
+
+# Under locust time.sleep is gevent's; the drain thread needs the blocking original
+_native_sleep = monkey.get_original("time", "sleep")
+
+
+class RPLogShipper:
+    """Bounded, batched queue in front of RPClient.log.
+
+    submit() is safe to call from request hooks: it never blocks and never does
+    I/O. When the queue is full (RP slower than the test produces messages) new
+    messages are dropped and counted instead of stalling the load generator.
+    """
+
+    def __init__(
+        self,
+        rp_client,
+        max_queue: int = 10000,
+        batch_size: int = 50,
+        flush_interval: float = 0.5,
+    ):
+        self.rp_client = rp_client
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        # deque.append/popleft are atomic, so producer greenlets and the drain
+        # thread need no lock
+        self._queue: deque = deque()
+        self._pool: Optional[ThreadPool] = None
+        self._result = None
+        self._stopping = False
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.sent = 0
+        self.failed = 0
+        self.high_watermark = 0
+
+    def submit(
+        self,
+        message: str,
+        level: str = "INFO",
+        item_id: Optional[str] = None,
+        attachment: Optional[dict] = None,
+        critical: bool = False,
+    ) -> bool:
+        """Queue a log message; returns False if it was dropped.
+
+        Args:
+            message: Log text
+            level: RP log level
+            item_id: Test item the log belongs to (launch-level if None)
+            attachment: Optional RP attachment dict (name, data, mime)
+            critical: Bypass the size cap (start/summary messages)
+        """
+        if not critical and len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return False
+        self._queue.append((timestamp(), message, level, item_id, attachment))
+        self.enqueued += 1
+        return True
+
+    def start(self):
+        self._stopping = False
+        self._pool = ThreadPool(1)
+        self._result = self._pool.spawn(self._drain)
+
+    def stop(self, timeout: float = 30.0):
+        """Flush what is queued (up to timeout seconds) and stop the drain thread."""
+        self._stopping = True
+        if self._result is not None:
+            try:
+                self._result.get(timeout=timeout)
+            except Exception as e:
+                logger.warning(f"RP log shipper did not drain in {timeout}s: {e}")
+        if self._pool is not None:
+            self._pool.kill()
+        leftover = len(self._queue)
+        if leftover:
+            self.dropped += leftover
+            self._queue.clear()
+        logger.info(f"RP log shipper stopped: {self.metrics()}")
+
+    def _drain(self):
+        queue = self._queue
+        while True:
+            batch = []
+            while queue and len(batch) < self.batch_size:
+                batch.append(queue.popleft())
+            if not batch:
+                if self._stopping:
+                    return
+                _native_sleep(self.flush_interval)
+                continue
+            self.high_watermark = max(self.high_watermark, len(queue) + len(batch))
+            for time, message, level, item_id, attachment in batch:
+                try:
+                    self.rp_client.log(
+                        time=time,
+                        message=message,
+                        level=level,
+                        item_id=item_id,
+                        attachment=attachment,
+                    )
+                    self.sent += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.debug(f"RP log failed: {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": len(self._queue),
+            "high_watermark": self.high_watermark,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+        }
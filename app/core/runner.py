@@ -126,6 +126,12 @@ def run_locust(
     csv_flush_interval: Optional[int] = None,
     stream_logs: bool = True,
     enable_rp: bool = False,
+    target_rps: Optional[float] = None,
+    co_correction: bool = False,
+    phase_timings: bool = False,
+    connection_profile: Optional[str] = None,
+    slo_file: Optional[Path] = None,
+    warmup: Optional[str] = None,
 ) -> Tuple[subprocess.Popen, Path, Path, str, List[str]]:
     
     run_dir.mkdir(parents=True, exist_ok=True)
@@ -168,6 +174,31 @@ def run_locust(
         if p and p not in existing.split(os.pathsep):
             existing = (existing + (os.pathsep if existing else "")) + p
     env["PYTHONPATH"] = existing
+    # Lets in-process listeners write their own files next to the CSVs
+    env["LOCUST_RUN_DIR"] = str(run_dir.resolve())
+    # Open model: BaseLocustUser paces all users on one arrival timeline
+    if target_rps:
+        env["LOCUST_TARGET_RPS"] = str(float(target_rps))
+    else:
+        env.pop("LOCUST_TARGET_RPS", None)
+    if co_correction:
+        env["LOCUST_CO_CORRECTION"] = "true"
+    else:
+        env.pop("LOCUST_CO_CORRECTION", None)
+    if phase_timings:
+        env["LOCUST_PHASE_TIMINGS"] = "true"
+    else:
+        env.pop("LOCUST_PHASE_TIMINGS", None)
+    if connection_profile:
+        env["LOCUST_CONNECTION_PROFILE"] = connection_profile
+    # Warm-up ("rampup" or a time span) is recorded separately, then stats are reset
+    if warmup:
+        env["LOCUST_WARMUP"] = warmup
+    else:
+        env.pop("LOCUST_WARMUP", None)
+    # SLOs for the live evaluation, early abort and the run's verdict
+    if slo_file:
+        env["LOCUST_SLO_FILE"] = str(Path(slo_file).resolve())
 
     # Set dynamic RP env vars if generic user flow
     # RP vars are set in app.py logic before calling this, but env is copied here.
@@ -15,10 +15,28 @@ class Settings(BaseSettings):
     locust_host: Optional[str] = Field(default="https://localhost:8080", alias="LOCUST_HOST")
     locust_users: int = Field(default=10, alias="LOCUST_USERS")
     locust_spawn_rate: float = Field(default=2.0, alias="LOCUST_SPAWN_RATE")
+    # Open model: total requests/s; users become the concurrency cap
+    locust_target_rps: Optional[float] = Field(default=None, alias="LOCUST_TARGET_RPS")
     locust_run_time: str = Field(default="10s", alias="LOCUST_RUN_TIME")
     locust_csv_prefix: str = Field(default="stats", alias="LOCUST_CSV_PREFIX")
     locust_html_report: bool = Field(default=True, alias="LOCUST_HTML_REPORT")
     locust_csv_full_history: bool = Field(default=True, alias="LOCUST_CSV_FULL_HISTORY")
+    # Set by the runner for the locust subprocess
+    locust_run_dir: Optional[Path] = Field(default=None, alias="LOCUST_RUN_DIR")
+    # Keep a coordinated-omission-corrected histogram next to the raw one
+    locust_co_correction: bool = Field(default=False, alias="LOCUST_CO_CORRECTION")
+    # DNS/connect/TLS/TTFB/download breakdown per endpoint (FastHttpUser)
+    locust_phase_timings: bool = Field(default=False, alias="LOCUST_PHASE_TIMINGS")
+    # Connection profile for BaseLocustUser (see app/core/connection_profiles.py)
+    locust_connection_profile: str = Field(default="default", alias="LOCUST_CONNECTION_PROFILE")
+    locust_connection_profiles: Optional[Path] = Field(default=None, alias="LOCUST_CONNECTION_PROFILES")
+    # Warm-up excluded from the statistics: "rampup" or a time span (see app/core/warmup.py)
+    locust_warmup: Optional[str] = Field(default=None, alias="LOCUST_WARMUP")
+    # SLO spec evaluated live and at the end of the run (see app/core/slo.py)
+    locust_slo_file: Optional[Path] = Field(default=None, alias="LOCUST_SLO_FILE")
+    locust_metrics_port: Optional[int] = Field(default=None, alias="LOCUST_METRICS_PORT")
+    locust_metrics_host: str = Field(default="0.0.0.0", alias="LOCUST_METRICS_HOST")
+    locust_metrics_refresh_interval: float = Field(default=2.0, alias="LOCUST_METRICS_REFRESH_INTERVAL")
     
     # ReportPortal Configuration
     rp_endpoint: Optional[str] = Field(default=None, alias="RP_ENDPOINT")
@@ -30,6 +48,29 @@ class Settings(BaseSettings):
     rp_host_source: str = Field(default="unknown", alias="RP_HOST_SOURCE")
     rp_locustfile: str = Field(default="Unknown", alias="RP_LOCUSTFILE")
     rp_detailed_log: bool = Field(default=False, alias="RP_DETAILED_LOG")
+    rp_queue_size: int = Field(default=10000, alias="RP_QUEUE_SIZE")
+    rp_batch_size: int = Field(default=50, alias="RP_BATCH_SIZE")
+    rp_flush_interval: float = Field(default=0.5, alias="RP_FLUSH_INTERVAL")
+    rp_flush_timeout: float = Field(default=30.0, alias="RP_FLUSH_TIMEOUT")
+    rp_error_cap: int = Field(default=500, alias="RP_ERROR_CAP")
+    rp_error_top_n: int = Field(default=10, alias="RP_ERROR_TOP_N")
+    rp_stats_interval: float = Field(default=30.0, alias="RP_STATS_INTERVAL")
+    rp_stats_top_n: int = Field(default=10, alias="RP_STATS_TOP_N")
+    rp_worker_report_interval: float = Field(default=5.0, alias="RP_WORKER_REPORT_INTERVAL")
+    rp_upload_artifacts: bool = Field(default=True, alias="RP_UPLOAD_ARTIFACTS")
+    rp_upload_retries: int = Field(default=3, alias="RP_UPLOAD_RETRIES")
+    rp_upload_workers: int = Field(default=2, alias="RP_UPLOAD_WORKERS")
+
+    # Report Viewer Configuration
+    report_server_port: Optional[int] = Field(default=None, alias="REPORT_SERVER_PORT")
+    # Loopback only by default: the report server has no authentication (app/ui/auth.py
+    # does not cover it), so exposing it is opt-in
+    report_server_host: str = Field(default="127.0.0.1", alias="REPORT_SERVER_HOST")
+    report_public_url: Optional[str] = Field(default=None, alias="REPORT_PUBLIC_URL")
+    report_inline_max_mb: float = Field(default=5.0, alias="REPORT_INLINE_MAX_MB")
+
+    # UI Configuration
+    ui_debug_timings: bool = Field(default=False, alias="UI_DEBUG_TIMINGS")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -57,4 +98,12 @@ class Settings(BaseSettings):
     def rp_enabled(self) -> bool:
         return all([self.rp_endpoint, self.rp_project, self.rp_token])
 
+    @property
+    def report_base_url(self) -> Optional[str]:
+        if self.report_public_url:
+            return self.report_public_url
+        if self.report_server_port:
+            return f"http://localhost:{self.report_server_port}"
+        return None
+
 settings = Settings()
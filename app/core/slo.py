@@ -0,0 +1,404 @@
+"""
+Service level objectives for a run.
+SLOs are declared per endpoint ("GET /users/{id}", a "*" glob, or "Aggregated")
+as upper bounds on average/percentile latency and failure ratio, or a lower
+bound on throughput:
+
+    {
+      "window_s": 30, "evaluate_every_s": 5, "grace_s": 30, "abort_after": 3,
+      "slos": [
+        {"endpoint": "Aggregated", "p95_ms": 500, "max_failure_ratio": 0.01},
+        {"endpoint": "GET /users/{id}", "p99_ms": 800, "min_rps": 20}
+      ]
+    }
+
+While the test runs they are evaluated on a rolling window of the last
+`window_s` seconds (master/standalone only); after `abort_after` consecutive
+breaching evaluations the run is stopped early (0 = never). When the test stops,
+the whole run is evaluated once more, and that single verdict drives the
+console summary, the ReportPortal status, the process exit code and
+slo_verdict.json (copied into metadata.json by the post-run stages).
+
+Without LOCUST_SLO_FILE, DEFAULT_SLOS apply.
+"""
+import fnmatch
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .stats_summary import summarize_stats, take_snapshot, window_summary
+
+logger = logging.getLogger(__name__)
+
+SLO_VERDICT_FILE = "slo_verdict.json"
+AGGREGATED = "Aggregated"
+# Exit code of a run whose SLO verdict is FAILED (Locust itself uses 1 and 2)
+EXIT_CODE_SLO_FAILED = 3
+# Breaching evaluations kept in the verdict
+MAX_BREACH_LOG = 50
+
+_PERCENTILE_KEY = re.compile(r"^p(\d+(?:\.\d+)?)_ms$")
+_SPEC_KEYS = {"window_s", "evaluate_every_s", "grace_s", "abort_after", "min_requests", "slos"}
+
+
+@dataclass(frozen=True)
+class Objective:
+    """One bound on one metric of an endpoint.
+
+    Args:
+        endpoint: "METHOD name", "name", a glob ("GET /users/*", "*") or "Aggregated"
+        metric: "avg_ms", "pNN_ms", "failure_ratio" or "rps"
+        threshold: Upper bound (lower bound for "rps")
+    """
+
+    endpoint: str
+    metric: str
+    threshold: float
+
+    @property
+    def lower_bound(self) -> bool:
+        return self.metric == "rps"
+
+    @property
+    def percentile(self) -> Optional[float]:
+        match = _PERCENTILE_KEY.match(self.metric)
+        return float(match.group(1)) / 100 if match else None
+
+    def describe(self) -> str:
+        return f"{self.metric} {'>=' if self.lower_bound else '<='} {self.threshold:g}"
+
+
+@dataclass(frozen=True)
+class SloSpec:
+    """Objectives plus how they are evaluated during the run.
+
+    Args:
+        objectives: Bounds to check
+        window_s: Length of the rolling window evaluated live
+        evaluate_every_s: Seconds between live evaluations
+        grace_s: Seconds after test start before live evaluation (ramp-up)
+        abort_after: Consecutive breaching evaluations that stop the run (0 = never)
+        min_requests: Endpoints with fewer requests in a window are not judged live
+        source: Where the spec came from (file path or "default")
+    """
+
+    objectives: Tuple[Objective, ...]
+    window_s: float = 30.0
+    evaluate_every_s: float = 5.0
+    grace_s: float = 30.0
+    abort_after: int = 0
+    min_requests: int = 10
+    source: str = "default"
+
+    def percentiles(self) -> Tuple[float, ...]:
+        return tuple(sorted({o.percentile for o in self.objectives if o.percentile is not None}))
+
+    def as_dict(self) -> Dict[str, Any]:
+        slos: Dict[str, Dict[str, float]] = {}
+        for o in self.objectives:
+            key = {"failure_ratio": "max_failure_ratio", "rps": "min_rps"}.get(o.metric, o.metric)
+            slos.setdefault(o.endpoint, {})[key] = o.threshold
+        return {
+            "window_s": self.window_s,
+            "evaluate_every_s": self.evaluate_every_s,
+            "grace_s": self.grace_s,
+            "abort_after": self.abort_after,
+            "min_requests": self.min_requests,
+            "slos": [{"endpoint": endpoint, **bounds} for endpoint, bounds in slos.items()],
+        }
+
+
+# The limits log_test_summary and the RP report used to hard-code
+DEFAULT_SLOS = SloSpec(
+    objectives=(
+        Objective(AGGREGATED, "avg_ms", 200.0),
+        Objective(AGGREGATED, "failure_ratio", 0.05),
+    )
+)
+
+
+def _objective(endpoint: str, key: str, value) -> Objective:
+    try:
+        threshold = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"SLO '{key}' for '{endpoint}' must be a number, got {value!r}")
+    if key == "max_failure_ratio":
+        return Objective(endpoint, "failure_ratio", threshold)
+    if key == "min_rps":
+        return Objective(endpoint, "rps", threshold)
+    if key == "avg_ms":
+        return Objective(endpoint, key, threshold)
+    match = _PERCENTILE_KEY.match(key)
+    if match and 0 < float(match.group(1)) <= 100:
+        return Objective(endpoint, key, threshold)
+    raise ValueError(
+        f"Unknown SLO '{key}' for '{endpoint}' (use avg_ms, pNN_ms, max_failure_ratio or min_rps)"
+    )
+
+
+def parse_slo_spec(data: Dict[str, Any], source: str = "inline") -> SloSpec:
+    """Build a spec from its JSON form; raises ValueError on unknown or malformed keys."""
+    if not isinstance(data, dict):
+        raise ValueError("SLO spec must be a JSON object")
+    unknown = set(data) - _SPEC_KEYS
+    if unknown:
+        raise ValueError(f"Unknown SLO spec keys {sorted(unknown)}")
+    rules = data.get("slos", [])
+    if not isinstance(rules, list) or not all(isinstance(rule, dict) for rule in rules):
+        raise ValueError("'slos' must be a list of objects")
+    objectives = []
+    for rule in rules:
+        rule = dict(rule)
+        endpoint = rule.pop("endpoint", AGGREGATED)
+        if not isinstance(endpoint, str):
+            raise ValueError(f"SLO endpoint must be a string, got {endpoint!r}")
+        if not rule:
+            raise ValueError(f"SLO for '{endpoint}' has no bounds")
+        objectives.extend(_objective(endpoint, key, value) for key, value in rule.items())
+    if not objectives:
+        raise ValueError("SLO spec has no objectives")
+    try:
+        options = {k: type(getattr(DEFAULT_SLOS, k))(data[k]) for k in _SPEC_KEYS - {"slos"} if k in data}
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid SLO spec option: {e}")
+    for key in ("window_s", "evaluate_every_s"):
+        if key in options and not options[key] > 0:
+            raise ValueError(f"SLO spec option '{key}' must be > 0")
+    for key in ("grace_s", "abort_after", "min_requests"):
+        if key in options and not options[key] >= 0:
+            raise ValueError(f"SLO spec option '{key}' must be >= 0")
+    return replace(DEFAULT_SLOS, objectives=tuple(objectives), source=source, **options)
+
+
+def load_slo_spec(path: Optional[Path] = None) -> SloSpec:
+    """Spec from a JSON file, or DEFAULT_SLOS when no file is given or it cannot be read."""
+    if not path:
+        return DEFAULT_SLOS
+    try:
+        return parse_slo_spec(json.loads(Path(path).read_text(encoding="utf-8")), source=str(path))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read SLOs from {path}, using defaults: {e}")
+        return DEFAULT_SLOS
+
+
+def _label(entry) -> str:
+    return f"{entry.method} {entry.name}" if entry.method else entry.name
+
+
+def _matches(pattern: str, entry) -> bool:
+    label = _label(entry)
+    if any(c in pattern for c in "*?"):
+        return fnmatch.fnmatchcase(label, pattern) or fnmatch.fnmatchcase(entry.name, pattern)
+    return pattern in (label, entry.name)
+
+
+def _actual(objective: Objective, entry) -> float:
+    if objective.metric == "failure_ratio":
+        return entry.fail_ratio
+    if objective.metric == "rps":
+        return entry.rps
+    if objective.metric == "avg_ms":
+        return entry.avg_ms
+    return float(entry.percentile(objective.percentile))
+
+
+def evaluate(summary, spec: SloSpec, min_requests: int = 0) -> List[Dict[str, Any]]:
+    """One check per objective and matching endpoint of a StatsSummary."""
+    checks = []
+    for objective in spec.objectives:
+        if objective.endpoint == AGGREGATED:
+            entries = [summary.total]
+        else:
+            entries = [e for e in summary.entries if _matches(objective.endpoint, e)]
+            if not entries and objective.lower_bound and not any(c in objective.endpoint for c in "*?"):
+                # A named endpoint without traffic has zero throughput
+                checks.append(_check(objective, objective.endpoint, 0.0))
+                continue
+        for entry in entries:
+            # Too few requests to judge latency/failures; throughput is judged regardless
+            if entry.num_requests < max(min_requests, 1) and not objective.lower_bound:
+                continue
+            label = AGGREGATED if entry is summary.total else _label(entry)
+            checks.append(_check(objective, label, _actual(objective, entry)))
+    return checks
+
+
+def _check(objective: Objective, endpoint: str, actual: float) -> Dict[str, Any]:
+    passed = actual >= objective.threshold if objective.lower_bound else actual <= objective.threshold
+    return {
+        "endpoint": endpoint,
+        "metric": objective.metric,
+        "threshold": objective.threshold,
+        "actual": round(actual, 4),
+        "passed": passed,
+    }
+
+
+def format_check(check: Dict[str, Any]) -> str:
+    op = ">=" if check["metric"] == "rps" else "<="
+    if check["metric"] == "failure_ratio":
+        values = f"{check['actual']:.2%} (limit {op} {check['threshold']:.2%})"
+    else:
+        values = f"{check['actual']:g} (limit {op} {check['threshold']:g})"
+    return f"{check['endpoint']} {check['metric']}: {values}"
+
+
+def evaluate_run(stats, spec: SloSpec) -> Dict[str, Any]:
+    """Verdict over a whole run's stats (no live/abort information)."""
+    summary = summarize_stats(stats, spec.percentiles())
+    checks = evaluate(summary, spec)
+    return {
+        "status": "PASSED" if all(c["passed"] for c in checks) else "FAILED",
+        "source": spec.source,
+        "spec": spec.as_dict(),
+        "checks": checks,
+        "aborted": False,
+        "abort_reason": None,
+        "live_breaches": 0,
+        "breach_log": [],
+    }
+
+
+class SloEvaluator:
+    """Evaluates a spec on rolling windows while the test runs (master/standalone).
+
+    Args:
+        environment: Locust environment
+        spec: Objectives to evaluate
+    """
+
+    def __init__(self, environment, spec: SloSpec):
+        self.env = environment
+        self.spec = spec
+        self._greenlet = None
+        self.reset()
+        environment.events.test_start.add_listener(self.on_test_start)
+        environment.events.test_stop.add_listener(self.on_test_stop)
+        # Windows must not span a stats reset (e.g. the end of warm-up)
+        environment.events.reset_stats.add_listener(lambda **kw: self._snapshots.clear())
+
+    def reset(self):
+        self.started_at = time.time()
+        self._snapshots = []
+        self.consecutive = 0
+        self.breach_log: List[Dict[str, Any]] = []
+        self.live_breaches = 0
+        self.abort_reason: Optional[str] = None
+        self._verdict: Optional[Dict[str, Any]] = None
+
+    def on_test_start(self, **kwargs):
+        import gevent
+
+        self.reset()
+        if self._greenlet is None:
+            self._greenlet = gevent.spawn(self._loop)
+
+    def _loop(self):
+        import gevent
+
+        while True:
+            gevent.sleep(self.spec.evaluate_every_s)
+            try:
+                self.evaluate_window()
+            except Exception as e:
+                logger.error(f"SLO evaluation failed: {e}", exc_info=True)
+
+    def evaluate_window(self) -> List[Dict[str, Any]]:
+        """Judge the last window_s seconds; stops the run after abort_after breaches in a row."""
+        snapshot = take_snapshot(self.env.stats)
+        self._snapshots.append(snapshot)
+        cutoff = snapshot.taken_at - self.spec.window_s
+        while len(self._snapshots) > 2 and self._snapshots[1].taken_at <= cutoff:
+            self._snapshots.pop(0)
+        if snapshot.taken_at - self.started_at < self.spec.grace_s or len(self._snapshots) < 2:
+            return []
+        window = window_summary(self._snapshots[0], snapshot, self.spec.percentiles())
+        failed = [c for c in evaluate(window, self.spec, self.spec.min_requests) if not c["passed"]]
+        if not failed:
+            self.consecutive = 0
+            return []
+        self.consecutive += 1
+        self.live_breaches += 1
+        if len(self.breach_log) < MAX_BREACH_LOG:
+            self.breach_log.append(
+                {"elapsed_s": round(snapshot.taken_at - self.started_at, 1), "failed": failed}
+            )
+        logger.warning(
+            f"SLO breach in the last {window.duration_s:.0f}s "
+            f"({self.consecutive} in a row): " + "; ".join(format_check(c) for c in failed)
+        )
+        if self.spec.abort_after and self.consecutive >= self.spec.abort_after and self.abort_reason is None:
+            self.abort_reason = (
+                f"{self.consecutive} consecutive breaching windows: " + "; ".join(format_check(c) for c in failed)
+            )
+            logger.error(f"Stopping the run early: {self.abort_reason}")
+            import gevent
+
+            gevent.spawn(self.env.runner.quit)
+        return failed
+
+    def verdict(self) -> Dict[str, Any]:
+        """The run's verdict; computed once when the test stops and cached."""
+        if self._verdict is None:
+            verdict = evaluate_run(self.env.stats, self.spec)
+            if self.abort_reason:
+                verdict["status"] = "FAILED"
+            verdict.update(
+                aborted=self.abort_reason is not None,
+                abort_reason=self.abort_reason,
+                live_breaches=self.live_breaches,
+                breach_log=self.breach_log,
+            )
+            self._verdict = verdict
+        return self._verdict
+
+    def on_test_stop(self, **kwargs):
+        if self._greenlet is not None:
+            self._greenlet.kill(block=False)
+            self._greenlet = None
+        verdict = self.verdict()
+        self._set_exit_code(verdict)
+        self.write_verdict(verdict)
+
+    def _set_exit_code(self, verdict: Dict[str, Any]):
+        from locust import log
+
+        if self.env.runner.exceptions or log.unhandled_greenlet_exception:
+            # Crashing tasks are not an SLO failure: keep Locust's exit code (--exit-code-on-error)
+            return
+        if verdict["status"] == "FAILED":
+            self.env.process_exit_code = EXIT_CODE_SLO_FAILED
+        elif self.env.process_exit_code is None:
+            # Failed requests within the SLOs no longer fail the process
+            self.env.process_exit_code = 0
+
+    def write_verdict(self, verdict: Dict[str, Any]):
+        from .settings import settings
+
+        if not settings.locust_run_dir:
+            return
+        try:
+            (Path(settings.locust_run_dir) / SLO_VERDICT_FILE).write_text(
+                json.dumps(verdict, indent=2), encoding="utf-8"
+            )
+        except OSError as e:
+            logger.warning(f"Failed to write {SLO_VERDICT_FILE}: {e}")
+
+
+def get_slo_evaluator(environment) -> Optional[SloEvaluator]:
+    """The environment's live evaluator (master/standalone runs)."""
+    return getattr(environment, "slo_evaluator", None)
+
+
+def slo_verdict(environment) -> Dict[str, Any]:
+    """The run's verdict: the live evaluator's, or the configured SLOs applied to the stats."""
+    evaluator = get_slo_evaluator(environment)
+    if evaluator is not None:
+        return evaluator.verdict()
+    from .settings import settings
+
+    return evaluate_run(environment.stats, load_slo_spec(settings.locust_slo_file))
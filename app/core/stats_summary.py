@@ -0,0 +1,231 @@
+"""
+Single-pass Locust stats summary.
+Computes every requested percentile, min/max/avg and rates of each stats entry in
+one walk over its response-time histogram. The RP report, the console summary and
+file exports all render from the same result instead of calling
+get_response_time_percentile() once per column.
+
+Interval (window) summaries are computed from the difference of two snapshots,
+so periodic reports describe only what happened since the previous one.
+"""
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+REPORT_PERCENTILES = (0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99)
+INTERVAL_PERCENTILES = (0.50, 0.95, 0.99)
+INTERVAL_STATS_FILE = "interval_stats.jsonl"
+
+
+def histogram_percentiles(
+    response_times: Dict[int, int], num_requests: int, percentiles: Sequence[float]
+) -> Dict[float, int]:
+    """All percentiles of a Locust response_times histogram in one pass.
+
+    Same semantics as locust.stats.calculate_response_time_percentile: walk the
+    buckets from slowest to fastest and return the first bucket at which at most
+    int(num_requests * p) requests remain.
+    """
+    result = {p: 0 for p in percentiles}
+    if not response_times or num_requests <= 0:
+        return result
+    # Highest percentile is reached first when walking downwards
+    pending = sorted(percentiles, reverse=True)
+    targets = [num_requests - int(num_requests * p) for p in pending]
+    i = 0
+    processed = 0
+    for response_time in sorted(response_times, reverse=True):
+        processed += response_times[response_time]
+        while i < len(pending) and processed >= targets[i]:
+            result[pending[i]] = response_time
+            i += 1
+        if i == len(pending):
+            break
+    return result
+
+
+@dataclass
+class EntrySummary:
+    method: str
+    name: str
+    num_requests: int
+    num_failures: int
+    avg_ms: float
+    min_ms: float
+    max_ms: float
+    avg_content_length: float
+    rps: float
+    current_rps: float
+    fail_per_s: float
+    percentiles: Dict[float, int] = field(default_factory=dict)
+
+    @property
+    def fail_ratio(self) -> float:
+        return self.num_failures / self.num_requests if self.num_requests else 0.0
+
+    def percentile(self, p: float) -> int:
+        return self.percentiles.get(p, 0)
+
+
+@dataclass
+class StatsSummary:
+    duration_s: float
+    percentiles: Sequence[float]
+    entries: List[EntrySummary]
+    total: EntrySummary
+    # Epoch seconds at the end of the window (interval summaries only)
+    ended_at: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form (percentile keys become strings like "0.95")."""
+        data = asdict(self)
+        for entry in data["entries"] + [data["total"]]:
+            entry["percentiles"] = {str(p): v for p, v in entry["percentiles"].items()}
+        return data
+
+
+def summarize_entry(
+    stat, percentiles: Sequence[float] = REPORT_PERCENTILES, duration_s: Optional[float] = None
+) -> EntrySummary:
+    """Summarise one locust StatsEntry (endpoint or total)."""
+    # Requests without a response time (None) are not in the histogram
+    timed = stat.num_requests - getattr(stat, "num_none_requests", 0)
+    return EntrySummary(
+        method=stat.method or "",
+        name=stat.name,
+        num_requests=stat.num_requests,
+        num_failures=stat.num_failures,
+        avg_ms=stat.avg_response_time,
+        min_ms=stat.min_response_time or 0,
+        max_ms=stat.max_response_time or 0,
+        avg_content_length=stat.avg_content_length,
+        rps=stat.total_rps,
+        current_rps=stat.current_rps,
+        fail_per_s=stat.num_failures / duration_s if duration_s else 0.0,
+        percentiles=histogram_percentiles(stat.response_times, timed, percentiles),
+    )
+
+
+def summarize_stats(
+    stats,
+    percentiles: Sequence[float] = REPORT_PERCENTILES,
+    duration_s: Optional[float] = None,
+    entries: Optional[Iterable] = None,
+) -> StatsSummary:
+    """Summarise a RequestStats object: every entry with requests, plus the total.
+
+    Args:
+        stats: environment.stats
+        percentiles: Percentiles to compute (0.0 - 1.0)
+        duration_s: Test duration used for per-second failure rates
+        entries: Subset of stats entries to include (default: all)
+    """
+    source = stats.entries.values() if entries is None else entries
+    return StatsSummary(
+        duration_s=duration_s or 0.0,
+        percentiles=tuple(percentiles),
+        entries=[
+            summarize_entry(s, percentiles, duration_s)
+            for s in source
+            if s.num_requests > 0
+        ],
+        total=summarize_entry(stats.total, percentiles, duration_s),
+    )
+
+
+# (num_requests, num_failures, total_response_time, total_content_length, response_times)
+_EntryState = Tuple[int, int, float, int, Dict[int, int]]
+
+
+@dataclass
+class StatsSnapshot:
+    """Cumulative counters of every stats entry at one moment."""
+
+    taken_at: float
+    entries: Dict[Tuple[str, str], _EntryState]
+    total: _EntryState
+
+
+def _entry_state(stat) -> _EntryState:
+    return (
+        stat.num_requests,
+        stat.num_failures,
+        stat.total_response_time,
+        stat.total_content_length,
+        dict(stat.response_times),
+    )
+
+
+_EMPTY_STATE: _EntryState = (0, 0, 0.0, 0, {})
+
+
+def take_snapshot(stats) -> StatsSnapshot:
+    return StatsSnapshot(
+        taken_at=time.time(),
+        entries={
+            (s.method or "", s.name): _entry_state(s)
+            for s in stats.entries.values()
+            if s.num_requests > 0
+        },
+        total=_entry_state(stats.total),
+    )
+
+
+def _window_entry(
+    method: str,
+    name: str,
+    prev: _EntryState,
+    curr: _EntryState,
+    duration_s: float,
+    percentiles: Sequence[float],
+) -> EntrySummary:
+    if curr[0] < prev[0]:
+        # Stats were reset in between (e.g. --reset-stats after ramp-up)
+        prev = _EMPTY_STATE
+    requests = curr[0] - prev[0]
+    failures = curr[1] - prev[1]
+    old = prev[4]
+    hist = {rt: n - old.get(rt, 0) for rt, n in curr[4].items() if n > old.get(rt, 0)}
+    timed = sum(hist.values())
+    rps = requests / duration_s if duration_s > 0 else 0.0
+    return EntrySummary(
+        method=method,
+        name=name,
+        num_requests=requests,
+        num_failures=failures,
+        avg_ms=(curr[2] - prev[2]) / timed if timed else 0.0,
+        # Bucket bounds: Locust rounds response times above 100 ms
+        min_ms=min(hist) if hist else 0,
+        max_ms=max(hist) if hist else 0,
+        avg_content_length=(curr[3] - prev[3]) / requests if requests else 0.0,
+        rps=rps,
+        current_rps=rps,
+        fail_per_s=failures / duration_s if duration_s > 0 else 0.0,
+        percentiles=histogram_percentiles(hist, timed, percentiles),
+    )
+
+
+def window_summary(
+    prev: StatsSnapshot,
+    curr: StatsSnapshot,
+    percentiles: Sequence[float] = INTERVAL_PERCENTILES,
+) -> StatsSummary:
+    """What happened between two snapshots: counts, rates and percentiles of the window only.
+
+    Entries without requests in the window are left out; entries are ordered by
+    request count (busiest first).
+    """
+    duration_s = max(curr.taken_at - prev.taken_at, 0.0)
+    entries = []
+    for (method, name), state in curr.entries.items():
+        before = prev.entries.get((method, name), _EMPTY_STATE)
+        if state[0] != before[0]:
+            entries.append(_window_entry(method, name, before, state, duration_s, percentiles))
+    entries.sort(key=lambda e: e.num_requests, reverse=True)
+    return StatsSummary(
+        duration_s=duration_s,
+        percentiles=tuple(percentiles),
+        entries=entries,
+        total=_window_entry("", "Aggregated", prev.total, curr.total, duration_s, percentiles),
+        ended_at=curr.taken_at,
+    )
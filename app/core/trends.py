@@ -0,0 +1,135 @@
+"""
+Cross-run performance trends.
+Orders run summaries by start time per (host, locustfile) pair, computes rolling
+baselines from the preceding runs and flags statistically significant shifts.
+"""
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+TREND_KEYS = ["host", "locustfile"]
+
+# metric -> sign of a regression (+1: higher is worse, -1: lower is worse)
+TREND_METRICS = {
+    "p95_ms": 1,
+    "avg_rps": -1,
+    "failure_rate": 1,
+}
+
+
+def _previous_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """Row i holds values[i - window:i], NaN-padded; the current run is never in its own baseline."""
+    padded = np.concatenate([np.full(window, np.nan), values.astype(float)])
+    return sliding_window_view(padded, window)[: len(values)]
+
+
+def rolling_baseline(values: np.ndarray, window: int):
+    """Mean, sample std and sample count of the previous `window` values for every position."""
+    win = _previous_windows(values, window)
+    valid = ~np.isnan(win)
+    count = valid.sum(axis=1)
+    filled = np.where(valid, win, 0.0)
+    total = filled.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, total / count, np.nan)
+        sq = np.where(valid, (win - mean[:, None]) ** 2, 0.0).sum(axis=1)
+        std = np.where(count > 1, np.sqrt(sq / (count - 1)), np.nan)
+    return mean, std, count
+
+
+def _shift_zscores(values, window, min_baseline, min_rel_change):
+    mean, std, count = rolling_baseline(values, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Floor the spread so near-constant baselines don't turn noise into huge z-scores
+        spread = np.fmax(std, np.abs(mean) * min_rel_change / 2)
+        z = (values - mean) / spread
+        rel = (values - mean) / np.abs(mean)
+    z[(count < min_baseline) | (np.abs(rel) < min_rel_change)] = 0.0
+    return mean, np.nan_to_num(z)
+
+
+def _failure_zscores(failures, requests, window, min_baseline, min_abs_change):
+    """Two-proportion z-test of each run's failure rate against the pooled previous runs.
+
+    With millions of requests tiny differences are significant; shifts smaller than
+    `min_abs_change` (absolute failure rate) are ignored like small p95/RPS shifts.
+    """
+    f_win = _previous_windows(failures, window)
+    r_win = _previous_windows(requests, window)
+    count = (~np.isnan(r_win)).sum(axis=1)
+    f_base = np.nansum(f_win, axis=1)
+    r_base = np.nansum(r_win, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        p_base = f_base / r_base
+        p_cur = failures / requests
+        pooled = (f_base + failures) / (r_base + requests)
+        se = np.sqrt(pooled * (1 - pooled) * (1 / r_base + 1 / requests))
+        z = (p_cur - p_base) / se
+    z[(count < min_baseline) | ~(np.abs(p_cur - p_base) >= min_abs_change)] = 0.0
+    return p_base, np.nan_to_num(z, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def compute_trends(
+    summaries: pd.DataFrame,
+    window: int = 5,
+    z_threshold: float = 3.0,
+    min_baseline: int = 3,
+    min_rel_change: float = 0.10,
+    min_failure_change: float = 0.001,
+) -> pd.DataFrame:
+    """Attach rolling baselines, z-scores and regression flags to run summaries.
+
+    Args:
+        summaries: Run summaries as assembled for the dashboard (one row per run)
+        window: Number of preceding runs of the same host/locustfile used as baseline
+        z_threshold: |z| at or above which a shift is considered significant
+        min_baseline: Minimum number of baseline runs before anything is flagged
+        min_rel_change: Relative change below which p95/RPS shifts are ignored
+        min_failure_change: Absolute failure-rate change below which shifts are ignored
+            (0.001 = 0.1 percentage points)
+
+    Returns:
+        Summaries ordered by (host, locustfile, started_at) with, per metric,
+        `<metric>_baseline`, `<metric>_z` and `<metric>_flag`
+        ("regression", "improvement" or "") columns.
+    """
+    df = summaries.copy()
+    df["started_at"] = pd.to_datetime(df["started_at"], errors="coerce", format="ISO8601")
+    df = df.dropna(subset=["started_at"])
+    df["failure_rate"] = df["failures"] / df["requests"].where(df["requests"] > 0)
+    df = df.sort_values(TREND_KEYS + ["started_at"]).reset_index(drop=True)
+
+    for metric in TREND_METRICS:
+        df[f"{metric}_baseline"] = np.nan
+        df[f"{metric}_z"] = 0.0
+
+    for _, idx in df.groupby(TREND_KEYS, dropna=False).indices.items():
+        g = df.iloc[idx]
+        for metric in ("p95_ms", "avg_rps"):
+            vals = g[metric].to_numpy(dtype=float)
+            base, z = _shift_zscores(vals, window, min_baseline, min_rel_change)
+            df.loc[g.index, f"{metric}_baseline"] = base
+            df.loc[g.index, f"{metric}_z"] = z
+        base, z = _failure_zscores(
+            g["failures"].to_numpy(dtype=float),
+            g["requests"].to_numpy(dtype=float),
+            window,
+            min_baseline,
+            min_failure_change,
+        )
+        df.loc[g.index, "failure_rate_baseline"] = base
+        df.loc[g.index, "failure_rate_z"] = z
+
+    for metric, worse in TREND_METRICS.items():
+        z = df[f"{metric}_z"].to_numpy() * worse
+        df[f"{metric}_flag"] = np.select(
+            [z >= z_threshold, z <= -z_threshold], ["regression", "improvement"], ""
+        )
+    return df
+
+
+def flagged_runs(trends: pd.DataFrame) -> pd.DataFrame:
+    """Rows with at least one significant shift, newest first."""
+    flag_cols = [f"{m}_flag" for m in TREND_METRICS]
+    mask = (trends[flag_cols] != "").any(axis=1)
+    return trends[mask].sort_values("started_at", ascending=False)
@@ -0,0 +1,163 @@
+"""
+Warm-up exclusion.
+The first part of a run (cold caches, JIT, connection setup) skews the
+cumulative percentiles. With LOCUST_WARMUP set, everything recorded until the
+warm-up ends is saved separately and then reset, so stats.csv, the console and
+RP summaries, the SLO verdict and the Dashboard describe the steady state:
+
+- "rampup": warm-up ends when all users are spawned
+- a time span ("60s", "2m", "90"): warm-up ends that long after the test starts
+
+The warm-up series is written as warmup_stats.csv / warmup_failures.csv, and
+warmup.json records when it ended; history CSV rows keep being written
+throughout and are split by that timestamp. Resetting fires Locust's
+reset_stats event, so listeners such as the latency corrector, phase timings
+and arrival lag start over too.
+
+In distributed runs the master resets its aggregated stats and tells the
+workers to reset theirs; a worker report already in flight may still land on
+either side of the boundary.
+"""
+import csv
+import importlib.util
+import json
+import logging
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+RAMPUP = "rampup"
+WARMUP_FILE = "warmup.json"
+WARMUP_STATS_FILE = "warmup_stats.csv"
+WARMUP_FAILURES_FILE = "warmup_failures.csv"
+WARMUP_MESSAGE = "warmup_done"
+
+
+@lru_cache(maxsize=1)
+def _parse_timespan():
+    """locust.util.timespan.parse_timespan, loaded without the locust package.
+
+    Importing locust monkey-patches gevent, which the Streamlit process must not do;
+    the timespan module itself only needs re and datetime.
+    """
+    origin = importlib.util.find_spec("locust").origin
+    spec = importlib.util.spec_from_file_location("_locust_timespan", Path(origin).parent / "util" / "timespan.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.parse_timespan
+
+
+def parse_warmup(mode: str) -> Optional[float]:
+    """Warm-up length in seconds, None for "rampup"; raises ValueError like --run-time."""
+    if mode == RAMPUP:
+        return None
+    return float(_parse_timespan()(mode))
+
+
+class WarmupController:
+    """Ends the warm-up of one Locust environment.
+
+    Args:
+        environment: Locust environment
+        mode: "rampup" or a time span accepted by --run-time
+    """
+
+    def __init__(self, environment, mode: str):
+        from locust.runners import WorkerRunner
+
+        self.env = environment
+        self.mode = mode
+        self.seconds: Optional[float] = parse_warmup(mode)
+        self.started_at: Optional[float] = None
+        self.summary: Optional[Dict[str, Any]] = None
+        self._timer = None
+
+        runner = environment.runner
+        if isinstance(runner, WorkerRunner):
+            runner.register_message(WARMUP_MESSAGE, self.on_master_done)
+            return
+        environment.events.test_start.add_listener(self.on_test_start)
+        environment.events.test_stop.add_listener(self.on_test_stop)
+        if self.seconds is None:
+            environment.events.spawning_complete.add_listener(self.on_spawning_complete)
+
+    def on_test_start(self, **kwargs):
+        self.started_at = time.time()
+        self.summary = None
+        if self.seconds is not None:
+            import gevent
+
+            self._timer = gevent.spawn_later(self.seconds, self.end_warmup, f"{self.seconds:g}s elapsed")
+
+    def on_spawning_complete(self, user_count: int, **kwargs):
+        # Fires again when a load shape changes the user count; only the first one ends warm-up
+        if self.started_at is not None and self.summary is None:
+            self.end_warmup(f"ramp-up to {user_count} users complete")
+
+    def end_warmup(self, reason: str):
+        from locust.runners import MasterRunner
+
+        stats = self.env.stats
+        ended_at = time.time()
+        self.summary = {
+            "mode": self.mode,
+            "reason": reason,
+            "started_at": self.started_at,
+            "ended_at": ended_at,
+            "duration_s": round(ended_at - self.started_at, 1),
+            "requests": stats.total.num_requests,
+            "failures": stats.total.num_failures,
+        }
+        self._write_series()
+        stats.reset_all()
+        self.env.events.reset_stats.fire()
+        if isinstance(self.env.runner, MasterRunner):
+            self.env.runner.send_message(WARMUP_MESSAGE)
+        self._write_summary()
+        logger.info(
+            f"Warm-up over after {self.summary['duration_s']}s ({reason}): "
+            f"{self.summary['requests']} requests excluded from the statistics"
+        )
+
+    def on_master_done(self, environment, msg, **kwargs):
+        self.env.runner.stats.reset_all()
+        self.env.events.reset_stats.fire()
+
+    def on_test_stop(self, **kwargs):
+        if self._timer is not None:
+            self._timer.kill(block=False)
+            self._timer = None
+        if self.started_at is not None and self.summary is None:
+            logger.warning(f"Run ended during warm-up ({self.mode}); no statistics were excluded")
+
+    def _run_dir(self) -> Optional[Path]:
+        from .settings import settings
+
+        return Path(settings.locust_run_dir) if settings.locust_run_dir else None
+
+    def _write_series(self):
+        run_dir = self._run_dir()
+        if run_dir is None:
+            return
+        from locust.stats import PERCENTILES_TO_REPORT, StatsCSV
+
+        writer = StatsCSV(self.env, PERCENTILES_TO_REPORT)
+        try:
+            with (run_dir / WARMUP_STATS_FILE).open("w", newline="", encoding="utf-8") as f:
+                writer.requests_csv(csv.writer(f))
+            with (run_dir / WARMUP_FAILURES_FILE).open("w", newline="", encoding="utf-8") as f:
+                writer.failures_csv(csv.writer(f))
+        except OSError as e:
+            logger.warning(f"Failed to write the warm-up statistics: {e}")
+
+    def _write_summary(self):
+        run_dir = self._run_dir()
+        if run_dir is None:
+            return
+        try:
+            (run_dir / WARMUP_FILE).write_text(json.dumps(self.summary, indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Failed to write {WARMUP_FILE}: {e}")
@@ -4,6 +4,7 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from app.core.changepoints import aggregated_history, parse_history_timestamps
 
 def render_summary_from_stats(stats_df: pd.DataFrame):
     # Locust stats CSV has an "Aggregated" row with overall metrics
@@ -31,27 +32,144 @@ def render_summary_from_stats(stats_df: pd.DataFrame):
         cols[3].metric("p95 (ms)", "-")
 
 
-def render_time_series(history_df: pd.DataFrame):
-    """Render improved, readable time series charts."""
+def render_corrected_percentiles(corrected_df: pd.DataFrame):
+    """Raw vs coordinated-omission-corrected p95/p99 (corrected_stats.csv)."""
+    agg_rows = corrected_df[corrected_df["Name"].astype(str).str.lower() == "aggregated"]
+    if agg_rows.empty:
+        return
+    agg = agg_rows.iloc[0]
+    cols = st.columns(4)
+    for i, p in enumerate(("95", "99")):
+        raw, corrected = int(agg[f"Raw {p}%"]), int(agg[f"Corrected {p}%"])
+        cols[i * 2].metric(f"p{p} raw (ms)", f"{raw}")
+        cols[i * 2 + 1].metric(
+            f"p{p} corrected (ms)",
+            f"{corrected}",
+            delta=f"{corrected - raw:+d} ms",
+            delta_color="inverse",
+            help="Corrected for coordinated omission: includes the delay requests would "
+            "have seen had they been sent on schedule during stalls.",
+        )
+    with st.expander("Corrected percentiles per endpoint", expanded=False):
+        st.dataframe(corrected_df, use_container_width=True, hide_index=True)
+
+
+PHASE_COLORS = {
+    "dns": "#9b59b6",
+    "connect": "#3498db",
+    "tls": "#1abc9c",
+    "ttfb": "#f39c12",
+    "download": "#e74c3c",
+}
+
+
+def render_phase_breakdown(phases_df: pd.DataFrame):
+    """Stacked mean DNS/connect/TLS/TTFB/download per endpoint (phase_timings.csv)."""
+    df = phases_df.copy()
+    df["Endpoint"] = (df["Type"].fillna("").astype(str) + " " + df["Name"].astype(str)).str.strip()
+    phase_cols = [f"{p} (ms)" for p in PHASE_COLORS if f"{p} (ms)" in df.columns]
+    df = df.assign(_total=df[phase_cols].sum(axis=1)).sort_values("_total")
+
+    fig = go.Figure()
+    for col in phase_cols:
+        phase = col.split(" ")[0]
+        fig.add_trace(
+            go.Bar(
+                y=df["Endpoint"],
+                x=df[col],
+                name=phase.upper() if phase in ("dns", "tls", "ttfb") else phase.capitalize(),
+                orientation="h",
+                marker_color=PHASE_COLORS[phase],
+            )
+        )
+    fig.update_layout(
+        barmode="stack",
+        height=max(250, 40 * len(df) + 100),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(l=20, r=20, t=40, b=20),
+        xaxis_title="Mean time (ms)",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(
+        "DNS, connect and TLS are averaged over all requests, so reused connections pull them "
+        "down; 'New Connections' in the table shows how many requests opened one."
+    )
+    with st.expander("Phase timings per endpoint", expanded=False):
+        st.dataframe(phases_df, use_container_width=True, hide_index=True)
+
+
+CHANGE_POINT_COLORS = {"p95_ms": "#e74c3c", "median_ms": "#27ae60", "rps": "#8e44ad"}
+
+
+def _mark_change_points(fig: go.Figure, change_points: list, metrics: set):
+    for cp in change_points:
+        if cp.get("metric") not in metrics:
+            continue
+        users = cp.get("user_count")
+        fig.add_vline(
+            x=cp["elapsed_s"],
+            line_dash="dash",
+            line_color=CHANGE_POINT_COLORS.get(cp["metric"], "#7f8c8d"),
+            annotation_text=f"{cp['metric']} shift" + (f" @ {users} users" if users is not None else ""),
+            annotation_position="top left",
+        )
+
+
+def render_change_points(change_points: list):
+    """Table of detected change points."""
+    if not change_points:
+        st.caption("No significant change points detected.")
+        return
+    df = pd.DataFrame(change_points).rename(
+        columns={
+            "metric": "Metric",
+            "timestamp": "Time",
+            "elapsed_s": "Elapsed (s)",
+            "user_count": "Users",
+            "rps": "RPS",
+            "before": "Mean before",
+            "after": "Mean after",
+        }
+    )
+    st.dataframe(df, use_container_width=True, hide_index=True)
+
+
+def _mark_warmup(fig: go.Figure, warmup_end_s: float | None):
+    if warmup_end_s:
+        fig.add_vrect(
+            x0=0,
+            x1=warmup_end_s,
+            fillcolor="rgba(127, 140, 141, 0.15)",
+            line_width=0,
+            annotation_text="warm-up (excluded)",
+            annotation_position="top left",
+        )
+
+
+def render_time_series(
+    history_df: pd.DataFrame,
+    change_points: list | None = None,
+    warmup_ended_at: float | None = None,
+):
+    """Render improved, readable time series charts.
+    Change points (see app.core.changepoints) are marked as vertical lines, the
+    warm-up excluded from the statistics (app.core.warmup) as a shaded band.
+    """
     if history_df is None or history_df.empty:
         st.info("Zaman serisi verisi bulunamadı.")
         return
 
-    df = history_df.copy()
-
-    # Normalize timestamp
-    ts_col = None
-    for c in ["Timestamp", "Time", "timestamp", "time"]:
-        if c in df.columns:
-            ts_col = c
-            break
-    if ts_col is None:
+    df = aggregated_history(history_df)
+    if "_elapsed_s" not in df.columns:
         st.info("Zaman sütunu bulunamadı.")
         return
-    df[ts_col] = pd.to_datetime(df[ts_col])
 
-    # Calculate elapsed time in seconds for better readability
-    df["Süre (saniye)"] = (df[ts_col] - df[ts_col].min()).dt.total_seconds()
+    # Elapsed time in seconds for better readability
+    df["Süre (saniye)"] = df["_elapsed_s"]
+    change_points = change_points or []
+    warmup_end_s = None
+    if warmup_ended_at:
+        warmup_end_s = max(0.0, warmup_ended_at - df["_ts"].min().timestamp())
 
     # ===== CHART 1: RPS & Users (dual axis effect with area) =====
     st.markdown("### 📈 Request Rate and User Count")
@@ -130,6 +248,8 @@ def render_time_series(history_df: pd.DataFrame):
             gridcolor="rgba(128,128,128,0.2)",
         )
         fig1.update_yaxes(title_text="User Count", secondary_y=True)
+        _mark_change_points(fig1, change_points, {"rps"})
+        _mark_warmup(fig1, warmup_end_s)
 
         st.plotly_chart(fig1, use_container_width=True)
 
@@ -187,9 +307,134 @@ def render_time_series(history_df: pd.DataFrame):
         )
         fig2.update_xaxes(title_text="Süre (saniye)", gridcolor="rgba(128,128,128,0.2)")
         fig2.update_yaxes(gridcolor="rgba(128,128,128,0.2)")
+        _mark_change_points(fig2, change_points, {"p95_ms", "median_ms"})
+        _mark_warmup(fig2, warmup_end_s)
 
         st.plotly_chart(fig2, use_container_width=True)
 
         st.caption(
             "💡 **p50 (Median):** Half of the requests are faster than this | **p95:** 95% of requests are faster than this | **p99:** Slowest 1% of requests"
         )
+
+
+def render_trend_chart(trend_df: pd.DataFrame, metric: str, label: str):
+    """Plot one metric across runs with its rolling baseline and flagged shifts."""
+    if trend_df.empty or trend_df[metric].isna().all():
+        st.info("No data for this metric.")
+        return
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=trend_df["started_at"],
+            y=trend_df[metric],
+            name=label,
+            mode="lines+markers",
+            line=dict(color="#3498db", width=2),
+            customdata=trend_df["run_id"],
+            hovertemplate="%{customdata}<br>%{y:.2f}<extra></extra>",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=trend_df["started_at"],
+            y=trend_df[f"{metric}_baseline"],
+            name="Baseline",
+            line=dict(color="#95a5a6", width=2, dash="dot"),
+        )
+    )
+    for flag, color in [("regression", "#e74c3c"), ("improvement", "#27ae60")]:
+        marked = trend_df[trend_df[f"{metric}_flag"] == flag]
+        if not marked.empty:
+            fig.add_trace(
+                go.Scatter(
+                    x=marked["started_at"],
+                    y=marked[metric],
+                    name=flag.capitalize(),
+                    mode="markers",
+                    marker=dict(color=color, size=12, symbol="diamond"),
+                )
+            )
+
+    fig.update_layout(
+        height=350,
+        hovermode="x unified",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(l=20, r=20, t=40, b=20),
+        yaxis_title=label,
+    )
+    fig.update_xaxes(gridcolor="rgba(128,128,128,0.2)")
+    fig.update_yaxes(gridcolor="rgba(128,128,128,0.2)")
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render_failure_timeline(
+    history_df: pd.DataFrame,
+    endpoints: list,
+    first_seen: str | None = None,
+    last_seen: str | None = None,
+):
+    """Failures per second over the run, overall and for the given "METHOD name" endpoints."""
+    agg = aggregated_history(history_df)
+    if "_elapsed_s" not in agg.columns:
+        st.info("Zaman sütunu bulunamadı.")
+        return
+    start = agg["_ts"].min()
+
+    fig = go.Figure()
+    if "Failures/s" in agg.columns:
+        fig.add_trace(
+            go.Scatter(
+                x=agg["_elapsed_s"],
+                y=agg["Failures/s"],
+                name="All failures/s",
+                line=dict(color="#e74c3c", width=2),
+                fill="tozeroy",
+                fillcolor="rgba(231, 76, 60, 0.1)",
+            )
+        )
+
+    per_endpoint = history_df.iloc[0:0]
+    if "Name" in history_df.columns:
+        per_endpoint = history_df[history_df["Name"].astype(str).str.lower() != "aggregated"]
+    if not per_endpoint.empty and "Total Failure Count" in per_endpoint.columns:
+        labels = per_endpoint["Type"].astype(str) + " " + per_endpoint["Name"].astype(str)
+        for endpoint in endpoints[:5]:
+            ep = per_endpoint[labels == endpoint]
+            if ep.empty:
+                continue
+            ts = parse_history_timestamps(ep["Timestamp"])
+            order = ts.argsort()
+            ts = ts.iloc[order]
+            counts = pd.to_numeric(ep["Total Failure Count"], errors="coerce").iloc[order]
+            dt = ts.diff().dt.total_seconds().where(lambda d: d > 0)
+            fig.add_trace(
+                go.Scatter(
+                    x=(ts - start).dt.total_seconds(),
+                    y=(counts.diff() / dt).fillna(0).clip(lower=0),
+                    name=endpoint,
+                    mode="lines",
+                )
+            )
+
+    for label, value, color in [("first seen", first_seen, "#f39c12"), ("last seen", last_seen, "#7f8c8d")]:
+        if value:
+            ts = pd.to_datetime(value, utc=True)
+            fig.add_vline(
+                x=(ts - start).total_seconds(),
+                line_dash="dash",
+                line_color=color,
+                annotation_text=label,
+                annotation_position="top left",
+            )
+
+    fig.update_layout(
+        height=350,
+        hovermode="x unified",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(l=20, r=20, t=40, b=20),
+        yaxis_title="Failures/second",
+    )
+    fig.update_xaxes(title_text="Time (seconds)", gridcolor="rgba(128,128,128,0.2)")
+    fig.update_yaxes(gridcolor="rgba(128,128,128,0.2)")
+    st.plotly_chart(fig, use_container_width=True)
@@ -8,6 +8,16 @@ from app.ui.tabs.dashboard_tab import render_dashboard_tab
 from app.ui.tabs.history_tab import render_history_tab
 from app.ui.tabs.setup_tab import render_setup_tab
 from app.ui.auth import check_password
+from app.ui.perf import timed_panel, render_timings_overlay
+
+# Only the selected view is rendered on each rerun; st.tabs would execute all of them.
+VIEWS = {
+    "Run Test": lambda: render_run_tab(BASE_DIR),
+    "View Reports": lambda: render_reporting_tab(BASE_DIR),
+    "Global Dashboard": render_dashboard_tab,
+    "History Runs": render_history_tab,
+    "Setup": render_setup_tab,
+}
 
 def main():
     if not check_password():
@@ -16,30 +26,19 @@ def main():
     st.set_page_config(page_title="Locust Web - Streamlit", layout="wide")
     st.title("Locust Load Tests - Streamlit Interface")
 
-    tabs = st.tabs(
-        [
-            "Run Test",
-            "View Reports",
-            "Global Dashboard",
-            "History Runs",
-            "Setup",
-        ]
+    view = st.radio(
+        "View",
+        options=list(VIEWS.keys()),
+        horizontal=True,
+        key="active_view",
+        label_visibility="collapsed",
     )
+    st.divider()
 
-    with tabs[0]:
-        render_run_tab(BASE_DIR)
-
-    with tabs[1]:
-        render_reporting_tab(BASE_DIR)
-
-    with tabs[2]:
-        render_dashboard_tab()
-
-    with tabs[3]:
-        render_history_tab()
+    with timed_panel(view):
+        VIEWS[view]()
 
-    with tabs[4]:
-        render_setup_tab()
+    render_timings_overlay()
 
 
 if __name__ == "__main__":
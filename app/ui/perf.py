@@ -0,0 +1,73 @@
+import functools
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+
+_TIMINGS_KEY = "panel_timings"
+
+
+@contextmanager
+def timed_panel(name: str):
+    """Measure how long a panel takes to render and keep the figure in session state."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        timings = st.session_state.setdefault(_TIMINGS_KEY, {})
+        entry = timings.setdefault(name, {"last_ms": 0.0, "total_ms": 0.0, "renders": 0})
+        entry["last_ms"] = elapsed_ms
+        entry["total_ms"] += elapsed_ms
+        entry["renders"] += 1
+        entry["at"] = time.strftime("%H:%M:%S")
+
+
+def timed(name: str):
+    """Decorator form of timed_panel, handy for fragment functions."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed_panel(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def debug_timings_enabled() -> bool:
+    from app.core.settings import settings
+
+    return settings.ui_debug_timings or st.query_params.get("debug") == "1"
+
+
+@st.fragment(run_every=2)
+def _timings_overlay():
+    timings = st.session_state.get(_TIMINGS_KEY, {})
+    if not timings:
+        st.caption("No panels rendered yet.")
+        return
+    df = pd.DataFrame(
+        [
+            {
+                "Panel": name,
+                "Last (ms)": round(t["last_ms"], 1),
+                "Avg (ms)": round(t["total_ms"] / t["renders"], 1),
+                "Renders": t["renders"],
+                "At": t.get("at"),
+            }
+            for name, t in timings.items()
+        ]
+    ).sort_values("At", ascending=False)
+    st.dataframe(df, hide_index=True, use_container_width=True)
+    if st.button("Reset timings", key="reset_panel_timings"):
+        st.session_state[_TIMINGS_KEY] = {}
+
+
+def render_timings_overlay():
+    """Sidebar overlay listing per-panel render timings (UI_DEBUG_TIMINGS=true or ?debug=1)."""
+    if not debug_timings_enabled():
+        return
+    with st.sidebar:
+        st.markdown("**⏱️ Render timings**")
+        _timings_overlay()
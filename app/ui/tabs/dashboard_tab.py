@@ -1,8 +1,10 @@
 
-import json
 import pandas as pd
 import streamlit as st
-from app.core.data import list_runs, load_stats_cached, run_signature
+from app.core.data import collect_run_summaries_cached, runs_signature
+from app.core.trends import TREND_METRICS, compute_trends, flagged_runs
+from app.ui.charts import render_trend_chart
+from app.ui.perf import timed_panel
 
 def render_dashboard_tab():
     st.subheader("📊 Global Dashboard")
@@ -11,98 +13,21 @@ def render_dashboard_tab():
     You can compare different hosts and test files, view performance trends.
     """)
 
-    def _first_col(df: pd.DataFrame, candidates: list[str]):
-        for c in candidates:
-            if c in df.columns:
-                return c
-        return None
-
-    def _try_number(val, default=None):
-        try:
-            if pd.isna(val):
-                return default
-            return float(val)
-        except Exception:
-            return default
-
-    # Collect run summaries
-    summaries = []
-    for r in list_runs():
-        meta = {}
-        mp = r / "metadata.json"
-        if mp.exists():
-            try:
-                meta = json.loads(mp.read_text(encoding="utf-8"))
-            except Exception:
-                meta = {}
-        data = load_stats_cached(str(r), "stats", run_signature(r))
-        agg = None
-        if "stats" in data and not data["stats"].empty:
-            sdf = data["stats"]
-            name_col = _first_col(sdf, ["Name", "name"]) or "Name"
-            agg_rows = (
-                sdf[sdf[name_col].astype(str).str.lower() == "aggregated"]
-                if name_col in sdf.columns
-                else pd.DataFrame()
-            )
-            if not agg_rows.empty:
-                agg = agg_rows.iloc[0]
-
-        if agg is None:
-            continue
-
-        # Extract values with multiple possible column names
-        req_count = _try_number(agg.get("Request Count", agg.get("Requests", 0)), 0)
-        fail_count = _try_number(
-            agg.get("Failure Count", agg.get("Failures", 0)), 0
-        )
-        median = _try_number(
-            agg.get("50%ile", agg.get("Median Response Time", agg.get("50%", None)))
-        )
-        p95 = _try_number(agg.get("95%ile", agg.get("95%", None)))
-
-        # Average RPS from history if available
-        avg_rps = None
-        if "history" in data and not data["history"].empty:
-            hdf = data["history"]
-            rps_col = _first_col(hdf, ["Requests/s", "RPS", "requests/s"])
-            if rps_col:
-                try:
-                    avg_rps = float(hdf[rps_col].astype(float).mean())
-                except Exception:
-                    avg_rps = None
-
-        summaries.append(
-            {
-                "run_id": r.name,
-                "path": str(r),
-                "locustfile": meta.get("locustfile"),
-                "host": meta.get("effective_host")
-                or meta.get("typed_host")
-                or meta.get("file_host"),
-                "started_at": meta.get("started_at"),
-                "ended_at": meta.get("ended_at"),
-                "users": meta.get("users"),
-                "spawn_rate": meta.get("spawn_rate"),
-                "run_time": meta.get("run_time"),
-                "requests": req_count,
-                "failures": fail_count,
-                "success_rate": (1 - fail_count / req_count) * 100
-                if req_count and req_count > 0
-                else None,
-                "median_ms": median,
-                "p95_ms": p95,
-                "avg_rps": avg_rps,
-            }
-        )
+    # Collect run summaries (cached until any run directory changes)
+    summaries = collect_run_summaries_cached(runs_signature())
 
     if not summaries:
         st.info(
             "📭 Henüz metadata'lı bir çalışma bulunamadı. 'Test Çalıştır' sekmesinden yeni bir test başlatın."
         )
     else:
-        df = pd.DataFrame(summaries)
+        _render_dashboard_body(pd.DataFrame(summaries))
+
 
+@st.fragment
+def _render_dashboard_body(df: pd.DataFrame):
+    """Filters, KPIs and charts; reruns on its own when a filter changes."""
+    with timed_panel("Dashboard: filters & charts"):
         # Filters with help text
         st.markdown("### 🔍 Filters")
         c1, c2, c3 = st.columns([2, 2, 2])
@@ -326,3 +251,64 @@ def render_dashboard_tab():
                     st.plotly_chart(fig2, use_container_width=True)
                 except Exception:
                     pass
+
+            st.divider()
+            _render_trends(fdf)
+
+
+TREND_LABELS = {
+    "p95_ms": "p95 (ms)",
+    "avg_rps": "Avg RPS",
+    "failure_rate": "Failure rate",
+}
+
+
+def _render_trends(fdf: pd.DataFrame):
+    """Per host/locustfile run history with rolling baselines and regression flags."""
+    st.markdown("### 📉 Performance Trends")
+    st.caption(
+        "Runs are ordered by start time for each server and test file. Each run is compared "
+        "against the preceding runs; significant shifts are flagged as regressions or improvements."
+    )
+    c1, c2 = st.columns(2)
+    with c1:
+        window = st.number_input(
+            "Baseline window (runs)", min_value=2, max_value=50, value=5,
+            help="How many previous runs form the baseline",
+        )
+    with c2:
+        z_threshold = st.number_input(
+            "Significance threshold (z)", min_value=1.0, max_value=10.0, value=3.0, step=0.5,
+            help="Shifts at or beyond this many standard errors are flagged",
+        )
+
+    trends = compute_trends(fdf, window=int(window), z_threshold=float(z_threshold))
+    if trends.empty:
+        st.info("No runs with a start time to build trends from.")
+        return
+
+    flagged = flagged_runs(trends)
+    if flagged.empty:
+        st.success("✅ No significant shifts detected.")
+    else:
+        st.warning(f"⚠️ {len(flagged)} run(s) with significant shifts")
+        cols = ["started_at", "run_id", "host", "locustfile"]
+        for metric in TREND_METRICS:
+            cols += [metric, f"{metric}_baseline", f"{metric}_flag"]
+        st.dataframe(flagged[cols], use_container_width=True, hide_index=True)
+
+    pairs = (
+        trends[["host", "locustfile"]]
+        .drop_duplicates()
+        .apply(lambda r: f"{r['host']} | {r['locustfile']}", axis=1)
+        .tolist()
+    )
+    sel_pair = st.selectbox("Server | Test File", options=pairs)
+    pair_df = trends[
+        trends.apply(lambda r: f"{r['host']} | {r['locustfile']}", axis=1) == sel_pair
+    ]
+    metric_tabs = st.tabs(list(TREND_LABELS.values()))
+    for tab, (metric, label) in zip(metric_tabs, TREND_LABELS.items()):
+        with tab:
+            render_trend_chart(pair_df, metric, label)
+
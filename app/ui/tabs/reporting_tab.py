@@ -1,13 +1,35 @@
 
 import shutil
 import json
+import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
 from datetime import datetime
+from pathlib import Path
 from app.core.config import RUNS_DIR
 from app.core.runner import display_path
-from app.core.data import list_runs, load_stats_cached, run_signature, create_run_zip
-from app.ui.charts import render_summary_from_stats, render_time_series
+from app.core.data import (
+    list_runs,
+    load_stats_cached,
+    run_signature,
+    create_run_zip_cached,
+    load_report_html_cached,
+    load_report_summary_cached,
+    load_change_points_cached,
+    load_failure_index_cached,
+    load_run_meta,
+)
+from app.core.report_server import start_report_server, report_url
+from app.core.slo import format_check
+from app.ui.charts import (
+    render_summary_from_stats,
+    render_corrected_percentiles,
+    render_phase_breakdown,
+    render_time_series,
+    render_change_points,
+    render_failure_timeline,
+)
+from app.ui.perf import timed_panel
 
 def render_reporting_tab(base_dir):
     st.subheader("View Reports")
@@ -18,9 +40,6 @@ def render_reporting_tab(base_dir):
         run_opts = [display_path(p, RUNS_DIR) for p in runs]
         sel = st.selectbox("Select a run", run_opts)
         selected_run = RUNS_DIR / sel
-        data = load_stats_cached(
-            str(selected_run), "stats", run_signature(selected_run)
-        )
 
         # Üst bilgi (metadata)
         meta_path = selected_run / "metadata.json"
@@ -35,9 +54,52 @@ def render_reporting_tab(base_dir):
                 st.caption(
                     f"Locustfile: {meta.get('locustfile')} | Start: {meta.get('started_at')} | End: {meta.get('ended_at')}"
                 )
+                lag = meta.get("arrival_lag")
+                if meta.get("target_rps") or lag:
+                    text = f"Open model | Target RPS: {meta.get('target_rps') or 'per class'}"
+                    if lag:
+                        text += (
+                            f" | Schedule lag p95: {lag['p95_lag_ms']:.0f} ms, max: {lag['max_lag_ms']:.0f} ms"
+                            f" | Late (>{lag['late_threshold_ms']} ms): {lag['late_ratio']:.1%}"
+                        )
+                    st.caption(text)
+                slo = meta.get("slo")
+                if slo:
+                    failed = [c for c in slo["checks"] if not c["passed"]]
+                    text = f"SLO verdict: {slo['status']} ({len(slo['checks']) - len(failed)}/{len(slo['checks'])} checks met)"
+                    if slo["aborted"]:
+                        text += f" | Stopped early: {slo['abort_reason']}"
+                    elif failed:
+                        text += " | " + "; ".join(format_check(c) for c in failed)
+                    (st.success if slo["status"] == "PASSED" else st.error)(text)
             except Exception:
                 pass
 
+        _render_downloads(selected_run)
+
+        # Delete run section
+        st.divider()
+        with st.expander("🗑️ Delete Run", expanded=False):
+            st.warning(f"**{selected_run.name}** directory and all its contents will be deleted!")
+            confirm_delete = st.checkbox(
+                "I'm sure I want to delete this", key="confirm_delete"
+            )
+            if st.button(
+                "🗑️ Permanently Delete", type="primary", disabled=not confirm_delete
+            ):
+                try:
+                    shutil.rmtree(selected_run)
+                    st.success("Run deleted! Page will reload...")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Delete error: {e}")
+
+        _render_run_details(selected_run)
+
+
+@st.fragment
+def _render_downloads(selected_run: Path):
+    with timed_panel("Reports: downloads"):
         # Download buttons
         st.divider()
         dl_cols = st.columns(4)
@@ -45,7 +107,9 @@ def render_reporting_tab(base_dir):
         # ZIP download (all files)
         with dl_cols[0]:
             try:
-                zip_data = create_run_zip(selected_run)
+                zip_data = create_run_zip_cached(
+                    str(selected_run), run_signature(selected_run)
+                )
                 st.download_button(
                     "📦 Download All (ZIP)",
                     data=zip_data,
@@ -100,47 +164,189 @@ def render_reporting_tab(base_dir):
             else:
                 st.button("📝 Log Unavailable", disabled=True, use_container_width=True)
 
-        # Delete run section
-        st.divider()
-        with st.expander("🗑️ Delete Run", expanded=False):
-            st.warning(f"**{selected_run.name}** directory and all its contents will be deleted!")
-            confirm_delete = st.checkbox(
-                "I'm sure I want to delete this", key="confirm_delete"
-            )
-            if st.button(
-                "🗑️ Permanently Delete", type="primary", disabled=not confirm_delete
-            ):
-                try:
-                    shutil.rmtree(selected_run)
-                    st.success("Run deleted! Page will reload...")
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"Delete error: {e}")
 
-        # Sub-tabs: Summary/CSV and Locust Test Report
-        sub_tabs = st.tabs(["Summary", "Locust Test Report"])
+@st.fragment
+def _render_run_details(selected_run: Path):
+    with timed_panel("Reports: summary & report"):
+        data = load_stats_cached(
+            str(selected_run), "stats", run_signature(selected_run)
+        )
+
+        # Sub-tabs: Summary/CSV, Failures and Locust Test Report
+        sub_tabs = st.tabs(["Summary", "Failures", "Locust Test Report"])
+
+        warmup = load_run_meta(selected_run).get("warmup_window")
 
         with sub_tabs[0]:
+            if warmup:
+                st.caption(
+                    f"Steady state only: warm-up of {warmup['duration_s']:.0f}s ({warmup['reason']}, "
+                    f"{warmup['requests']} requests) excluded"
+                )
             if "stats" in data and not data["stats"].empty:
                 render_summary_from_stats(data["stats"])
+                if "corrected" in data and not data["corrected"].empty:
+                    render_corrected_percentiles(data["corrected"])
                 st.divider()
                 st.caption("Detailed request statistics")
                 st.dataframe(data["stats"], use_container_width=True, height=300)
 
+            if "warmup" in data and not data["warmup"].empty:
+                with st.expander("Warm-up statistics (excluded)", expanded=False):
+                    st.dataframe(data["warmup"], use_container_width=True, height=250)
+
+            if "phases" in data and not data["phases"].empty:
+                st.divider()
+                st.markdown("### 🧩 Request Phases")
+                render_phase_breakdown(data["phases"])
+
             if "history" in data and not data["history"].empty:
                 st.divider()
-                render_time_series(data["history"])
+                change_points = load_change_points_cached(
+                    str(selected_run), "stats", run_signature(selected_run)
+                )
+                render_time_series(
+                    data["history"], change_points, warmup["ended_at"] if warmup else None
+                )
+                st.markdown("### 🔀 Change Points")
+                render_change_points(change_points)
 
         with sub_tabs[1]:
+            render_failure_explorer(selected_run, data.get("history"))
+
+        with sub_tabs[2]:
             html_path = selected_run / "report.html"
             if html_path.exists():
-                st.caption("Locust HTML Report")
-                try:
-                    html = html_path.read_text(encoding="utf-8")
-                    components.html(html, height=700, scrolling=True)
-                except Exception:
-                    st.write(f"HTML report: {html_path}")
+                render_locust_report(selected_run, html_path)
             else:
                 st.info(
                     "HTML report not found. Enable 'Generate HTML report' option."
                 )
+
+
+def render_failure_explorer(run_dir: Path, history_df):
+    """Failures, exceptions and log errors grouped by fingerprint."""
+    index = load_failure_index_cached(str(run_dir), "stats", run_signature(run_dir))
+    fingerprints = index.get("fingerprints", [])
+    if not fingerprints:
+        st.success("✅ No failures, exceptions or logged errors in this run.")
+        return
+
+    kinds = pd.Series([fp["kind"] for fp in fingerprints])
+    cols = st.columns(4)
+    cols[0].metric("Failures", f"{index.get('total_failures', 0)}")
+    cols[1].metric("Failure fingerprints", str(int((kinds == "failure").sum())))
+    cols[2].metric("Exception fingerprints", str(int((kinds == "exception").sum())))
+    cols[3].metric("Log error fingerprints", str(int((kinds == "log").sum())))
+    if index.get("log_overflow"):
+        st.caption(f"{index['log_overflow']} log lines beyond the fingerprint cap were not indexed.")
+
+    c1, c2 = st.columns([1, 3])
+    with c1:
+        sel_kinds = st.multiselect(
+            "Source",
+            options=["failure", "exception", "log"],
+            default=["failure", "exception"],
+            key=f"failure_kinds_{run_dir.name}",
+        )
+    with c2:
+        query = st.text_input(
+            "Search", key=f"failure_query_{run_dir.name}", placeholder="Filter by message or endpoint"
+        )
+
+    rows = [
+        fp for fp in fingerprints
+        if fp["kind"] in sel_kinds
+        and (
+            not query
+            or query.lower() in fp["fingerprint"].lower()
+            or any(query.lower() in ep.lower() for ep in fp["endpoints"])
+        )
+    ]
+    if not rows:
+        st.info("No fingerprints match the filters.")
+        return
+
+    table = pd.DataFrame(
+        [
+            {
+                "Count": fp["count"],
+                "Source": fp["kind"],
+                "Fingerprint": fp["fingerprint"],
+                "Endpoints": ", ".join(list(fp["endpoints"])[:3])
+                + (" …" if len(fp["endpoints"]) > 3 else ""),
+                "First seen": fp["first_seen"],
+                "Last seen": fp["last_seen"],
+            }
+            for fp in rows
+        ]
+    )
+    st.dataframe(table, use_container_width=True, hide_index=True, height=300)
+
+    labels = [f"[{fp['count']}] {fp['fingerprint'][:120]}" for fp in rows]
+    choice = st.selectbox("Inspect fingerprint", options=range(len(rows)), format_func=labels.__getitem__)
+    fp = rows[choice]
+    with st.expander("Endpoints and sample", expanded=True):
+        st.dataframe(
+            pd.DataFrame(list(fp["endpoints"].items()), columns=["Endpoint", "Count"]),
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.code(fp["sample"])
+
+    if history_df is not None and not history_df.empty:
+        st.markdown("### 📉 Failures over time")
+        endpoints = list(fp["endpoints"]) if fp["kind"] == "failure" else []
+        render_failure_timeline(history_df, endpoints, fp["first_seen"], fp["last_seen"])
+
+
+@st.cache_resource(show_spinner=False)
+def _report_server(root: str, host: str, port: int):
+    return start_report_server(Path(root), host, port)
+
+
+def render_locust_report(run_dir: Path, html_path: Path):
+    """Render the Locust HTML report only when the user asks for it.
+    Served through the report file server when configured; otherwise inlined if
+    small enough, falling back to a slim summary for large reports.
+    """
+    from app.core.settings import settings
+
+    size_mb = html_path.stat().st_size / (1024 * 1024)
+    st.caption(f"Locust HTML Report ({size_mb:.1f} MB)")
+    if not st.toggle("Open report", key=f"open_report_{run_dir.name}"):
+        return
+
+    if settings.report_server_port:
+        try:
+            _report_server(
+                str(RUNS_DIR), settings.report_server_host, settings.report_server_port
+            )
+        except OSError as e:
+            st.warning(f"Report server unavailable: {e}")
+
+    base_url = settings.report_base_url
+    if base_url:
+        components.iframe(
+            report_url(base_url, run_dir, RUNS_DIR), height=700, scrolling=True
+        )
+        return
+
+    sig = run_signature(run_dir)
+    if size_mb <= settings.report_inline_max_mb:
+        try:
+            html = load_report_html_cached(str(html_path), sig)
+            components.html(html, height=700, scrolling=True)
+        except Exception:
+            st.write(f"HTML report: {html_path}")
+        return
+
+    st.info(
+        f"Report is larger than {settings.report_inline_max_mb:g} MB, showing a slim summary. "
+        "Use the 'HTML Report' download or set REPORT_SERVER_PORT to view the full report."
+    )
+    components.html(
+        load_report_summary_cached(str(run_dir), "stats", sig),
+        height=500,
+        scrolling=True,
+    )
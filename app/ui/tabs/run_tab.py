@@ -4,6 +4,11 @@ import json
 from datetime import datetime
 import streamlit as st
 from app.core.config import RUNS_DIR
+from app.core.connection_profiles import load_profiles
+from app.core.postrun import finalize_run
+from app.core.rp_artifacts import schedule_artifact_upload
+from app.core.slo import DEFAULT_SLOS, EXIT_CODE_SLO_FAILED, format_check, parse_slo_spec
+from app.core.warmup import parse_warmup
 from app.core.runner import (
     which_locust,
     list_locustfiles,
@@ -12,7 +17,28 @@ from app.core.runner import (
     extract_locustfile_host,
     run_locust
 )
+from app.ui.perf import timed
 
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_locustfiles_cached():
+    return list_locustfiles()
+
+
+def default_slo_text() -> str:
+    """LOCUST_SLO_FILE's contents, or the default SLOs as JSON."""
+    from app.core.settings import settings
+
+    if settings.locust_slo_file:
+        try:
+            return settings.locust_slo_file.read_text(encoding="utf-8")
+        except OSError:
+            pass
+    return json.dumps(DEFAULT_SLOS.as_dict(), indent=2)
+
+
+@st.fragment
+@timed("Run Test: form")
 def render_run_tab(base_dir):
     st.subheader("Run Locust Test")
 
@@ -21,7 +47,7 @@ def render_run_tab(base_dir):
             "'locust' command not found. Please install dependencies with 'pip install -r requirements.txt'."
         )
 
-    locustfiles = list_locustfiles()
+    locustfiles = list_locustfiles_cached()
     choices = [display_path(p, base_dir) for p in locustfiles]
     selected_file = st.selectbox(
         "Locust file", options=choices, index=0 if choices else None
@@ -37,6 +63,7 @@ def render_run_tab(base_dir):
     
     default_users = settings.locust_users
     default_spawn = settings.locust_spawn_rate
+    default_target_rps = settings.locust_target_rps
     default_run_time = settings.locust_run_time
     default_csv_prefix = settings.locust_csv_prefix
     
@@ -66,10 +93,29 @@ def render_run_tab(base_dir):
         f"Etkin host: {effective_host if effective_host else '—'}"
         + (" (from file)" if use_file_host and file_host_val else "")
     )
+    load_model = st.radio(
+        "Load model",
+        options=["Users", "Target RPS"],
+        index=1 if default_target_rps else 0,
+        horizontal=True,
+        help="Target RPS sends requests on a fixed schedule (open model); "
+        "the user count then only caps concurrency.",
+    )
+    target_rps = None
+    if load_model == "Target RPS":
+        target_rps = st.number_input(
+            "Target RPS (total)",
+            min_value=0.1,
+            value=float(default_target_rps or 10.0),
+            help="Requests/s across all users and workers. Keep enough users "
+            "to cover RPS x response time, or requests fall behind schedule.",
+        )
     col1, col2, col3 = st.columns(3)
     with col1:
         users = st.number_input(
-            "User count (-u)", min_value=1, value=default_users
+            "User count (-u)" if target_rps is None else "Max concurrent users (-u)",
+            min_value=1,
+            value=default_users,
         )
     with col2:
         spawn = st.number_input(
@@ -104,6 +150,78 @@ def render_run_tab(base_dir):
             value=False,
             help="Performance improves when disabled, logs can be viewed from file.",
         )
+        co_correction = st.checkbox(
+            "Correct for coordinated omission",
+            value=settings.locust_co_correction,
+            help="Also records latency as if requests had been sent on schedule "
+            "during stalls; the report shows raw and corrected p95/p99.",
+        )
+        profiles = load_profiles(settings.locust_connection_profiles)
+        profile_names = list(profiles)
+        connection_profile = st.selectbox(
+            "Connection profile",
+            options=profile_names,
+            index=(
+                profile_names.index(settings.locust_connection_profile)
+                if settings.locust_connection_profile in profile_names
+                else 0
+            ),
+            help="How users pool and reuse connections (timeouts, pool size, "
+            "keep-alive, TLS resumption, DNS caching).",
+        )
+        st.caption(profiles[connection_profile].description)
+        warmup_mode = st.selectbox(
+            "Warm-up",
+            options=["None", "Until ramp-up completes", "Fixed time"],
+            index=(
+                0
+                if not settings.locust_warmup
+                else 1 if settings.locust_warmup == "rampup" else 2
+            ),
+            help="Statistics recorded during warm-up are saved separately "
+            "(warmup_stats.csv) and then reset, so reports show the steady state.",
+        )
+        warmup = None
+        if warmup_mode == "Until ramp-up completes":
+            warmup = "rampup"
+        elif warmup_mode == "Fixed time":
+            warmup = st.text_input(
+                "Warm-up time",
+                value=(
+                    settings.locust_warmup
+                    if settings.locust_warmup and settings.locust_warmup != "rampup"
+                    else "60s"
+                ),
+                help="Same format as the run time, e.g. 60s or 2m.",
+            ).strip() or None
+        warmup_error = None
+        if warmup_mode == "Fixed time":
+            try:
+                parse_warmup(warmup or "")
+            except ValueError as e:
+                warmup_error = str(e)
+                st.error(f"Invalid warm-up time: {warmup_error}")
+        phase_timings = st.checkbox(
+            "Record HTTP phase timings",
+            value=settings.locust_phase_timings,
+            help="DNS, connect, TLS, time to first byte and download per endpoint "
+            "(FastHttpUser); shown as a breakdown in the Reporting tab.",
+        )
+        slo_text = st.text_area(
+            "SLOs (JSON)",
+            value=default_slo_text(),
+            height=220,
+            help="Per-endpoint p95/p99/avg latency, failure ratio and minimum RPS, "
+            "evaluated on rolling windows during the test; abort_after > 0 stops "
+            "the run after that many breaching windows in a row. The final verdict "
+            "sets the exit code and the ReportPortal status.",
+        )
+        slo_error = None
+        try:
+            parse_slo_spec(json.loads(slo_text))
+        except ValueError as e:
+            slo_error = str(e)
+            st.error(f"Invalid SLOs: {slo_error}")
 
         st.divider()
         st.markdown("**🔗 ReportPortal Integration**")
@@ -142,6 +260,8 @@ def render_run_tab(base_dir):
             which_locust() is None
             or not selected_file
             or (not use_file_host and not host and not file_host_val)
+            or slo_error is not None
+            or warmup_error is not None
         ),
     )
 
@@ -157,6 +277,8 @@ def render_run_tab(base_dir):
         st.session_state["running"] = True
 
         locustfile_path = base_dir / selected_file  # type: ignore
+        slo_file = run_dir / "slo.json"
+        slo_file.write_text(slo_text, encoding="utf-8")
 
         # Set ReportPortal env vars if enabled
         if enable_rp:
@@ -196,6 +318,12 @@ def render_run_tab(base_dir):
             ),
             stream_logs=stream_logs,
             enable_rp=enable_rp,
+            target_rps=target_rps,
+            co_correction=co_correction,
+            phase_timings=phase_timings,
+            connection_profile=connection_profile,
+            slo_file=slo_file,
+            warmup=warmup,
         )
 
         log_lines = []
@@ -233,14 +361,20 @@ def render_run_tab(base_dir):
             "effective_host": effective_host,
             "users": int(users),
             "spawn_rate": float(spawn),
+            "target_rps": float(target_rps) if target_rps else None,
             "run_time": run_time,
             "csv_prefix": csv_prefix,
             "html_report": bool(html_report),
             "csv_full_history": bool(csv_full_history),
+            "co_correction": bool(co_correction),
+            "phase_timings": bool(phase_timings),
+            "warmup": warmup,
+            "connection_profile": profiles[connection_profile].as_dict(),
             "started_at": start,
             "ended_at": ended,
             "command": " ".join(cmd),
         }
+        meta = finalize_run(run_dir, meta)
         try:
             (run_dir / "metadata.json").write_text(
                 json.dumps(meta, indent=2), encoding="utf-8"
@@ -248,14 +382,32 @@ def render_run_tab(base_dir):
         except Exception:
             pass
 
-        if rc != 0:
-            # try to show the last lines to aid debugging
+        # Attach artifacts to the RP launch in the background; never blocks the UI
+        if enable_rp and settings.rp_upload_artifacts and rp_token:
+            schedule_artifact_upload(
+                run_dir,
+                rp_token,
+                retries=settings.rp_upload_retries,
+                workers=settings.rp_upload_workers,
+            )
+
+        slo = meta.get("slo")
+        slo_message = ""
+        if slo and slo["status"] == "FAILED":
+            failed = [c for c in slo["checks"] if not c["passed"]]
+            reason = slo["abort_reason"] or "; ".join(format_check(c) for c in failed)
+            slo_message = f"SLO verdict: FAILED{' (stopped early)' if slo['aborted'] else ''}. {reason}\n"
+        if rc != 0 and (rc != EXIT_CODE_SLO_FAILED or not slo_message):
+            # Locust itself failed (e.g. crashing tasks): show the last lines to aid debugging
             try:
                 shown = "\n".join(log_lines[-50:]) if log_lines else ""
             except Exception:
                 shown = ""
             status_area.error(
-                f"Failed with errors (exit={rc}). Run directory: {run_dir}\n{shown}"
+                f"Failed with errors (exit={rc}). {slo_message}Run directory: {run_dir}\n{shown}"
             )
+        elif slo_message:
+            status_area.error(f"{slo_message}Run directory: {run_dir}")
         else:
-            status_area.success(f"Completed. Run directory: {run_dir}")
+            verdict = f" SLO verdict: {slo['status']}." if slo else ""
+            status_area.success(f"Completed.{verdict} Run directory: {run_dir}")
@@ -0,0 +1,125 @@
+"""
+Arrival-rate accuracy check.
+Runs a reference locustfile through run_locust with a target rate against the
+local stub target, with many more users than the rate (as the open model
+expects), and checks two things:
+
+- no start-up burst: at most rate x run time (+1 slot) requests in total; Locust's
+  run time also covers its own start-up, so a paced run records slightly fewer
+- steady rate: requests per second over the run's history, within a tolerance
+
+    python -m benchmarks.arrival_accuracy --target-rps 5 --users 50 --duration-s 10
+"""
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from app.core.runner import run_locust
+from benchmarks.stub_target import StubTargetServer
+
+REFERENCE_DIR = Path(__file__).resolve().parent / "reference_locustfiles"
+
+
+def _aggregated(df: pd.DataFrame) -> pd.DataFrame:
+    return df[df["Name"].astype(str) == "Aggregated"]
+
+
+def run(
+    locustfile: Optional[Path] = None,
+    target_rps: float = 5.0,
+    users: int = 50,
+    duration_s: int = 10,
+    tolerance: float = 0.1,
+    output: Optional[Path] = None,
+) -> Dict[str, Any]:
+    locustfile = Path(locustfile or REFERENCE_DIR / "plain_get.py")
+    if target_rps <= 0 or duration_s <= 0:
+        raise ValueError("target_rps and duration_s must be > 0")
+
+    stub = StubTargetServer().start()
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench_arrival_") as tmp:
+            run_dir = Path(tmp)
+            proc, *_ = run_locust(
+                locustfile,
+                stub.url,
+                users,
+                users,
+                f"{duration_s}s",
+                run_dir,
+                html_report=False,
+                stream_logs=False,
+                target_rps=target_rps,
+            )
+            proc.wait(timeout=duration_s + 60)
+            stats = _aggregated(pd.read_csv(run_dir / "stats_stats.csv"))
+            history = _aggregated(pd.read_csv(run_dir / "stats_stats_history.csv"))
+            lag_file = run_dir / "arrival_lag.json"
+            lag = json.loads(lag_file.read_text(encoding="utf-8")) if lag_file.exists() else None
+    finally:
+        stub.stop()
+
+    recorded = int(stats.iloc[0]["Request Count"])
+    max_expected = target_rps * duration_s + 1
+    # From the first row with requests, so spawning does not count as idle time
+    active = history[history["Total Request Count"] > 0]
+    span_s = float(active["Timestamp"].iloc[-1] - active["Timestamp"].iloc[0]) if len(active) > 1 else 0.0
+    steady_rps = (
+        float(active["Total Request Count"].iloc[-1] - active["Total Request Count"].iloc[0]) / span_s
+        if span_s else None
+    )
+    results = {
+        "params": {
+            "locustfile": str(locustfile),
+            "target_rps": target_rps,
+            "users": users,
+            "duration_s": duration_s,
+            "tolerance": tolerance,
+        },
+        "exit_code": proc.returncode,
+        "recorded_requests": recorded,
+        # One slot of slack: the timeline starts with a slot at t=0
+        "max_expected_requests": max_expected,
+        "steady_rps": round(steady_rps, 3) if steady_rps is not None else None,
+        "ok": (
+            recorded <= max_expected
+            and steady_rps is not None
+            and abs(steady_rps - target_rps) <= tolerance * target_rps
+        ),
+        "arrival_lag": lag,
+    }
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Request count and steady rate of an arrival-rate run")
+    parser.add_argument("--locustfile", type=Path, default=None,
+                        help="Locustfile to pace (default: benchmarks/reference_locustfiles/plain_get.py)")
+    parser.add_argument("--target-rps", type=float, default=5.0)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--duration-s", type=int, default=10)
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed relative deviation of the steady rate")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = run(
+        locustfile=args.locustfile,
+        target_rps=args.target_rps,
+        users=args.users,
+        duration_s=args.duration_s,
+        tolerance=args.tolerance,
+        output=args.output,
+    )
+    print(json.dumps(results, indent=2))
+    sys.exit(0 if results["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Data-layer benchmark.
+Generates a synthetic RUNS_DIR (see synthetic_runs.py) and measures how the
+app/core/data.py entry points and each tab's data preparation scale with it:
+
+- entry points: list_runs, runs_signature, run_signature, load_stats,
+  load_run_meta, summarize_run, build_report_summary_html, create_run_zip
+  (per-run ones on a typical and on a large run)
+- tab paths: Dashboard (summaries of every run + trends, cold and cached),
+  Reporting (stats, change points and failure index of one run), History
+  (run listing with per-run file checks)
+
+Each case reports wall time over several repeats (Streamlit caches cleared
+before each repeat unless the case is marked cached) and peak traced memory
+(tracemalloc, separate pass).
+
+    python -m benchmarks.data_layer --runs 2000 --large-history-s 14400 \\
+        --large-endpoints 200 --output data_layer.json
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from benchmarks.synthetic_runs import add_generate_args, generate_runs
+
+
+def _measure(call: Callable[[], Any], repeats: int, before: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    times = []
+    for _ in range(repeats):
+        if before:
+            before()
+        gc.collect()
+        start = time.perf_counter()
+        call()
+        times.append((time.perf_counter() - start) * 1000)
+
+    if before:
+        before()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "best_ms": round(min(times), 2),
+        "median_ms": round(statistics.median(times), 2),
+        "peak_mb": round(peak / 1e6, 2),
+    }
+
+
+def run(
+    runs_dir: Optional[Path] = None,
+    repeats: int = 3,
+    output: Optional[Path] = None,
+    keep: bool = False,
+    **generate_kwargs,
+) -> Dict[str, Any]:
+    tmp = None
+    if runs_dir is None:
+        tmp = tempfile.mkdtemp(prefix="bench_runs_")
+        runs_dir = Path(tmp) / "runs"
+    dataset = generate_runs(runs_dir, **generate_kwargs)
+
+    # app.core.config resolves RUNS_DIR at import time
+    os.environ["RUNS_DIR"] = str(runs_dir)
+    import pandas as pd
+    import streamlit as st
+
+    # Cached functions warn about the missing Streamlit runtime on every call
+    logging.getLogger("streamlit.runtime.caching.cache_data_api").setLevel(logging.ERROR)
+
+    from app.core import data
+    from app.core.changepoints import analyze_run
+    from app.core.failures import build_failure_index
+    from app.core.trends import compute_trends, flagged_runs
+
+    if data.RUNS_DIR.resolve() != Path(runs_dir).resolve():
+        raise RuntimeError(f"app.core was imported before RUNS_DIR was set ({data.RUNS_DIR})")
+
+    clear = st.cache_data.clear
+    typical = Path(dataset["typical_run"]) if dataset["typical_run"] else None
+    large = Path(dataset["large_run"]) if dataset["large_run"] else None
+
+    def dashboard():
+        summaries = data.collect_run_summaries_cached(data.runs_signature())
+        trends = compute_trends(pd.DataFrame(summaries))
+        return flagged_runs(trends)
+
+    def reporting(run_dir: Path):
+        sig = data.run_signature(run_dir)
+        stats = data.load_stats_cached(str(run_dir), "stats", sig)
+        data.load_run_meta(run_dir)
+        data.load_change_points_cached(str(run_dir), "stats", sig)
+        data.load_failure_index_cached(str(run_dir), "stats", sig)
+        return stats
+
+    def history():
+        return [(any(r.glob("*_stats.csv")), (r / "report.html").exists()) for r in data.list_runs()]
+
+    cases: Dict[str, Callable[[], Dict[str, float]]] = {
+        "list_runs": lambda: _measure(data.list_runs, repeats),
+        "runs_signature": lambda: _measure(data.runs_signature, repeats),
+        "tab.dashboard": lambda: _measure(dashboard, repeats, before=clear),
+        "tab.dashboard.cached": lambda: _measure(dashboard, repeats),
+        "tab.history": lambda: _measure(history, repeats),
+    }
+    for label, run_dir in (("typical", typical), ("large", large)):
+        if run_dir is None:
+            continue
+        cases.update({
+            f"run_signature.{label}": lambda d=run_dir: _measure(lambda: data.run_signature(d), repeats),
+            f"load_stats.{label}": lambda d=run_dir: _measure(lambda: data.load_stats(d), repeats),
+            f"load_run_meta.{label}": lambda d=run_dir: _measure(lambda: data.load_run_meta(d), repeats),
+            f"summarize_run.{label}": lambda d=run_dir: _measure(lambda: data.summarize_run(d), repeats, before=clear),
+            f"build_report_summary_html.{label}": lambda d=run_dir: _measure(
+                lambda: data.build_report_summary_html(d), repeats
+            ),
+            f"create_run_zip.{label}": lambda d=run_dir: _measure(lambda: data.create_run_zip(d), repeats),
+            f"changepoints.analyze_run.{label}": lambda d=run_dir: _measure(lambda: analyze_run(d), repeats),
+            f"failures.build_failure_index.{label}": lambda d=run_dir: _measure(
+                lambda: build_failure_index(d), repeats
+            ),
+            f"tab.reporting.{label}": lambda d=run_dir: _measure(lambda: reporting(d), repeats, before=clear),
+        })
+
+    results: Dict[str, Any] = {
+        "params": {"repeats": repeats},
+        "dataset": dataset,
+        "environment": {
+            "python": sys.version.split()[0],
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": {},
+    }
+    for name, case in cases.items():
+        # Cached cases start from a warm cache
+        if name.endswith(".cached"):
+            dashboard()
+        results["results"][name] = case()
+
+    if tmp and not keep:
+        import shutil
+
+        shutil.rmtree(tmp, ignore_errors=True)
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Data-layer benchmark over a synthetic RUNS_DIR")
+    parser.add_argument("--runs-dir", type=Path, default=None, help="Generate into this directory (default: a temp dir)")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated temp dir")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    add_generate_args(parser)
+    args = parser.parse_args()
+
+    try:
+        results = run(
+            runs_dir=args.runs_dir,
+            repeats=args.repeats,
+            output=args.output,
+            keep=args.keep,
+            runs=args.runs,
+            history_s=args.history_s,
+            endpoints=args.endpoints,
+            large_runs=args.large_runs,
+            large_history_s=args.large_history_s,
+            large_endpoints=args.large_endpoints,
+            seed=args.seed,
+            force=args.force,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Generator throughput benchmark.
+Runs reference locustfiles (benchmarks/reference_locustfiles, or the ones
+given) through run_locust against the local stub target at increasing user
+counts, with no think time, and reports per locustfile and step:
+
+- sustained RPS over the steady window (after --settle-s, before shutdown)
+- generator CPU per request and utilisation of the Locust process; a
+  utilisation near 1.0 means the single generator process is the limit
+- stub CPU utilisation, to tell generator limits from target limits
+  (limited_by: generator, target, host_cpu when both share too few cores, or
+  neither, i.e. bound by latency and user count)
+- latency overhead: response times Locust recorded minus the delay the stub
+  itself added (its mean; exact with a fixed latency spec)
+
+plus the maximum sustained RPS per locustfile.
+
+    python -m benchmarks.generator_throughput --users 1,10,50 --duration-s 30 \\
+        --latency fixed:5 --stub-workers 2 --output generator.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import psutil
+
+from app.core.runner import run_locust
+from benchmarks.stub_target import StubTargetServer
+
+REFERENCE_DIR = Path(__file__).resolve().parent / "reference_locustfiles"
+
+
+def _cpu_s(processes: List[psutil.Process]) -> float:
+    total = 0.0
+    for process in processes:
+        try:
+            times = process.cpu_times()
+            total += times.user + times.system
+        except psutil.Error:
+            pass
+    return total
+
+
+def _aggregated(df: pd.DataFrame) -> pd.DataFrame:
+    return df[df["Name"].astype(str) == "Aggregated"]
+
+
+def run_step(
+    locustfile: Path,
+    stub: StubTargetServer,
+    users: int,
+    duration_s: int,
+    settle_s: int,
+    run_dir: Path,
+) -> Dict[str, Any]:
+    """One headless run at `users` users, measured over its steady window."""
+    stub_before = stub.stats()
+    stub_processes = [psutil.Process(pid) for pid in stub.pids]
+    proc, *_ = run_locust(
+        locustfile,
+        stub.url,
+        users,
+        users,
+        f"{duration_s}s",
+        run_dir,
+        html_report=False,
+        stream_logs=False,
+    )
+    generator = psutil.Process(proc.pid)
+
+    time.sleep(settle_s)
+    t_a, gen_a, stub_a = time.time(), _cpu_s([generator]), _cpu_s(stub_processes)
+    # Stop measuring before Locust shuts down (its run time starts after start-up)
+    time.sleep(max(1, duration_s - settle_s - 2))
+    t_b, gen_b, stub_b = time.time(), _cpu_s([generator]), _cpu_s(stub_processes)
+    try:
+        proc.wait(timeout=duration_s + 60)
+    except Exception:
+        proc.kill()
+        raise
+    stub_after = stub.stats()
+
+    history = _aggregated(pd.read_csv(run_dir / "stats_stats_history.csv"))
+    counts = np.interp(
+        [t_a, t_b], history["Timestamp"].astype(float), history["Total Request Count"].astype(float)
+    )
+    window_s = t_b - t_a
+    requests = float(counts[1] - counts[0])
+    total = _aggregated(pd.read_csv(run_dir / "stats_stats.csv")).iloc[0]
+    stub_requests = stub_after["requests"] - stub_before["requests"]
+    stub_delay_ms = (
+        (stub_after["delay_ms"] - stub_before["delay_ms"]) / stub_requests if stub_requests else 0.0
+    )
+
+    gen_util = (gen_b - gen_a) / window_s
+    stub_util = (stub_b - stub_a) / window_s
+    if gen_util >= 0.9:
+        limited_by = "generator"
+    elif stub_util / max(1, stub.workers) >= 0.9:
+        limited_by = "target"
+    elif gen_util + stub_util >= 0.9 * (os.cpu_count() or 1):
+        # Generator and stub share too few cores to saturate either one
+        limited_by = "host_cpu"
+    else:
+        limited_by = "neither"
+    return {
+        "users": users,
+        "exit_code": proc.returncode,
+        "rps": round(requests / window_s, 1),
+        "requests": int(total["Request Count"]),
+        "failures": int(total["Failure Count"]),
+        "generator_cpu_util": round(gen_util, 3),
+        "cpu_per_request_us": round((gen_b - gen_a) / requests * 1e6, 1) if requests else None,
+        "stub_cpu_util": round(stub_util, 3),
+        "limited_by": limited_by,
+        "stub_delay_ms": round(stub_delay_ms, 3),
+        "latency_overhead_ms": {
+            "avg": round(float(total["Average Response Time"]) - stub_delay_ms, 3),
+            "p50": round(float(total["50%"]) - stub_delay_ms, 3),
+            "p99": round(float(total["99%"]) - stub_delay_ms, 3),
+        },
+    }
+
+
+def run(
+    locustfiles: Optional[List[Path]] = None,
+    users: Optional[List[int]] = None,
+    duration_s: int = 20,
+    settle_s: int = 5,
+    latency: str = "0",
+    body_size: int = 256,
+    error_rate: float = 0.0,
+    keep_alive: str = "on",
+    stub_workers: int = 1,
+    output: Optional[Path] = None,
+) -> Dict[str, Any]:
+    locustfiles = locustfiles or sorted(REFERENCE_DIR.glob("*.py"))
+    users = users or [1, 10, 50]
+    if duration_s - settle_s < 3:
+        raise ValueError("duration_s must exceed settle_s by at least 3 seconds")
+
+    stub = StubTargetServer(
+        latency=latency, body_size=body_size, error_rate=error_rate, keep_alive=keep_alive, workers=stub_workers
+    ).start()
+    results: Dict[str, Any] = {
+        "params": {
+            "users": users,
+            "duration_s": duration_s,
+            "settle_s": settle_s,
+            "stub": {**stub.config, "workers": stub.workers},
+        },
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "locustfiles": {},
+    }
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench_generator_") as tmp:
+            for locustfile in locustfiles:
+                steps = [
+                    run_step(Path(locustfile), stub, n, duration_s, settle_s, Path(tmp) / f"{Path(locustfile).stem}_{n}")
+                    for n in users
+                ]
+                best = max(steps, key=lambda s: s["rps"])
+                results["locustfiles"][Path(locustfile).stem] = {
+                    "path": str(locustfile),
+                    "max_sustained_rps": best["rps"],
+                    "at_users": best["users"],
+                    "cpu_per_request_us": best["cpu_per_request_us"],
+                    "limited_by": best["limited_by"],
+                    # Lowest step: overhead of the generator when it is not saturated
+                    "latency_overhead_ms_unloaded": steps[0]["latency_overhead_ms"],
+                    "latency_overhead_ms_at_max": best["latency_overhead_ms"],
+                    "steps": steps,
+                }
+    finally:
+        stub.stop()
+
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generator throughput of reference locustfiles against a stub target")
+    parser.add_argument("--locustfile", type=Path, action="append", dest="locustfiles", default=None,
+                        help="Locustfile to measure (repeatable; default: benchmarks/reference_locustfiles)")
+    parser.add_argument("--users", default="1,10,50", help="Comma-separated user counts, one run each")
+    parser.add_argument("--duration-s", type=int, default=20)
+    parser.add_argument("--settle-s", type=int, default=5, help="Seconds ignored at the start of each run")
+    parser.add_argument("--latency", default="0", help="Stub latency spec (see benchmarks.stub_target)")
+    parser.add_argument("--body-size", type=int, default=256)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--keep-alive", default="on")
+    parser.add_argument("--stub-workers", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = run(
+        locustfiles=args.locustfiles,
+        users=[int(u) for u in args.users.split(",") if u.strip()],
+        duration_s=args.duration_s,
+        settle_s=args.settle_s,
+        latency=args.latency,
+        body_size=args.body_size,
+        error_rate=args.error_rate,
+        keep_alive=args.keep_alive,
+        stub_workers=args.stub_workers,
+        output=args.output,
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
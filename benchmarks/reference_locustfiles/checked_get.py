@@ -0,0 +1,21 @@
+"""
+Reference locustfile: GETs with ids in the path (name normalisation to
+/items/{id}) and a JSON path check on every body, no think time.
+"""
+from itertools import count
+
+from locust import constant, task
+
+from locustfiles.utils.base_user import BaseLocustUser
+
+_ids = count()
+
+
+class CheckedGetUser(BaseLocustUser):
+    wait_time = constant(0)
+    expected_json_path = "data"
+
+    @task
+    def get_item(self):
+        with self.client.get(f"/items/{next(_ids) % 10000}", catch_response=True) as response:
+            self.validate_response(response)
@@ -0,0 +1,17 @@
+"""
+Reference locustfile: the smallest BaseLocustUser task, one GET with the
+status check, no think time. The generator cost floor in benchmarks.generator_throughput.
+"""
+from locust import constant, task
+
+from locustfiles.utils.base_user import BaseLocustUser
+
+
+class PlainGetUser(BaseLocustUser):
+    wait_time = constant(0)
+    normalize_ids = False
+
+    @task
+    def get_item(self):
+        with self.client.get("/items", catch_response=True) as response:
+            self.validate_response(response)
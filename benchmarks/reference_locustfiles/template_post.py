@@ -0,0 +1,23 @@
+"""
+Reference locustfile: JSON POSTs built from a precompiled request template
+with a counter source, no think time.
+"""
+from locust import constant, task
+
+from locustfiles.utils.base_user import BaseLocustUser
+from locustfiles.utils.templates import RequestTemplate, counter
+
+ORDER = RequestTemplate(
+    "POST",
+    "/customers/{{customer:path}}/orders",
+    body='{"orderId": {{order_id:int}}, "sku": {{sku:str}}, "qty": {{qty:int}}, "express": false}',
+    sources={"order_id": counter(), "sku": "SKU-0001", "qty": 2},
+)
+
+
+class TemplatePostUser(BaseLocustUser):
+    wait_time = constant(0)
+
+    @task
+    def post_order(self):
+        self.send_template(ORDER, customer=42)
@@ -0,0 +1,116 @@
+"""
+Request template micro-benchmark.
+Builds the same JSON order request (path + body bytes) per call in three ways
+and compares the CPU cost per request:
+
+- naive: dict construction + json.dumps + encode, as a task doing
+  client.post(url, json=payload) would
+- template: RequestTemplate.render with the values passed in
+- template_sources: RequestTemplate.render with a counter and a record source
+
+All variants are checked to produce byte-identical bodies first.
+
+    python -m benchmarks.request_templates --iterations 200000 --output templates.json
+"""
+import argparse
+import json
+import statistics
+import time
+from itertools import count, cycle
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from locustfiles.utils.templates import RequestTemplate
+
+ORDER_PATH = "/customers/{{customer.id:path}}/orders"
+ORDER_BODY = (
+    '{"orderId": {{order_id:int}}, '
+    '"customer": {"id": {{customer.id:int}}, "name": {{customer.name:str}}, "email": {{customer.email:str}}}, '
+    '"items": [{"sku": {{customer.sku:str}}, "qty": {{qty:int}}, "price": {{price:float}}}], '
+    '"currency": "EUR", "express": {{express:bool}}, "note": "load test"}'
+)
+
+
+def _records(n: int) -> List[Dict[str, Any]]:
+    return [
+        {"id": 1000 + i, "name": f"Customer {i}", "email": f"customer{i}@example.com", "sku": f"SKU-{i % 97:04d}"}
+        for i in range(n)
+    ]
+
+
+def naive(order_id: int, customer: Dict[str, Any], qty: int, price: float, express: bool):
+    payload = {
+        "orderId": order_id,
+        "customer": {"id": customer["id"], "name": customer["name"], "email": customer["email"]},
+        "items": [{"sku": customer["sku"], "qty": qty, "price": price}],
+        "currency": "EUR",
+        "express": express,
+        "note": "load test",
+    }
+    return f"/customers/{customer['id']}/orders", json.dumps(payload).encode("utf-8")
+
+
+def _time(call: Callable[[], Any], iterations: int, repeats: int) -> Dict[str, float]:
+    per_call = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            call()
+        per_call.append((time.perf_counter_ns() - start) / iterations)
+    return {"best_ns": round(min(per_call), 1), "median_ns": round(statistics.median(per_call), 1)}
+
+
+def run(iterations: int = 100000, repeats: int = 5, records: int = 1000, output: Optional[Path] = None) -> Dict[str, Any]:
+    data = _records(records)
+    template = RequestTemplate("POST", ORDER_PATH, body=ORDER_BODY)
+
+    # Same output for the same inputs
+    for i, customer in enumerate(data[:50]):
+        expected = naive(i, customer, 2, 19.99, i % 2 == 0)
+        got = template.render(order_id=i, customer=customer, qty=2, price=19.99, express=i % 2 == 0)
+        if got != expected:
+            raise AssertionError(f"Template output differs:\n{got}\n{expected}")
+
+    order_ids, customers = count(), cycle(data)
+    sourced = RequestTemplate(
+        "POST",
+        ORDER_PATH,
+        body=ORDER_BODY,
+        sources={"order_id": order_ids.__next__, "customer": customers.__next__, "qty": 2, "price": 19.99, "express": False},
+    )
+
+    results: Dict[str, Any] = {
+        "params": {"iterations": iterations, "repeats": repeats, "records": records},
+        "body_bytes": len(naive(0, data[0], 2, 19.99, False)[1]),
+        "naive": _time(lambda: naive(next(order_ids), next(customers), 2, 19.99, False), iterations, repeats),
+        "template": _time(
+            lambda: template.render(order_id=next(order_ids), customer=next(customers), qty=2, price=19.99, express=False),
+            iterations,
+            repeats,
+        ),
+        "template_sources": _time(sourced.render, iterations, repeats),
+    }
+    base = results["naive"]["best_ns"]
+    results["speedup"] = {
+        label: round(base / results[label]["best_ns"], 2) for label in ("template", "template_sources")
+    }
+
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Request template micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--records", type=int, default=1000, help="Distinct customer records to cycle through")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = run(iterations=args.iterations, repeats=args.repeats, records=args.records, output=args.output)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+ReportPortalListener overhead benchmark.
+Drives synthetic `request` events through a Locust Environment from many
+greenlets, once with only Locust's own stats bookkeeping (baseline) and once with
+ReportPortalListener attached and reporting to a local RP stub, and compares:
+
+- per-event latency of events.request.fire (p50/p99/max, mean)
+- gevent hub lag seen by a 10 ms ticker greenlet while events are fired
+- memory retained/peak while firing (tracemalloc, separate pass)
+
+    python -m benchmarks.rp_listener_overhead --events 200000 --failure-rate 0.05 \\
+        --rp-latency-ms 20 --output rp_listener.json
+"""
+from gevent import monkey
+
+monkey.patch_all()
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import random  # noqa: E402
+import socket  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Any, Dict, List, Optional  # noqa: E402
+
+import gevent  # noqa: E402
+import numpy as np  # noqa: E402
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_rp_stub(latency_ms: float, error_rate: float) -> subprocess.Popen:
+    """Run the RP stub in its own process so it does not share this gevent hub."""
+    port = _free_port()
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "benchmarks.rp_stub",
+            "--port", str(port),
+            "--latency-ms", str(latency_ms),
+            "--error-rate", str(error_rate),
+        ],
+        cwd=str(BASE_DIR),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            proc.url = f"http://127.0.0.1:{port}"
+            return proc
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("RP stub did not start")
+
+
+def _make_env(with_rp: bool):
+    from locust.env import Environment
+
+    env = Environment()
+
+    # What Locust's runner does for every request event
+    def log_stats(request_type, name, response_time, response_length, exception=None, **kwargs):
+        env.stats.log_request(request_type, name, response_time, response_length)
+        if exception is not None:
+            env.stats.log_error(request_type, name, exception)
+
+    env.events.request.add_listener(log_stats)
+    if with_rp:
+        from app.core.rp_listener import ReportPortalListener
+
+        ReportPortalListener(env)
+    return env
+
+
+def _events(n: int, endpoints: int, failure_rate: float, unique_errors: float, seed: int = 1):
+    """Pre-generated event kwargs so generation cost is not measured."""
+    rnd = random.Random(seed)
+    out = []
+    for i in range(n):
+        exception = None
+        if rnd.random() < failure_rate:
+            if rnd.random() < unique_errors:
+                exception = Exception(f"500 Server Error for url: http://target/items/{i}?req={rnd.getrandbits(64):x}")
+            else:
+                exception = Exception("503 Service Unavailable")
+        out.append(
+            {
+                "request_type": "GET",
+                "name": f"/api/endpoint/{rnd.randrange(endpoints)}",
+                "response_time": rnd.lognormvariate(3.5, 0.8),
+                "response_length": 512,
+                "exception": exception,
+                "context": {},
+                "response": None,
+            }
+        )
+    return out
+
+
+def _run_pass(with_rp: bool, events: List[Dict[str, Any]], users: int, track_memory: bool) -> Dict[str, Any]:
+    env = _make_env(with_rp)
+    env.events.test_start.fire(environment=env)
+
+    lags: List[float] = []
+    done = False
+
+    def ticker():
+        while not done:
+            t = time.perf_counter()
+            gevent.sleep(0.01)
+            lags.append(time.perf_counter() - t - 0.01)
+
+    per_event = np.empty(len(events))
+    fire = env.events.request.fire
+
+    def user(offset: int):
+        for i in range(offset, len(events), users):
+            t = time.perf_counter()
+            fire(**events[i])
+            per_event[i] = time.perf_counter() - t
+            if i % 50 == offset % 50:
+                gevent.sleep(0)
+
+    if track_memory:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+    tick = gevent.spawn(ticker)
+    start = time.perf_counter()
+    gevent.joinall([gevent.spawn(user, u) for u in range(users)])
+    elapsed = time.perf_counter() - start
+    done = True
+    tick.join()
+    memory = None
+    if track_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory = {"retained_mb": round((current - before) / 1e6, 2), "peak_mb": round(peak / 1e6, 2)}
+
+    stop_start = time.perf_counter()
+    env.events.test_stop.fire(environment=env)
+    stop_s = time.perf_counter() - stop_start
+
+    us = per_event * 1e6
+    result = {
+        "events": len(events),
+        "events_per_s": round(len(events) / elapsed),
+        "fire_us": {
+            "mean": round(float(us.mean()), 2),
+            "p50": round(float(np.percentile(us, 50)), 2),
+            "p99": round(float(np.percentile(us, 99)), 2),
+            "max": round(float(us.max()), 2),
+        },
+        "hub_lag_ms": {
+            "p99": round(float(np.percentile(lags, 99)) * 1000, 2) if lags else None,
+            "max": round(max(lags) * 1000, 2) if lags else None,
+        },
+        "test_stop_s": round(stop_s, 3),
+    }
+    if memory:
+        result["memory"] = memory
+    return result
+
+
+def run(
+    n_events: int = 100000,
+    users: int = 100,
+    endpoints: int = 50,
+    failure_rate: float = 0.05,
+    unique_errors: float = 0.5,
+    rp_latency_ms: float = 10.0,
+    rp_error_rate: float = 0.0,
+    output: Optional[Path] = None,
+) -> Dict[str, Any]:
+    stub = start_rp_stub(rp_latency_ms, rp_error_rate)
+    os.environ.update(
+        RP_ENDPOINT=stub.url,
+        RP_PROJECT="bench",
+        RP_TOKEN="bench",
+        RP_STATS_INTERVAL=os.environ.get("RP_STATS_INTERVAL", "1"),
+    )
+    os.environ.pop("LOCUST_RUN_DIR", None)
+    try:
+        events = _events(n_events, endpoints, failure_rate, unique_errors)
+        results: Dict[str, Any] = {
+            "params": {
+                "events": n_events,
+                "users": users,
+                "endpoints": endpoints,
+                "failure_rate": failure_rate,
+                "unique_errors": unique_errors,
+                "rp_latency_ms": rp_latency_ms,
+                "rp_error_rate": rp_error_rate,
+            }
+        }
+        for label, with_rp in (("baseline", False), ("rp", True)):
+            timing = _run_pass(with_rp, events, users, track_memory=False)
+            timing["memory"] = _run_pass(with_rp, events, users, track_memory=True)["memory"]
+            results[label] = timing
+        base, rp = results["baseline"]["fire_us"], results["rp"]["fire_us"]
+        results["added_us_per_event"] = {k: round(rp[k] - base[k], 2) for k in ("mean", "p50", "p99")}
+    finally:
+        stub.terminate()
+        stub.wait(timeout=5)
+
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ReportPortalListener overhead benchmark")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--endpoints", type=int, default=50)
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument("--unique-errors", type=float, default=0.5, help="Share of failures with a unique message")
+    parser.add_argument("--rp-latency-ms", type=float, default=10.0)
+    parser.add_argument("--rp-error-rate", type=float, default=0.0)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = run(
+        n_events=args.events,
+        users=args.users,
+        endpoints=args.endpoints,
+        failure_rate=args.failure_rate,
+        unique_errors=args.unique_errors,
+        rp_latency_ms=args.rp_latency_ms,
+        rp_error_rate=args.rp_error_rate,
+        output=args.output,
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
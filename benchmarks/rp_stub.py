@@ -0,0 +1,206 @@
+"""
+Local ReportPortal stand-in.
+Implements the v1/v2 endpoints reportportal_client and the artifact uploader call
+(launch/item start and finish, log batches, attachments) with configurable
+latency and failure rate, and counts what it receives. Nothing is stored.
+
+    python -m benchmarks.rp_stub --port 8585 --latency-ms 20 --error-rate 0.01
+
+then point the app at it with RP_ENDPOINT=http://localhost:8585 RP_PROJECT=bench
+RP_TOKEN=any.
+"""
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# (method, path regex) -> route name
+ROUTES = [
+    ("POST", re.compile(r"^/api/v2/[^/]+/launch$"), "start_launch"),
+    ("PUT", re.compile(r"^/api/v2/[^/]+/launch/[^/]+/finish$"), "finish_launch"),
+    ("POST", re.compile(r"^/api/v2/[^/]+/item(/[^/]+)?$"), "start_item"),
+    ("PUT", re.compile(r"^/api/v2/[^/]+/item/[^/]+$"), "finish_item"),
+    ("POST", re.compile(r"^/api/v2/[^/]+/log$"), "log"),
+    ("GET", re.compile(r"^/api/v1/[^/]+/(launch|item)/uuid/[^/]+$"), "get_by_uuid"),
+    ("GET", re.compile(r"^/api/v1/[^/]+/settings$"), "settings"),
+    ("GET", re.compile(r"^/api/info$"), "info"),
+]
+
+
+def _count_log_entries(content_type: str, body: bytes) -> int:
+    """Entries in a multipart log batch: its JSON part is a list with one item per log."""
+    m = re.search(r"boundary=\"?([^\";]+)", content_type)
+    if not m:
+        return 1
+    for part in body.split(b"--" + m.group(1).encode()):
+        if b'name="json_request_part"' in part:
+            try:
+                return len(json.loads(part.split(b"\r\n\r\n", 1)[1].strip()))
+            except (IndexError, ValueError):
+                return 1
+    return 1
+
+
+class RPStubServer:
+    """Threaded HTTP server answering like ReportPortal.
+
+    Args:
+        host: Interface to bind
+        port: TCP port (0 picks a free one)
+        latency_ms: Fixed delay added to every response
+        jitter_ms: Extra uniform random delay (0..jitter_ms)
+        error_rate: Fraction of requests answered with HTTP 503
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.counts: Counter = Counter()
+        self.errors = 0
+        self.log_entries = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "RPStubServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="rp-stub", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"RP stub listening on {self.url}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": dict(self.counts),
+                "errors": self.errors,
+                "log_entries": self.log_entries,
+                "bytes_received": self.bytes_received,
+            }
+
+    def _record(self, route: str, body: bytes, failed: bool, log_entries: int = 0):
+        with self._lock:
+            self.counts[route] += 1
+            self.bytes_received += len(body)
+            self.log_entries += log_entries
+            if failed:
+                self.errors += 1
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _read_body(self) -> bytes:
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    chunks = []
+                    while True:
+                        size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                        if size == 0:
+                            self.rfile.readline()
+                            break
+                        chunks.append(self.rfile.read(size))
+                        self.rfile.readline()
+                    return b"".join(chunks)
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length) if length else b""
+
+            def _reply(self, status: int, payload: Dict[str, Any]):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _handle(self):
+                body = self._read_body()
+                path = self.path.split("?", 1)[0]
+                route = next(
+                    (name for method, rx, name in ROUTES if method == self.command and rx.match(path)),
+                    None,
+                )
+                delay = stub.latency_ms + random.uniform(0, stub.jitter_ms)
+                if delay > 0:
+                    time.sleep(delay / 1000)
+                if route is None:
+                    stub._record("unknown", body, failed=True)
+                    self._reply(404, {"message": f"No route for {self.command} {path}"})
+                    return
+                if stub.error_rate and random.random() < stub.error_rate:
+                    stub._record(route, body, failed=True)
+                    self._reply(503, {"message": "stub failure"})
+                    return
+
+                if route == "log":
+                    entries = _count_log_entries(self.headers.get("Content-Type", ""), body)
+                    stub._record(route, body, failed=False, log_entries=entries)
+                    self._reply(201, {"responses": [{"id": uuid.uuid4().hex} for _ in range(entries)]})
+                    return
+                stub._record(route, body, failed=False)
+                if route in ("start_launch", "start_item"):
+                    self._reply(201, {"id": str(uuid.uuid4()), "number": 1})
+                elif route == "get_by_uuid":
+                    self._reply(200, {"id": 1, "uuid": path.rsplit("/", 1)[-1]})
+                else:
+                    self._reply(200, {"message": "OK"})
+
+            do_GET = do_POST = do_PUT = _handle
+
+            def log_message(self, format, *args):
+                logger.debug("rp-stub: " + format, *args)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local ReportPortal stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8585)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    stub = RPStubServer(args.host, args.port, args.latency_ms, args.jitter_ms, args.error_rate).start()
+    try:
+        while True:
+            time.sleep(10)
+            logger.info(f"RP stub: {stub.stats()}")
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
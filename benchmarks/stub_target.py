@@ -0,0 +1,296 @@
+"""
+Local stub target.
+A minimal HTTP/1.1 server for measuring the load generator rather than a real
+system: every request gets the same response after a delay drawn from a
+configurable distribution. It runs one asyncio loop per worker process on a
+shared listening socket (uvloop is used when installed), so it can be given
+more cores than the generator under test.
+
+- latency: "0", "fixed:5", "uniform:2:10", "exp:5" (mean), "lognormal:5:0.5"
+  (median, sigma); milliseconds
+- body size: bytes of JSON in every 2xx response ({"id": ..., "data": "xxx..."})
+- error rate: fraction of requests answered with HTTP 503
+- keep-alive: "on", "off" (close after every response) or N requests per connection
+
+    python -m benchmarks.stub_target --port 8686 --latency fixed:5 --body-size 512 \\
+        --error-rate 0.01 --workers 2
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import random
+import socket
+import time
+from typing import Any, Callable, Dict, List
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+# Per-worker counters in a shared array: requests, errors, delay (µs), connections
+_FIELDS = ("requests", "errors", "delay_us", "connections")
+_MAX_HEADER = 64 * 1024
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """Delay sampler in seconds for a latency spec such as "fixed:5" or "lognormal:5:0.5"."""
+    kind, *params = str(spec).strip().lower().split(":")
+    try:
+        if not params:
+            # "0", "none" or a bare number of milliseconds
+            delay = 0.0 if kind in ("", "none") else float(kind) / 1000
+            return lambda: delay
+        values = [float(p) for p in params]
+    except ValueError:
+        values = []
+    if kind == "fixed" and len(values) == 1:
+        delay = values[0] / 1000
+        return lambda: delay
+    if kind == "uniform" and len(values) == 2:
+        low, high = values[0] / 1000, values[1] / 1000
+        return lambda: random.uniform(low, high)
+    if kind == "exp" and len(values) == 1 and values[0] > 0:
+        rate = 1000 / values[0]
+        return lambda: random.expovariate(rate)
+    if kind == "lognormal" and len(values) == 2:
+        median, sigma = values[0] / 1000, values[1]
+        return lambda: random.lognormvariate(0, sigma) * median
+    raise ValueError(
+        f"Invalid latency spec '{spec}', expected 0, fixed:MS, uniform:MIN:MAX, exp:MEAN or lognormal:MEDIAN:SIGMA"
+    )
+
+
+def parse_keep_alive(value: str) -> int:
+    """Requests per connection: 0 for unlimited ("on"), 1 for "off", or N."""
+    value = str(value).strip().lower()
+    if value in ("on", "true", "yes"):
+        return 0
+    if value in ("off", "false", "no"):
+        return 1
+    try:
+        n = int(value)
+    except ValueError:
+        raise ValueError(f"Invalid keep-alive '{value}', expected on, off or a request count")
+    if n < 0:
+        raise ValueError("keep-alive request count must be >= 0")
+    return n
+
+
+def _response(status: bytes, body: bytes, close: bool) -> bytes:
+    return b"".join([
+        b"HTTP/1.1 ", status, b"\r\nContent-Type: application/json\r\nContent-Length: ",
+        str(len(body)).encode(), b"\r\nConnection: ", b"close" if close else b"keep-alive", b"\r\n\r\n", body,
+    ])
+
+
+class _StubProtocol(asyncio.Protocol):
+    """One connection: parses requests in order and answers each after its delay.
+
+    Pipelined requests are answered one after another, so responses keep the
+    request order even when delays differ.
+    """
+
+    def __init__(self, config: Dict[str, Any], counters, slot: int):
+        self.config = config
+        self.counters = counters
+        self.slot = slot * len(_FIELDS)
+        self.buffer = b""
+        self.served = 0
+        self.busy = False
+        self.closing = False
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.counters[self.slot + 3] += 1
+
+    def connection_lost(self, exc):
+        self.closing = True
+
+    def data_received(self, data: bytes):
+        self.buffer += data
+        if not self.busy:
+            self._process()
+
+    def _process(self):
+        while not self.closing:
+            end = self.buffer.find(b"\r\n\r\n")
+            if end < 0:
+                if len(self.buffer) > _MAX_HEADER:
+                    self.transport.close()
+                    self.closing = True
+                return
+            head = self.buffer[:end].decode("latin-1")
+            lines = head.split("\r\n")
+            length, close = 0, lines[0].endswith("HTTP/1.0")
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                name = name.strip().lower()
+                if name == "content-length":
+                    length = int(value.strip() or 0)
+                elif name == "connection":
+                    close = value.strip().lower() == "close"
+            if len(self.buffer) < end + 4 + length:
+                return
+            self.buffer = self.buffer[end + 4 + length:]
+            self.served += 1
+            limit = self.config["keep_alive"]
+            close = close or (limit and self.served >= limit)
+
+            delay = self.config["latency"]()
+            if delay > 0:
+                self.busy = True
+                asyncio.get_running_loop().call_later(delay, self._respond, delay, close)
+                return
+            self._respond(0.0, close, resume=False)
+
+    def _respond(self, delay: float, close: bool, resume: bool = True):
+        self.busy = False
+        if self.closing:
+            return
+        counters, slot = self.counters, self.slot
+        counters[slot] += 1
+        counters[slot + 2] += int(delay * 1e6)
+        if self.config["error_rate"] and random.random() < self.config["error_rate"]:
+            counters[slot + 1] += 1
+            self.transport.write(_response(b"503 Service Unavailable", b'{"error": "stub failure"}', close))
+        else:
+            self.transport.write(self.config["ok"] if not close else self.config["ok_close"])
+        if close:
+            self.transport.close()
+            self.closing = True
+        elif resume and self.buffer:
+            self._process()
+
+
+def _serve(sock: socket.socket, config: Dict[str, Any], counters, slot: int):
+    """Worker process: serve the shared socket until terminated."""
+    if uvloop is not None:
+        uvloop.install()
+    config = dict(config, latency=parse_latency(config["latency"]))
+    body = json.dumps({"id": 1, "data": ""}).encode()
+    body = body[:-2] + b"x" * max(0, config["body_size"] - len(body)) + b'"}'
+    config["ok"] = _response(b"200 OK", body, close=False)
+    config["ok_close"] = _response(b"200 OK", body, close=True)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(lambda: _StubProtocol(config, counters, slot), sock=sock)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+class StubTargetServer:
+    """Stub HTTP target served by `workers` processes.
+
+    Args:
+        host: Interface to bind
+        port: TCP port (0 picks a free one)
+        latency: Latency spec (see parse_latency)
+        body_size: Bytes in every successful response body
+        error_rate: Fraction of requests answered with HTTP 503
+        keep_alive: "on", "off" or requests per connection
+        workers: Server processes sharing the listening socket
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: str = "0",
+        body_size: int = 256,
+        error_rate: float = 0.0,
+        keep_alive: str = "on",
+        workers: int = 1,
+    ):
+        parse_latency(latency)
+        self.config = {
+            "latency": latency,
+            "body_size": int(body_size),
+            "error_rate": float(error_rate),
+            "keep_alive": parse_keep_alive(keep_alive),
+        }
+        self.workers = max(1, int(workers))
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind((host, port))
+        self._sock.listen(1024)
+        self._counters = multiprocessing.Array("q", self.workers * len(_FIELDS), lock=False)
+        self._processes: List[multiprocessing.Process] = []
+
+    @property
+    def url(self) -> str:
+        host, port = self._sock.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def pids(self) -> List[int]:
+        return [p.pid for p in self._processes if p.pid]
+
+    def start(self) -> "StubTargetServer":
+        for slot in range(self.workers):
+            process = multiprocessing.Process(
+                target=_serve, args=(self._sock, self.config, self._counters, slot), name=f"stub-target-{slot}", daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+        logger.info(f"Stub target listening on {self.url} ({self.workers} worker(s))")
+        return self
+
+    def stop(self):
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join(timeout=5)
+        self._processes = []
+        self._sock.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals over all workers; delay_ms / mean_delay_ms is the delay the stub itself added."""
+        values = list(self._counters)
+        totals = {name: sum(values[i::len(_FIELDS)]) for i, name in enumerate(_FIELDS)}
+        requests = totals["requests"]
+        return {
+            "requests": requests,
+            "errors": totals["errors"],
+            "connections": totals["connections"],
+            "delay_ms": totals["delay_us"] / 1000,
+            "mean_delay_ms": round(totals["delay_us"] / requests / 1000, 3) if requests else 0.0,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stub HTTP target")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8686)
+    parser.add_argument("--latency", default="0", help="0, fixed:MS, uniform:MIN:MAX, exp:MEAN or lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--body-size", type=int, default=256)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--keep-alive", default="on", help="on, off or requests per connection")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    stub = StubTargetServer(
+        args.host, args.port, args.latency, args.body_size, args.error_rate, args.keep_alive, args.workers
+    ).start()
+    try:
+        while True:
+            time.sleep(10)
+            logger.info(f"Stub target: {stub.stats()}")
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
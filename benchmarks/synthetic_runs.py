@@ -0,0 +1,322 @@
+"""
+Synthetic RUNS_DIR generator.
+Writes run directories the way the Run tab leaves them: Locust's stats,
+full-history, failures and exceptions CSVs (Locust 2.x columns and number
+formats), report.html, locust.log and metadata.json. Most runs are "typical"
+(minutes of history, a handful of endpoints); a few are "large" (hours of full
+history over a wide endpoint set). Hosts and locustfiles repeat, so the
+Dashboard's trend grouping has realistic series to work on.
+
+    python -m benchmarks.synthetic_runs --root /tmp/runs --runs 2000 \\
+        --large-runs 3 --large-history-s 14400 --large-endpoints 200
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from dotenv import dotenv_values
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+# Written into every generated root; other non-empty directories are only replaced with --force
+MARKER_FILE = ".synthetic_runs"
+
+PERCENTILES = ("50%", "66%", "75%", "80%", "90%", "95%", "98%", "99%", "99.9%", "99.99%", "100%")
+# Percentile / median ratios of a right-skewed latency distribution
+_PERCENTILE_FACTORS = np.array([1.0, 1.15, 1.3, 1.4, 1.75, 2.2, 2.9, 3.5, 5.0, 6.5, 8.0])
+
+STATS_COLUMNS = [
+    "Type", "Name", "Request Count", "Failure Count", "Median Response Time",
+    "Average Response Time", "Min Response Time", "Max Response Time",
+    "Average Content Size", "Requests/s", "Failures/s", *PERCENTILES,
+]
+HISTORY_COLUMNS = [
+    "Timestamp", "User Count", "Type", "Name", "Requests/s", "Failures/s", *PERCENTILES,
+    "Total Request Count", "Total Failure Count", "Total Median Response Time",
+    "Total Average Response Time", "Total Min Response Time", "Total Max Response Time",
+    "Total Average Content Size",
+]
+HOSTS = ["https://api.staging.example.com", "https://api.qa.example.com", "http://10.0.4.12:8080"]
+LOCUSTFILES = [
+    "locustfiles/libs/checkout.py",
+    "locustfiles/libs/catalog.py",
+    "locustfiles/libs/auth.py",
+    "locustfiles/files/smoke.py",
+]
+_METHODS = ["GET", "GET", "GET", "POST", "PUT", "DELETE"]
+_RESOURCES = ["users", "orders", "products", "carts", "sessions", "invoices", "reviews", "search"]
+
+_HISTORY_ROW = "%d,%d,%s,%s,%f,%f," + ",".join(["%d"] * len(PERCENTILES)) + ",%d,%d,%d,%r,%r,%r,%r\n"
+_STATS_ROW = "%s,%s,%d,%d,%d,%r,%r,%r,%r,%r,%r," + ",".join(["%d"] * len(PERCENTILES)) + "\n"
+
+
+def _endpoints(n: int, rng: np.random.Generator) -> List[Tuple[str, str]]:
+    endpoints = []
+    for i in range(n):
+        resource = _RESOURCES[i % len(_RESOURCES)]
+        method = _METHODS[int(rng.integers(len(_METHODS)))]
+        suffix = f"/v{i // len(_RESOURCES) + 1}" if i >= len(_RESOURCES) else ""
+        endpoints.append((method, f"/api{suffix}/{resource}/{{id}}" if method != "POST" else f"/api{suffix}/{resource}"))
+    return endpoints
+
+
+def write_run(
+    run_dir: Path,
+    history_s: int,
+    n_endpoints: int,
+    started: datetime,
+    host: str,
+    locustfile: str,
+    rng: np.random.Generator,
+) -> None:
+    """One finished run with `history_s` seconds of full history over `n_endpoints` endpoints."""
+    run_dir.mkdir(parents=True, exist_ok=True)
+    endpoints = _endpoints(n_endpoints, rng)
+    users = int(rng.choice([10, 50, 100, 200, 500]))
+    ramp_s = max(1, min(history_s // 5, users // 2))
+    t0 = int(started.timestamp())
+
+    # Per-endpoint base rates and medians, per-second noise
+    base_rps = rng.gamma(2.0, 5.0, n_endpoints) * users / 50
+    base_median = rng.lognormal(np.log(60), 0.6, n_endpoints)
+    fail_ratio = np.where(rng.random(n_endpoints) < 0.2, rng.uniform(0.001, 0.05, n_endpoints), 0.0)
+    ramp = np.minimum(1.0, (np.arange(history_s) + 1) / ramp_s)[:, None]
+    rps = base_rps * ramp * rng.normal(1.0, 0.08, (history_s, n_endpoints)).clip(0.5)
+    fps = rps * fail_ratio
+    median = base_median * rng.normal(1.0, 0.1, (history_s, n_endpoints)).clip(0.5)
+    cum_requests = np.cumsum(rps, axis=0).astype(np.int64)
+    cum_failures = np.cumsum(fps, axis=0).astype(np.int64)
+    content = rng.integers(200, 20000, n_endpoints).astype(float)
+    # %r needs Python floats (numpy scalars repr as np.float64(...))
+    content_l = content.tolist()
+
+    lines = [",".join(HISTORY_COLUMNS) + "\n"]
+    for s in range(history_s):
+        user_count = int(users * min(1.0, (s + 1) / ramp_s))
+        med = median[s]
+        for e, (method, name) in enumerate(endpoints):
+            pcts = (med[e] * _PERCENTILE_FACTORS).astype(int).tolist()
+            m = float(base_median[e])
+            lines.append(
+                _HISTORY_ROW
+                % (
+                    t0 + s, user_count, method, name, rps[s, e], fps[s, e], *pcts,
+                    cum_requests[s, e], cum_failures[s, e], int(m), m * 1.12, m * 0.2, m * 9.5, content_l[e],
+                )
+            )
+        total_rps = float(rps[s].sum())
+        weights = rps[s] / total_rps if total_rps else np.full(n_endpoints, 1 / n_endpoints)
+        agg_med = float((med * weights).sum())
+        agg_base = float((base_median * weights).sum())
+        lines.append(
+            _HISTORY_ROW
+            % (
+                t0 + s, user_count, "", "Aggregated", total_rps, float(fps[s].sum()),
+                *(agg_med * _PERCENTILE_FACTORS).astype(int).tolist(),
+                int(cum_requests[s].sum()), int(cum_failures[s].sum()), int(agg_base), agg_base * 1.12,
+                float(base_median.min()) * 0.2, float(base_median.max()) * 9.5, float((content * weights).sum()),
+            )
+        )
+    (run_dir / "stats_stats_history.csv").write_text("".join(lines), encoding="utf-8")
+
+    # Final aggregated stats
+    total_requests, total_failures = cum_requests[-1], cum_failures[-1]
+    lines = [",".join(STATS_COLUMNS) + "\n"]
+    for e, (method, name) in enumerate(endpoints):
+        m = float(base_median[e])
+        lines.append(
+            _STATS_ROW
+            % (
+                method, name, total_requests[e], total_failures[e], int(m), m * 1.12, m * 0.2, m * 9.5,
+                content_l[e], float(total_requests[e] / history_s), float(total_failures[e] / history_s),
+                *(m * _PERCENTILE_FACTORS).astype(int).tolist(),
+            )
+        )
+    agg = float(np.average(base_median, weights=total_requests + 1))
+    lines.append(
+        _STATS_ROW
+        % (
+            "", "Aggregated", int(total_requests.sum()), int(total_failures.sum()), int(agg), agg * 1.12,
+            float(base_median.min()) * 0.2, float(base_median.max()) * 9.5, float(content.mean()),
+            float(total_requests.sum() / history_s), float(total_failures.sum() / history_s),
+            *(agg * _PERCENTILE_FACTORS).astype(int).tolist(),
+        )
+    )
+    (run_dir / "stats_stats.csv").write_text("".join(lines), encoding="utf-8")
+
+    failing = [(endpoints[e], int(total_failures[e])) for e in np.flatnonzero(total_failures)]
+    lines = ["Method,Name,Error,Occurrences\n"]
+    for (method, name), count in failing:
+        lines.append(f'{method},{name},"HTTPError(\'500 Server Error: Internal Server Error for url: {name}\')",{count}\n')
+        if count > 10:
+            lines.append(f'{method},{name},"ConnectionResetError(104, \'Connection reset by peer\')",{count // 10}\n')
+    (run_dir / "stats_failures.csv").write_text("".join(lines), encoding="utf-8")
+    exceptions = "Count,Message,Traceback,Nodes\n"
+    if failing and rng.random() < 0.3:
+        exceptions += '3,"KeyError: \'id\'","Traceback (most recent call last):\n  File ""task.py"", line 12, in t\nKeyError: \'id\'",local\n'
+    (run_dir / "stats_exceptions.csv").write_text(exceptions, encoding="utf-8")
+
+    # Locust's report embeds the history; its size grows with it
+    (run_dir / "report.html").write_text(
+        "<html><head><title>Locust</title></head><body><script>window.templateArgs = "
+        + json.dumps({"history": [[t0 + s, float(rps[s].sum())] for s in range(0, history_s, 2)]})
+        + "</script></body></html>",
+        encoding="utf-8",
+    )
+    log_lines = [
+        f"[{started + timedelta(seconds=int(s))}] host/INFO/locust.runners: Ramping to {users} users\n"
+        for s in range(0, history_s, max(1, history_s // 50))
+    ]
+    log_lines += [
+        f"[{started}] host/ERROR/locust.user.users: 500 Server Error for url: {name}\n"
+        for (method, name), _ in failing
+    ]
+    (run_dir / "locust.log").write_text("".join(log_lines), encoding="utf-8")
+
+    ended = started + timedelta(seconds=history_s)
+    meta: Dict[str, Any] = {
+        "locustfile": locustfile,
+        "use_file_host": False,
+        "file_host": None,
+        "typed_host": host,
+        "effective_host": host,
+        "users": users,
+        "spawn_rate": float(max(1, users // 10)),
+        "target_rps": None,
+        "run_time": f"{history_s}s",
+        "csv_prefix": "stats",
+        "html_report": True,
+        "csv_full_history": True,
+        "started_at": started.isoformat(),
+        "ended_at": ended.isoformat(),
+        "command": f"locust -f {locustfile} --headless -u {users} --run-time {history_s}s",
+    }
+    (run_dir / "metadata.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+
+def configured_runs_dir() -> Path:
+    """RUNS_DIR as app/core/config.py resolves it, without importing it (that creates it)."""
+    value = os.getenv("RUNS_DIR") or dotenv_values(BASE_DIR / ".env").get("RUNS_DIR") or "runs"
+    path = Path(value)
+    return (path if path.is_absolute() else BASE_DIR / path).resolve()
+
+
+def _prepare_root(root: Path, force: bool) -> None:
+    if root == configured_runs_dir():
+        raise ValueError(f"Refusing to generate into the configured RUNS_DIR ({root})")
+    if root.exists() and any(root.iterdir()):
+        if not (root / MARKER_FILE).exists() and not force:
+            raise ValueError(
+                f"{root} is not empty and was not created by this generator; "
+                "use --force to replace it"
+            )
+        shutil.rmtree(root)
+    root.mkdir(parents=True, exist_ok=True)
+    (root / MARKER_FILE).write_text("Synthetic runs from benchmarks.synthetic_runs\n", encoding="utf-8")
+
+
+def generate_runs(
+    root: Path,
+    runs: int = 1000,
+    history_s: int = 300,
+    endpoints: int = 8,
+    large_runs: int = 2,
+    large_history_s: int = 7200,
+    large_endpoints: int = 100,
+    seed: int = 1,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """Fill `root` with `runs` run directories, `large_runs` of them large.
+
+    `root` is replaced if it holds an earlier generated tree; any other non-empty
+    directory is only replaced with `force`, and the configured RUNS_DIR never is.
+
+    Raises:
+        ValueError: If `root` is RUNS_DIR, or holds other data and `force` is not set
+
+    Returns:
+        What was generated: counts, sizes, timing and one typical and one large run path
+    """
+    root = Path(root).resolve()
+    _prepare_root(root, force)
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    large_at = set(rng.choice(runs, size=min(large_runs, runs), replace=False).tolist()) if large_runs else set()
+    base = datetime(2026, 1, 1, 8, 0, 0)
+    typical: Optional[Path] = None
+    large: Optional[Path] = None
+    for i in range(runs):
+        started = base + timedelta(minutes=47 * i)
+        run_dir = root / started.strftime("%Y%m%d_%H%M%S")
+        is_large = i in large_at
+        write_run(
+            run_dir,
+            large_history_s if is_large else history_s,
+            large_endpoints if is_large else endpoints,
+            started,
+            HOSTS[i % len(HOSTS)],
+            LOCUSTFILES[(i // len(HOSTS)) % len(LOCUSTFILES)],
+            rng,
+        )
+        if is_large:
+            large = large or run_dir
+        else:
+            typical = typical or run_dir
+    size = sum(p.stat().st_size for p in root.rglob("*") if p.is_file())
+    return {
+        "root": str(root),
+        "runs": runs,
+        "history_s": history_s,
+        "endpoints": endpoints,
+        "large_runs": len(large_at),
+        "large_history_s": large_history_s,
+        "large_endpoints": large_endpoints,
+        "total_mb": round(size / 1e6, 1),
+        "generate_s": round(time.perf_counter() - start, 2),
+        "typical_run": str(typical) if typical else None,
+        "large_run": str(large) if large else None,
+    }
+
+
+def add_generate_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--history-s", type=int, default=300, help="Seconds of history of a typical run")
+    parser.add_argument("--endpoints", type=int, default=8, help="Endpoints of a typical run")
+    parser.add_argument("--large-runs", type=int, default=2)
+    parser.add_argument("--large-history-s", type=int, default=7200)
+    parser.add_argument("--large-endpoints", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--force", action="store_true", help="Replace a non-empty directory not created by this generator"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic RUNS_DIR")
+    parser.add_argument("--root", type=Path, required=True, help="Directory to fill (a previous tree is replaced)")
+    add_generate_args(parser)
+    args = parser.parse_args()
+    try:
+        result = generate_runs(
+            args.root,
+            runs=args.runs,
+            history_s=args.history_s,
+            endpoints=args.endpoints,
+            large_runs=args.large_runs,
+            large_history_s=args.large_history_s,
+            large_endpoints=args.large_endpoints,
+            seed=args.seed,
+            force=args.force,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
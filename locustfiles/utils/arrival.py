@@ -0,0 +1,248 @@
+# locustfiles/utils/arrival.py
+"""
+Open-model (constant arrival rate) pacing.
+Requests are issued on a fixed timeline (one slot every 1/rate seconds) instead
+of "wait, then send": when the target slows down, users fall behind the
+timeline rather than quietly lowering the request rate, and how far behind they
+fell is recorded as schedule lag.
+
+The rate is a total: in distributed runs every worker takes rate/n with its
+timeline shifted by index/rate, using the partition the master assigns
+(see feeders.py).
+"""
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import gevent
+from locust import events
+from locust.runners import MasterRunner, WorkerRunner
+
+from locustfiles.utils.feeders import current_partition
+
+logger = logging.getLogger(__name__)
+
+LAG_MESSAGE = "arrival_lag"
+LAG_FILE = "arrival_lag.json"
+# Requests starting later than this behind their slot count as late
+LATE_THRESHOLD_MS = 10
+
+
+def _bucket(ms: float) -> int:
+    """Same rounding as Locust's response-time histogram (2 significant digits)."""
+    ms = int(round(ms))
+    if ms < 100:
+        return ms
+    if ms < 1000:
+        return int(round(ms, -1))
+    if ms < 10000:
+        return int(round(ms, -2))
+    return int(round(ms, -3))
+
+
+class LagStats:
+    """How far behind schedule requests started, as a Locust-style histogram."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.late = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram: Dict[int, int] = defaultdict(int)
+
+    def add(self, lag_ms: float):
+        self.count += 1
+        self.total_ms += lag_ms
+        if lag_ms > self.max_ms:
+            self.max_ms = lag_ms
+        if lag_ms > LATE_THRESHOLD_MS:
+            self.late += 1
+        self.histogram[_bucket(lag_ms)] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "late": self.late,
+            "total_ms": self.total_ms,
+            "max_ms": self.max_ms,
+            "histogram": dict(self.histogram),
+        }
+
+    def merge(self, data: dict):
+        self.count += data["count"]
+        self.late += data["late"]
+        self.total_ms += data["total_ms"]
+        self.max_ms = max(self.max_ms, data["max_ms"])
+        for bucket, n in data["histogram"].items():
+            self.histogram[int(bucket)] += n
+
+    def summary(self) -> dict:
+        from app.core.stats_summary import histogram_percentiles
+
+        pcts = histogram_percentiles(self.histogram, self.count, (0.5, 0.95, 0.99))
+        return {
+            "requests": self.count,
+            "late_requests": self.late,
+            "late_ratio": self.late / self.count if self.count else 0.0,
+            "late_threshold_ms": LATE_THRESHOLD_MS,
+            "avg_lag_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_lag_ms": pcts[0.5],
+            "p95_lag_ms": pcts[0.95],
+            "p99_lag_ms": pcts[0.99],
+            "max_lag_ms": self.max_ms,
+        }
+
+
+lag_stats = LagStats()
+
+
+class ArrivalScheduler:
+    """Hands out send slots on a fixed timeline shared by all users of a process.
+
+    Args:
+        rate: Total requests per second across all users and workers
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._start: Optional[float] = None
+        self._slot = 0
+        self._partition = None
+
+    def next_slot(self) -> float:
+        """Epoch time at which the next request should be sent."""
+        index, workers = current_partition()
+        if self._start is None or self._partition != (index, workers):
+            # (Re)start the timeline; workers interleave their slots
+            self._partition = (index, workers)
+            self._start = time.time() + index / self.rate
+            self._slot = 0
+        slot = self._start + self._slot * workers / self.rate
+        self._slot += 1
+        return slot
+
+    def reset(self):
+        self._start = None
+
+
+_schedulers: Dict[str, ArrivalScheduler] = {}
+
+
+def get_scheduler(rate: float, key: str = "total") -> ArrivalScheduler:
+    scheduler = _schedulers.get(key)
+    if scheduler is None or scheduler.rate != rate:
+        scheduler = _schedulers[key] = ArrivalScheduler(rate)
+    return scheduler
+
+
+def _take_slot(user, scheduler: ArrivalScheduler) -> float:
+    """Reserve a slot for `user`; returns seconds to wait and records schedule lag."""
+    slot = scheduler.next_slot()
+    # Intended send time, for latency correction (coordinated omission)
+    user._intended_start = slot
+    delay = slot - time.time()
+    if delay > 0:
+        lag_stats.add(0.0)
+        return delay
+    lag_stats.add(-delay * 1000)
+    return 0.0
+
+
+def arrival_rate(rate: float, key: str = "total") -> Callable:
+    """wait_time function pacing a user class on a shared constant-arrival timeline.
+
+    All classes using the same key share one timeline, so `rate` is the total
+    across them. Keep enough users to cover rate x response time, or requests fall
+    behind schedule (visible as lag).
+    """
+
+    def wait_time(self) -> float:
+        return _take_slot(self, get_scheduler(rate, key))
+
+    # Read by wait_first_slot
+    wait_time.arrival = (rate, key)
+    return wait_time
+
+
+def wait_first_slot(user):
+    """Sleep until the first slot of a user paced by arrival_rate (no-op otherwise).
+
+    Locust calls wait_time only after a task has run; without this, every user's
+    first request would go out unpaced as soon as it is spawned.
+    """
+    pacing = getattr(user.wait_time, "arrival", None)
+    if pacing:
+        delay = _take_slot(user, get_scheduler(*pacing))
+        if delay:
+            gevent.sleep(delay)
+
+
+def paced(rate: float) -> Callable:
+    """Task decorator: run this task at `rate` per second in total (own timeline)."""
+
+    def decorator(func):
+        key = f"task:{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(user, *args, **kwargs):
+            delay = _take_slot(user, get_scheduler(rate, key))
+            if delay:
+                gevent.sleep(delay)
+            return func(user, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def target_rps_from_env() -> Optional[float]:
+    value = os.getenv("LOCUST_TARGET_RPS")
+    try:
+        return float(value) if value and float(value) > 0 else None
+    except ValueError:
+        logger.warning(f"Ignoring invalid LOCUST_TARGET_RPS={value!r}")
+        return None
+
+
+def _write_lag(environment):
+    summary = lag_stats.summary()
+    if not summary["requests"]:
+        return
+    logger.info(f"Arrival schedule lag: {summary}")
+    run_dir = os.getenv("LOCUST_RUN_DIR")
+    if run_dir:
+        try:
+            (Path(run_dir) / LAG_FILE).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Failed to write {LAG_FILE}: {e}")
+
+
+@events.init.add_listener
+def _setup_lag_reporting(environment, **kwargs):
+    runner = environment.runner
+
+    def on_test_start(**kw):
+        lag_stats.reset()
+        for scheduler in _schedulers.values():
+            scheduler.reset()
+
+    environment.events.test_start.add_listener(on_test_start)
+    # Lag before a stats reset (end of warm-up) is not reported; the timeline itself continues
+    environment.events.reset_stats.add_listener(lag_stats.reset)
+    if isinstance(runner, WorkerRunner):
+        # Sent before "client_stopped", so the master has it before its test_stop
+        environment.events.test_stop.add_listener(
+            lambda **kw: runner.send_message(LAG_MESSAGE, lag_stats.to_dict()) if lag_stats.count else None
+        )
+        return
+    if isinstance(runner, MasterRunner):
+        runner.register_message(LAG_MESSAGE, lambda environment, msg, **kw: lag_stats.merge(msg.data))
+    environment.events.test_stop.add_listener(lambda **kw: _write_lag(environment))
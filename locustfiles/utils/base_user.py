@@ -1,12 +1,22 @@
 import os
+from typing import Optional, Sequence
+
 from locust import FastHttpUser, events, between
+from locust.exception import StopUser
 
 try:
     from locust.contrib.fasthttp import FastResponse
 except ImportError:
     FastResponse = None
 
+from app.core.connection_profiles import apply_profile, get_profile
+from locustfiles.utils.arrival import arrival_rate, target_rps_from_env, wait_first_slot
+from locustfiles.utils.feeders import FeederExhausted, get_feeder
 from locustfiles.utils.log_utils import log_test_summary
+from locustfiles.utils.naming import NameRule, budget, compile_name_rules
+from locustfiles.utils.phases import enable_phase_timings
+from locustfiles.utils.templates import RequestTemplate
+from locustfiles.utils.validation import body_preview, compile_body_checks, encode_needle
 
 TARGET_HOST = os.getenv("LOCUST_TARGET_HOST", "https://localhost:8080")
 
@@ -23,12 +33,146 @@ class BaseLocustUser(FastHttpUser):
     # Default wait_time (subclasses can override this)
     wait_time = between(1, 5)
 
-    # FastHttpUser optimizations
-    connection_timeout = 5.0
-    network_timeout = 10.0
-    max_retries = 0
+    # Timeouts, retries and pooling come from the run's connection profile
+    # (LOCUST_CONNECTION_PROFILE, applied below); subclasses may still override them
     host = TARGET_HOST
 
+    # Open model (see utils/arrival.py): pace this class at target_rps requests/s.
+    # LOCUST_TARGET_RPS overrides it with one total rate shared by all classes.
+    target_rps: Optional[float] = None
+    # Scheduled send time of the current arrival slot, set by the pacer
+    _intended_start: Optional[float] = None
+
+    # Default test data source for next_record() (see utils/feeders.py)
+    feeder_path: Optional[str] = None
+    feeder_mode: str = "sequential"
+    # Start over when the records run out; False stops each user once they are used up
+    feeder_loop: bool = True
+
+    # Optional body checks, compiled once per class (see utils/validation.py)
+    expected_json_path: Optional[str] = None
+    expected_body_regex: Optional[str] = None
+    response_schema: Optional[dict] = None
+    _body_check = None
+
+    # Request-name normalisation, compiled once per class (see utils/naming.py):
+    # path templates ("/users/{id}") or (regex, replacement) pairs, then numeric/UUID
+    # segments become {id}/{uuid}. Distinct names are capped by LOCUST_MAX_REQUEST_NAMES,
+    # also without normalisation (URLs are then used as given, like plain Locust).
+    name_rules: Sequence[NameRule] = ()
+    normalize_ids: bool = True
+    _normalizer = None
+
+    # DNS/connect/TLS/TTFB/download breakdown per endpoint (see utils/phases.py);
+    # turns it on for the whole process, like LOCUST_PHASE_TIMINGS
+    record_phases: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        total_rps = target_rps_from_env()
+        if total_rps:
+            cls.wait_time = arrival_rate(total_rps)
+        elif cls.target_rps:
+            cls.wait_time = arrival_rate(cls.target_rps, key=cls.__name__)
+        check = compile_body_checks(
+            cls.expected_json_path, cls.expected_body_regex, cls.response_schema
+        )
+        cls._body_check = staticmethod(check) if check else None
+        cls._normalizer = compile_name_rules(cls.name_rules, cls.normalize_ids)
+        if cls.record_phases:
+            enable_phase_timings()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        session = self.client
+        request = session.request
+        normalize = self._normalizer.normalize if self._normalizer is not None else budget.admit
+
+        # Every client.get/post/... goes through request(); naming it here keeps
+        # stats entries bounded before anything is recorded. Explicit names are
+        # deliberate labels: they only count towards the name cap.
+        def request_with_name(method, url, name=None, **kwargs):
+            label = name or session.request_name
+            return request(method, url, name=budget.admit(label) if label else normalize(url), **kwargs)
+
+        session.request = request_with_name
+
+    def on_start(self):
+        """
+        Waits for the user's first arrival slot when the class is paced.
+        Subclasses overriding on_start should call super().on_start() first.
+        """
+        wait_first_slot(self)
+
+    def context(self) -> dict:
+        """
+        Request event context, read by the latency corrector (app/core/latency_correction.py).
+        The slot's scheduled send time goes to the first request after it only.
+        """
+        intended = self._intended_start
+        if intended is None:
+            return {"user_id": id(self)}
+        self._intended_start = None
+        return {"user_id": id(self), "intended_start": intended}
+
+    def next_record(
+        self,
+        path: Optional[str] = None,
+        mode: Optional[str] = None,
+        raw: bool = False,
+        loop: Optional[bool] = None,
+    ):
+        """
+        Next test data record from a shared, mmap'd feeder.
+
+        Args:
+            path: CSV/JSONL data file (default: feeder_path)
+            mode: "sequential", "random" or "unique" (default: feeder_mode)
+            raw: Return the record's raw line bytes instead of a parsed dict/object
+            loop: Start over when all records are used (default: feeder_loop)
+
+        Stops the user when a non-looping feeder runs out of records.
+        """
+        feeder = get_feeder(
+            path or self.feeder_path,
+            mode or self.feeder_mode,
+            self.feeder_loop if loop is None else loop,
+        )
+        try:
+            return feeder.next_raw() if raw else feeder.next()
+        except FeederExhausted:
+            raise StopUser()
+
+    def send_template(
+        self,
+        template: RequestTemplate,
+        *,
+        expected_status: int = 200,
+        check_text: str = None,
+        **values,
+    ) -> FastResponse:
+        """
+        Send a precompiled request template (see utils/templates.py) and validate the response.
+
+        Args:
+            template: Compiled request; its body is joined from pre-encoded bytes
+            expected_status: Expected HTTP status code (default: 200)
+            check_text: Optional string to search within response body
+            **values: Slot values; slots not given here are taken from the template's sources
+                (slot names never clash with the parameters above, see RESERVED_SLOTS)
+
+        Stops the user when a non-looping feeder source runs out of records.
+        """
+        try:
+            path, body = template.render(**values)
+        except FeederExhausted:
+            raise StopUser()
+        with self.client.request(
+            template.method, path, name=template.name, data=body, headers=template.headers, catch_response=True
+        ) as response:
+            self.validate_response(response, expected_status, check_text)
+        return response
+
     def validate_response(
         self, response: FastResponse, expected_status: int = 200, check_text: str = None
     ):
@@ -36,6 +180,9 @@ class BaseLocustUser(FastHttpUser):
         Validate HTTP response and mark as success/failure.
         MUST be used within a 'with client.request(..., catch_response=True) as response:' block.
 
+        Works on the raw body bytes: the body is never decoded as a whole, error
+        previews are capped at 200 bytes.
+
         Args:
             response: Locust response object
             expected_status: Expected HTTP status code (default: 200)
@@ -44,21 +191,31 @@ class BaseLocustUser(FastHttpUser):
         # 1. Status Code Check
         if response.status_code != expected_status:
             # Adding a short preview from response body in error cases is helpful.
-            error_preview = response.text[:200] if response.text else "No content"
             response.failure(
-                f"FAIL: Expected {expected_status}, got {response.status_code}. Body: {error_preview}"
+                f"FAIL: Expected {expected_status}, got {response.status_code}. "
+                f"Body: {body_preview(response.content)}"
             )
             return  # Exit if there's an error
 
         # 2. (Optional) Content Check
-        if check_text and check_text not in response.text:
+        if check_text and encode_needle(check_text) not in (response.content or b""):
             response.failure(f"FAIL: Text '{check_text}' not found in response.")
             return
 
+        # 3. (Optional) Class-level JSON path / regex / schema checks
+        if self._body_check is not None:
+            error = self._body_check(response.content or b"")
+            if error:
+                response.failure(error)
+                return
+
         # If everything is fine
         response.success()
 
 
+apply_profile(BaseLocustUser, get_profile())
+
+
 @events.test_stop.add_listener
 def on_test_stop(environment, **kwargs):
     """Global test stop listener for all tests."""
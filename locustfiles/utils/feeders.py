@@ -0,0 +1,173 @@
+# locustfiles/utils/feeders.py
+"""
+Shared test data feeders.
+CSV (with a header line) and JSONL files are mmap'd and indexed by line offsets
+once per process; records are parsed only when they are handed out, so a
+multi-GB data file costs a few MB of index instead of a Python list per user.
+
+Modes:
+    sequential  every process walks all records in order (wrapping around)
+    random      a random record on every call
+    unique      records are split across workers (worker i of n gets every n-th
+                record), so no two workers ever send the same record; with
+                loop=False no record is sent twice at all
+
+In distributed runs the master assigns each worker its partition over a custom
+message right before users are spawned.
+"""
+import csv
+import json
+import mmap
+import random
+from functools import lru_cache
+from itertools import count
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import numpy as np
+from locust import events
+from locust.runners import MasterRunner, WorkerRunner
+
+FEEDER_MODES = ("sequential", "random", "unique")
+PARTITION_MESSAGE = "feeder_partition"
+
+_INDEX_CHUNK = 16 * 1024 * 1024
+_LOCUSTFILES_DIR = Path(__file__).resolve().parent.parent
+
+# (index, count) of this process among the workers; (0, 1) when not distributed
+_partition: Tuple[int, int] = (0, 1)
+
+
+class FeederExhausted(Exception):
+    """A non-looping feeder has handed out all of its records."""
+
+
+def set_partition(index: int, count: int) -> None:
+    global _partition
+    _partition = (index, max(count, 1))
+
+
+def current_partition() -> Tuple[int, int]:
+    return _partition
+
+
+def _line_index(buf: mmap.mmap) -> Tuple[np.ndarray, np.ndarray]:
+    """Start/end offsets of every non-empty line, scanned in chunks."""
+    data = np.frombuffer(buf, dtype=np.uint8)
+    newlines = [
+        np.flatnonzero(data[start:start + _INDEX_CHUNK] == 10) + start
+        for start in range(0, len(data), _INDEX_CHUNK)
+    ]
+    ends = np.concatenate(newlines + [np.array([len(data)])]).astype(np.int64)
+    starts = np.concatenate([[0], ends[:-1] + 1]).astype(np.int64)
+    # Drop empty lines (and lone "\r" of CRLF files)
+    keep = (ends - starts) > 1
+    keep |= ((ends - starts) == 1) & (data[np.minimum(starts, len(data) - 1)] != 13)
+    return starts[keep], ends[keep]
+
+
+class Feeder:
+    """Record source over a mmap'd CSV or JSONL file.
+
+    Args:
+        path: Data file (.csv with a header line, or .jsonl / .ndjson)
+        mode: One of FEEDER_MODES
+        loop: Start over when all records are used; if False, FeederExhausted is raised
+        seed: Seed for random mode
+    """
+
+    def __init__(self, path: Path, mode: str = "sequential", loop: bool = True, seed: Optional[int] = None):
+        if mode not in FEEDER_MODES:
+            raise ValueError(f"Unknown feeder mode '{mode}', expected one of {FEEDER_MODES}")
+        self.path = Path(path)
+        self.mode = mode
+        self.loop = loop
+        self.is_csv = self.path.suffix.lower() == ".csv"
+        self._file = self.path.open("rb")
+        if self.path.stat().st_size == 0:
+            # mmap refuses empty files; no records, so next() raises FeederExhausted
+            self._buf = b""
+            self._starts = self._ends = np.empty(0, dtype=np.int64)
+        else:
+            self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._starts, self._ends = _line_index(self._buf)
+        self.header = None
+        if self.is_csv and len(self._starts):
+            self.header = next(csv.reader([self._line(0).decode("utf-8-sig")]))
+            self._starts, self._ends = self._starts[1:], self._ends[1:]
+        self._random = random.Random(seed)
+        self._cursor = count()
+        self._partition = None
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _line(self, i: int) -> bytes:
+        return self._buf[self._starts[i]:self._ends[i]].rstrip(b"\r")
+
+    def _next_position(self) -> int:
+        n = len(self._starts)
+        if n == 0:
+            raise FeederExhausted(f"{self.path} has no records")
+        if self.mode == "random":
+            return self._random.randrange(n)
+        k = next(self._cursor)
+        if self.mode == "sequential":
+            if k >= n and not self.loop:
+                raise FeederExhausted(f"{self.path}: all {n} records used")
+            return k % n
+        index, workers = _partition
+        if self._partition != _partition:
+            # Partition changed (new test / worker count): restart this worker's slice
+            self._partition = _partition
+            self._cursor = count(1)
+            k = 0
+        local = (n - index + workers - 1) // workers
+        if local <= 0 or (k >= local and not self.loop):
+            raise FeederExhausted(f"{self.path}: partition {index}/{workers} used up")
+        return index + (k % local) * workers
+
+    def next_raw(self) -> bytes:
+        """The next record as the raw bytes of its line."""
+        return self._line(self._next_position())
+
+    def next(self) -> Any:
+        """The next record: a dict for CSV (header -> value), the parsed object for JSONL."""
+        line = self.next_raw()
+        if self.is_csv:
+            return dict(zip(self.header, next(csv.reader([line.decode("utf-8")]))))
+        return json.loads(line)
+
+
+def _resolve(path: str) -> Path:
+    p = Path(path)
+    if p.is_absolute() or p.exists():
+        return p
+    return _LOCUSTFILES_DIR / p
+
+
+@lru_cache(maxsize=None)
+def get_feeder(path: str, mode: str = "sequential", loop: bool = True) -> Feeder:
+    """Process-wide shared feeder, so all users of a process share one mmap and index.
+
+    Relative paths are resolved from the working directory, then from locustfiles/.
+    """
+    return Feeder(_resolve(path), mode=mode, loop=loop)
+
+
+@events.init.add_listener
+def _setup_partitioning(environment, **kwargs):
+    runner = environment.runner
+    if isinstance(runner, WorkerRunner):
+        runner.register_message(
+            PARTITION_MESSAGE, lambda environment, msg, **kw: set_partition(msg.data["index"], msg.data["count"])
+        )
+    elif isinstance(runner, MasterRunner):
+
+        def send_partitions(**kw):
+            # Fired before the spawn messages, which are sent on the same socket
+            workers = sorted(c.id for c in runner.clients.ready + runner.clients.running + runner.clients.spawning)
+            for i, client_id in enumerate(workers):
+                runner.send_message(PARTITION_MESSAGE, {"index": i, "count": len(workers)}, client_id=client_id)
+
+        environment.events.test_start.add_listener(send_partitions)
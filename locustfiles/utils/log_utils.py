@@ -3,6 +3,9 @@ import logging
 import os
 from typing import Optional
 
+from app.core.slo import format_check, slo_verdict
+from app.core.stats_summary import summarize_stats
+
 def get_logger(name: str = "locust") -> logging.Logger:
     """Konfigüre edilmiş bir logger instance'ı döner."""
     level_name = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -22,51 +25,48 @@ def get_logger(name: str = "locust") -> logging.Logger:
 def log_test_summary(
     environment, 
     logger: Optional[logging.Logger] = None, 
-    latency_threshold_ms: float = 200.0, 
-    failure_threshold_ratio: float = 0.05
 ):
     """
     Locust test istatistiklerini formatlı bir şekilde loglar.
+    Eşikler run'ın SLO'larından gelir (app/core/slo.py, LOCUST_SLO_FILE).
     
     Args:
         environment: Locust environment nesnesi.
         logger: Kullanılacak logger (None ise default logger).
-        latency_threshold_ms: Uyarı verilecek ortalama gecikme eşiği.
-        failure_threshold_ratio: Uyarı verilecek hata oranı eşiği (0.05 = %5).
     """
     logger = logger or get_logger("locust")
-    stats = environment.stats.total
+    summary = summarize_stats(environment.stats, percentiles=(0.50, 0.95, 0.99))
+    stats = summary.total
 
     logger.info("=" * 60)
     logger.info("LOCUST TEST SUMMARY")
     logger.info("=" * 60)
 
     logger.info(f"Total Request Count: {stats.num_requests}")
-    logger.info(f"Average Response Time: {stats.avg_response_time:.2f} ms")
-    logger.info(f"Max Response Time: {stats.max_response_time:.2f} ms")
+    logger.info(f"Average Response Time: {stats.avg_ms:.2f} ms")
+    logger.info(f"Max Response Time: {stats.max_ms:.2f} ms")
     logger.info(f"Failed Request Ratio: {stats.fail_ratio:.2%}")
-    logger.info(f"Requests Per Second (RPS): {stats.total_rps:.2f}")
+    logger.info(f"Requests Per Second (RPS): {stats.rps:.2f}")
 
     logger.info("=" * 60)
     logger.info("Performance by Endpoint:")
 
-    for stat in environment.stats.entries.values():
+    for stat in summary.entries:
         logger.info(
             f"- Endpoint: {stat.name} [{stat.method}]\n"
             f"  Requests: {stat.num_requests} | Failures: {stat.num_failures}\n"
-            f"  Response Time (ms): Avg: {stat.avg_response_time:.2f}, Min: {stat.min_response_time:.2f}, Max: {stat.max_response_time:.2f}"
+            f"  Response Time (ms): Avg: {stat.avg_ms:.2f}, Min: {stat.min_ms:.2f}, Max: {stat.max_ms:.2f}\n"
+            f"  Percentiles (ms): p50: {stat.percentile(0.50)}, p95: {stat.percentile(0.95)}, p99: {stat.percentile(0.99)}"
         )
         logger.info("-" * 40)
 
-    # Threshold Check
-    has_issue = False
-    if stats.avg_response_time > latency_threshold_ms:
-        logger.warning(f"⚠️ CRITICAL: Average response time exceeds {latency_threshold_ms}ms! ({stats.avg_response_time:.2f} ms)")
-        has_issue = True
-
-    if stats.fail_ratio > failure_threshold_ratio:
-        logger.warning(f"⚠️ CRITICAL: Failure ratio exceeds {failure_threshold_ratio:.0%}! ({stats.fail_ratio:.2%})")
-        has_issue = True
+    # SLO Check
+    verdict = slo_verdict(environment)
+    if verdict["aborted"]:
+        logger.warning(f"⚠️ CRITICAL: Run stopped early. {verdict['abort_reason']}")
+    for check in verdict["checks"]:
+        if not check["passed"]:
+            logger.warning(f"⚠️ CRITICAL: SLO breached: {format_check(check)}")
 
-    if not has_issue:
-        logger.info("✅ Test Successful: Performance criteria met.")
\ No newline at end of file
+    if verdict["status"] == "PASSED":
+        logger.info("✅ Test Successful: Performance criteria met.")
@@ -0,0 +1,122 @@
+# locustfiles/utils/naming.py
+"""
+Request-name normalisation.
+Locust keeps one stats entry per distinct request name, and the name defaults to
+the URL, so URLs carrying ids create an entry per id. Names are normalised
+before the request is sent (and so before stats are recorded):
+
+1. the query string and scheme/host are dropped
+2. the first matching path template ("/users/{id}/orders") becomes the name
+3. regex rules (pattern, replacement) are applied in order
+4. numeric and UUID path segments become {id} / {uuid}
+
+Explicit names (name=..., client.rename_request) are kept as given.
+Distinct names are capped per process (LOCUST_MAX_REQUEST_NAMES); anything
+beyond the cap is recorded under OVERFLOW_NAME.
+"""
+import logging
+import os
+import re
+from typing import Iterable, List, Optional, Pattern, Set, Tuple, Union
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_NAME = "/(other)"
+DEFAULT_MAX_NAMES = 500
+
+NameRule = Union[str, Tuple[str, str]]
+
+_ID_SEGMENT = re.compile(
+    r"(?<=/)(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})(?=/|$)"
+)
+_TEMPLATE_SLOT = re.compile(r"\{[^/{}]+\}")
+
+
+def _id_placeholder(match) -> str:
+    return "{id}" if match.group(0).isdigit() else "{uuid}"
+
+
+def _max_names() -> int:
+    value = os.getenv("LOCUST_MAX_REQUEST_NAMES")
+    try:
+        return int(value) if value else DEFAULT_MAX_NAMES
+    except ValueError:
+        logger.warning(f"Ignoring invalid LOCUST_MAX_REQUEST_NAMES={value!r}")
+        return DEFAULT_MAX_NAMES
+
+
+class _NameBudget:
+    """Process-wide set of admitted names; stats entries are process-wide too."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.names: Set[str] = set()
+        self.overflowed = 0
+
+    def admit(self, name: str) -> str:
+        if name in self.names:
+            return name
+        if len(self.names) < self.limit:
+            self.names.add(name)
+            return name
+        if not self.overflowed:
+            logger.warning(
+                f"More than {self.limit} distinct request names; "
+                f"the rest are recorded as '{OVERFLOW_NAME}' (add name_rules to group them)"
+            )
+        self.overflowed += 1
+        return OVERFLOW_NAME
+
+
+budget = _NameBudget(_max_names())
+
+
+def _compile_template(template: str) -> Pattern:
+    parts = _TEMPLATE_SLOT.split(template)
+    return re.compile("^" + "[^/]+".join(re.escape(p) for p in parts) + "/?$")
+
+
+def _path(url: str) -> str:
+    if "://" in url:
+        url = urlsplit(url).path or "/"
+    return url.split("?", 1)[0].split("#", 1)[0]
+
+
+class NameNormalizer:
+    """Maps request URLs to bounded stats names.
+
+    Args:
+        rules: Path templates ("/users/{id}") or (regex, replacement) pairs
+        auto_ids: Replace numeric and UUID path segments
+    """
+
+    def __init__(self, rules: Iterable[NameRule] = (), auto_ids: bool = True):
+        self.templates: List[Tuple[Pattern, str]] = []
+        self.substitutions: List[Tuple[Pattern, str]] = []
+        for rule in rules:
+            if isinstance(rule, str):
+                self.templates.append((_compile_template(rule), rule))
+            else:
+                pattern, replacement = rule
+                self.substitutions.append((re.compile(pattern), replacement))
+        self.auto_ids = auto_ids
+
+    def normalize(self, url: str) -> str:
+        path = _path(url)
+        for pattern, template in self.templates:
+            if pattern.match(path):
+                return budget.admit(template)
+        for pattern, replacement in self.substitutions:
+            path = pattern.sub(replacement, path)
+        if self.auto_ids:
+            path = _ID_SEGMENT.sub(_id_placeholder, path)
+        return budget.admit(path)
+
+
+def compile_name_rules(rules: Iterable[NameRule] = (), auto_ids: bool = True) -> Optional[NameNormalizer]:
+    """A normalizer for the given rules, or None when normalisation is off."""
+    rules = list(rules)
+    if not rules and not auto_ids:
+        return None
+    return NameNormalizer(rules, auto_ids)
@@ -0,0 +1,215 @@
+# locustfiles/utils/phases.py
+"""
+Per-phase HTTP timings for FastHttpUser requests.
+When enabled, geventhttpclient's connection pool and client are wrapped to time
+DNS lookup, TCP connect and TLS handshake; the rest of a request splits into
+time to first byte (send + server time, until response headers are parsed) and
+body download, so the five phases add up to Locust's response time.
+
+Phases are collected per greenlet while a request runs and folded into numpy
+rows per endpoint when its request event fires (no per-request objects are
+kept). Written as phase_timings.csv into LOCUST_RUN_DIR when the test stops;
+workers send their rows to the master.
+
+Enable with LOCUST_PHASE_TIMINGS=true or `record_phases = True` on a user class
+(either turns it on for the whole process).
+"""
+import csv
+import logging
+import os
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Tuple
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from gevent import getcurrent
+from locust import events
+from locust.runners import MasterRunner, WorkerRunner
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("dns", "connect", "tls", "ttfb", "download")
+PHASES_FILE = "phase_timings.csv"
+PHASES_MESSAGE = "phase_timings"
+
+_DNS, _CONNECT, _TLS, _HEADERS_AT = range(4)
+
+# greenlet -> [dns ms, connect ms, tls ms, headers received at (epoch)]
+_pending: "WeakKeyDictionary" = WeakKeyDictionary()
+_enabled = False
+
+
+def _current() -> list:
+    record = _pending.get(getcurrent())
+    if record is None:
+        record = _pending[getcurrent()] = [0.0, 0.0, 0.0, None]
+    return record
+
+
+def _timed(func, slot: int):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current()[slot] += (time.perf_counter() - start) * 1000
+
+    return wrapper
+
+
+def _timed_tls(func):
+    """SSL _connect_socket = TCP connect (timed by the base class) + handshake."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        record = _current()
+        connect_before = record[_CONNECT]
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            total = (time.perf_counter() - start) * 1000
+            record[_TLS] += total - (record[_CONNECT] - connect_before)
+
+    return wrapper
+
+
+def _headers_received(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        response = func(*args, **kwargs)
+        _current()[_HEADERS_AT] = time.time()
+        return response
+
+    return wrapper
+
+
+def enable_phase_timings() -> None:
+    """Wrap geventhttpclient once per process."""
+    global _enabled
+    if _enabled:
+        return
+    from geventhttpclient.client import HTTPClient
+    from geventhttpclient.connectionpool import ConnectionPool, SSLConnectionPool
+
+    ConnectionPool._resolve = _timed(ConnectionPool._resolve, _DNS)
+    ConnectionPool._connect_socket = _timed(ConnectionPool._connect_socket, _CONNECT)
+    SSLConnectionPool._connect_socket = _timed_tls(SSLConnectionPool._connect_socket)
+    HTTPClient.request = _headers_received(HTTPClient.request)
+    _enabled = True
+
+
+class PhaseStats:
+    """Per-endpoint phase sums in growable numpy arrays."""
+
+    def __init__(self):
+        self.reset()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def reset(self):
+        self._rows: Dict[Tuple[str, str], int] = {}
+        self.sums = np.zeros((16, len(PHASES)))
+        # requests, requests that opened a new connection
+        self.counts = np.zeros((16, 2), dtype=np.int64)
+
+    def _row(self, key: Tuple[str, str]) -> int:
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = len(self._rows)
+            if row == len(self.sums):
+                self.sums = np.concatenate([self.sums, np.zeros_like(self.sums)])
+                self.counts = np.concatenate([self.counts, np.zeros_like(self.counts)])
+        return row
+
+    def add(self, key: Tuple[str, str], phases: List[float], new_connection: bool):
+        row = self._row(key)
+        self.sums[row] += phases
+        self.counts[row, 0] += 1
+        self.counts[row, 1] += new_connection
+
+    def to_dict(self) -> dict:
+        n = len(self._rows)
+        return {
+            "keys": [list(k) for k in self._rows],
+            "sums": self.sums[:n].tolist(),
+            "counts": self.counts[:n].tolist(),
+        }
+
+    def merge(self, data: dict):
+        for key, sums, counts in zip(data["keys"], data["sums"], data["counts"]):
+            row = self._row(tuple(key))
+            self.sums[row] += sums
+            self.counts[row] += counts
+
+    def rows(self) -> List[dict]:
+        """Mean milliseconds per phase for every endpoint."""
+        out = []
+        for (method, name), row in sorted(self._rows.items(), key=lambda kv: (kv[0][1], kv[0][0])):
+            requests = int(self.counts[row, 0])
+            entry = {
+                "Type": method,
+                "Name": name,
+                "Request Count": requests,
+                "New Connections": int(self.counts[row, 1]),
+            }
+            for phase, total in zip(PHASES, self.sums[row]):
+                entry[f"{phase} (ms)"] = round(float(total) / requests, 3) if requests else 0.0
+            out.append(entry)
+        return out
+
+
+phase_stats = PhaseStats()
+
+
+def _on_request(request_type, name, response_time, start_time=None, **kwargs):
+    record = _pending.pop(getcurrent(), None)
+    if record is None or response_time is None or start_time is None:
+        return
+    dns, connect, tls, headers_at = record
+    ended_at = start_time + response_time / 1000
+    if headers_at is None:
+        # Failed before a response arrived
+        headers_at = ended_at
+    ttfb = max(0.0, (headers_at - start_time) * 1000 - dns - connect - tls)
+    download = max(0.0, (ended_at - headers_at) * 1000)
+    phase_stats.add((request_type, name), [dns, connect, tls, ttfb, download], connect > 0)
+
+
+def _write_phases():
+    rows = phase_stats.rows()
+    run_dir = os.getenv("LOCUST_RUN_DIR")
+    if not rows or not run_dir:
+        return
+    try:
+        with (Path(run_dir) / PHASES_FILE).open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+    except OSError as e:
+        logger.warning(f"Failed to write {PHASES_FILE}: {e}")
+
+
+@events.init.add_listener
+def _setup_phase_timings(environment, **kwargs):
+    if os.getenv("LOCUST_PHASE_TIMINGS", "false").lower() == "true":
+        enable_phase_timings()
+    if not _enabled:
+        return
+    runner = environment.runner
+    environment.events.request.add_listener(_on_request)
+    environment.events.test_start.add_listener(lambda **kw: phase_stats.reset())
+    environment.events.reset_stats.add_listener(phase_stats.reset)
+    if isinstance(runner, WorkerRunner):
+        # Sent before "client_stopped", so the master has it before its test_stop
+        environment.events.test_stop.add_listener(
+            lambda **kw: runner.send_message(PHASES_MESSAGE, phase_stats.to_dict()) if len(phase_stats) else None
+        )
+        return
+    if isinstance(runner, MasterRunner):
+        runner.register_message(PHASES_MESSAGE, lambda environment, msg, **kw: phase_stats.merge(msg.data))
+    environment.events.test_stop.add_listener(lambda **kw: _write_phases())
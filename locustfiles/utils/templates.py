@@ -0,0 +1,230 @@
+# locustfiles/utils/templates.py
+"""
+Precompiled request templates.
+A template is parsed once into pre-encoded byte segments and typed slots, so
+sending a request only encodes the slot values and joins bytes, instead of
+building a dict and running json.dumps on every task call.
+
+Slots are written {{name:type}} or {{source.field:type}}:
+
+    ORDER = RequestTemplate(
+        "POST", "/users/{{user.id:path}}/orders",
+        body='{"sku": {{sku:str}}, "qty": {{qty:int}}, "ref": {{ref:int}}}',
+        sources={"user": from_feeder("data/users.csv"), "ref": counter()},
+    )
+    self.send_template(ORDER, sku="A-1", qty=2)
+
+Values passed to send_template() win over sources; a source is called once per
+request, so several fields of the same record (user.id, user.name) stay together.
+
+Types: int, float, str (JSON string), bool, json (any value, json.dumps), raw
+(bytes/str inserted as is, e.g. a JSONL record) and path (URL-quoted; the
+default in paths).
+"""
+import json
+import re
+from itertools import count
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from locustfiles.utils.feeders import current_partition, get_feeder
+
+_SLOT = re.compile(r"\{\{\s*([A-Za-z_][\w]*)(?:\.([\w-]+))?\s*(?::\s*(\w+))?\s*\}\}")
+
+_PATH_SAFE = re.compile(r"[A-Za-z0-9_.~-]*\Z")
+# Printable ASCII stays as written in path literals; anything else is percent-quoted
+_PATH_LITERAL_SAFE = "".join(chr(c) for c in range(33, 127))
+
+Encoder = Callable[[Any], bytes]
+
+# Parameter names of render() and BaseLocustUser.send_template(); slot values are
+# passed next to them as keywords, so slots cannot use these names
+RESERVED_SLOTS = frozenset({"self", "template", "expected_status", "check_text"})
+
+
+def _encode_int(value) -> bytes:
+    if value.__class__ is int:
+        return b"%d" % value
+    # "%d" would silently truncate 2.9 and render True as 1
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(f"int slot got non-integral value {value!r}")
+    # e.g. CSV fields arrive as strings
+    return b"%d" % int(value)
+
+
+def _encode_float(value) -> bytes:
+    return repr(float(value)).encode("ascii")
+
+
+def _encode_str(value) -> bytes:
+    return encode_basestring_ascii(value if isinstance(value, str) else str(value)).encode("ascii")
+
+
+def _encode_bool(value) -> bytes:
+    return b"true" if value else b"false"
+
+
+def _encode_json(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_raw(value) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode("utf-8")
+
+
+def _encode_path(value) -> bytes:
+    if value.__class__ is int:
+        return b"%d" % value
+    value = str(value)
+    if _PATH_SAFE.match(value):
+        return value.encode("ascii")
+    return quote(value, safe="").encode("ascii")
+
+
+ENCODERS: Dict[str, Encoder] = {
+    "int": _encode_int,
+    "float": _encode_float,
+    "str": _encode_str,
+    "bool": _encode_bool,
+    "json": _encode_json,
+    "raw": _encode_raw,
+    "path": _encode_path,
+}
+
+
+class CompiledTemplate:
+    """A text template split into literal byte segments and typed slots.
+
+    Args:
+        text: Template text with {{name[.field][:type]}} slots
+        default_type: Slot type when none is given
+        quote_literals: Percent-quote non-ASCII literal text (for paths, which go
+            on the wire as ASCII)
+    """
+
+    def __init__(self, text: str, default_type: str = "str", quote_literals: bool = False):
+        self.text = text
+        self._parts: List[Optional[bytes]] = []
+        # (index in _parts, source name, field or None, encoder)
+        self._slots: List[Tuple[int, str, Optional[str], Encoder]] = []
+        pos = 0
+
+        def literal(segment: str) -> bytes:
+            if quote_literals:
+                return quote(segment, safe=_PATH_LITERAL_SAFE).encode("ascii")
+            return segment.encode("utf-8")
+
+        for match in _SLOT.finditer(text):
+            name, field, type_ = match.group(1), match.group(2), match.group(3) or default_type
+            if type_ not in ENCODERS:
+                raise ValueError(f"Unknown slot type '{type_}' in {match.group(0)}, expected one of {sorted(ENCODERS)}")
+            if match.start() > pos:
+                self._parts.append(literal(text[pos:match.start()]))
+            self._slots.append((len(self._parts), name, field, ENCODERS[type_]))
+            self._parts.append(None)
+            pos = match.end()
+        if pos < len(text):
+            self._parts.append(literal(text[pos:]))
+        self.sources = {name for _, name, _, _ in self._slots}
+        self.render = self._compile_render()
+
+    def _compile_render(self) -> Callable[[Dict[str, Any]], bytes]:
+        """Generate render(values) as one b"".join over literals and encoder calls.
+
+        Unrolling the slots avoids a Python-level loop per request; each source
+        value is looked up once even when several of its fields are used.
+        """
+        namespace: Dict[str, Any] = {}
+        lookups = {name: f"v{i}" for i, name in enumerate(sorted(self.sources))}
+        items = []
+        for index, part in enumerate(self._parts):
+            if part is not None:
+                namespace[f"p{index}"] = part
+            items.append(f"p{index}")
+        for index, name, field, encode in self._slots:
+            namespace[f"e{index}"] = encode
+            value = lookups[name] if field is None else f"{lookups[name]}[{field!r}]"
+            items[index] = f"e{index}({value})"
+        lines = ["def render(values):"]
+        lines += [f"    {var} = values[{name!r}]" for name, var in lookups.items()]
+        lines.append(f"    return b''.join([{', '.join(items)}])")
+        exec("\n".join(lines), namespace)
+        return namespace["render"]
+
+    def label(self) -> str:
+        """The template with slots shown as {name}, e.g. for request names."""
+        return _SLOT.sub(lambda m: "{" + (m.group(2) or m.group(1)) + "}", self.text)
+
+
+class RequestTemplate:
+    """A request whose path and body are compiled once.
+
+    Args:
+        method: HTTP method
+        path: Path template (slots default to the "path" type)
+        body: Body template (slots default to "str"), or None
+        headers: Request headers (Content-Type defaults to JSON when there is a body)
+        name: Stats name (default: the path with slots as {field})
+        sources: Slot values looked up per request when not passed explicitly:
+            a callable (counter(), from_feeder(...)) or a constant
+    """
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        body: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        name: Optional[str] = None,
+        sources: Optional[Dict[str, Any]] = None,
+    ):
+        self.method = method.upper()
+        self.path = CompiledTemplate(path, default_type="path", quote_literals=True)
+        self.body = CompiledTemplate(body) if body is not None else None
+        self.headers = dict(headers or {})
+        if self.body is not None:
+            self.headers.setdefault("Content-Type", "application/json")
+        self.name = name or self.path.label()
+        self.sources = dict(sources or {})
+        needed = self.path.sources | (self.body.sources if self.body else set())
+        reserved = needed & RESERVED_SLOTS
+        if reserved:
+            raise ValueError(f"Template slot names {sorted(reserved)} are reserved; rename them")
+        self._static_path = None if self.path.sources else self.path.render({}).decode("ascii")
+        self._needed = tuple(sorted(needed))
+
+    def render(self, **values) -> Tuple[str, Optional[bytes]]:
+        """Path and body bytes for one request."""
+        for name in self._needed:
+            if name not in values:
+                source = self.sources.get(name)
+                if source is None:
+                    raise KeyError(f"No value or source for template slot '{name}'")
+                values[name] = source() if callable(source) else source
+        path = self._static_path or self.path.render(values).decode("ascii")
+        return path, self.body.render(values) if self.body is not None else None
+
+
+def counter(start: int = 0, step: int = 1) -> Callable[[], int]:
+    """Increasing numbers, unique across workers (worker i of n takes every n-th value)."""
+    positions = count()
+
+    def next_value() -> int:
+        index, workers = current_partition()
+        return start + (next(positions) * workers + index) * step
+
+    return next_value
+
+
+def from_feeder(path: str, mode: str = "sequential", raw: bool = False, loop: bool = True) -> Callable[[], Any]:
+    """Next record of a shared feeder (see feeders.py); raw gives the line bytes.
+
+    With loop=False the user stops once the records are used up (see send_template).
+    """
+
+    def next_record():
+        feeder = get_feeder(path, mode, loop)
+        return feeder.next_raw() if raw else feeder.next()
+
+    return next_record
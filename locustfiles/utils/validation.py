@@ -0,0 +1,103 @@
+# locustfiles/utils/validation.py
+"""
+Response body checks that work on raw bytes.
+Needles are encoded once, previews are size-capped slices of the body, and the
+optional JSON path / regex / schema checks are compiled once per user class, so a
+checked request never decodes the whole body into a str.
+"""
+import json
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Union
+
+try:
+    import jsonschema
+except ImportError:  # optional dependency, only needed for response_schema
+    jsonschema = None
+
+BodyCheck = Callable[[bytes], Optional[str]]
+
+
+@lru_cache(maxsize=1024)
+def encode_needle(text: str) -> bytes:
+    """UTF-8 bytes of a check_text, encoded once per distinct string."""
+    return text.encode("utf-8")
+
+
+def body_preview(content: Optional[bytes], limit: int = 200) -> str:
+    """Decode only the first `limit` bytes of a body for error messages."""
+    if not content:
+        return "No content"
+    return content[:limit].decode("utf-8", errors="replace")
+
+
+def _parse_json_path(path: str) -> List[Union[str, int]]:
+    """'data.items.0.id' -> ['data', 'items', 0, 'id']"""
+    return [int(part) if part.isdigit() else part for part in path.strip(".").split(".") if part]
+
+
+def _resolve(doc: Any, steps: List[Union[str, int]]) -> bool:
+    for step in steps:
+        if isinstance(step, int) and isinstance(doc, list):
+            if step >= len(doc):
+                return False
+            doc = doc[step]
+        elif isinstance(doc, dict) and str(step) in doc:
+            doc = doc[str(step)]
+        else:
+            return False
+    return True
+
+
+def compile_body_checks(
+    json_path: Optional[str] = None,
+    regex: Optional[Union[str, bytes]] = None,
+    schema: Optional[dict] = None,
+) -> Optional[BodyCheck]:
+    """Build one body check function from the configured checks.
+
+    Args:
+        json_path: Dotted path that must exist in the JSON body (e.g. "data.items.0.id")
+        regex: Pattern the raw body must match
+        schema: JSON Schema the body must satisfy (requires the jsonschema package)
+
+    Returns:
+        A function returning an error message (or None if the body passes),
+        or None when no check is configured
+
+    Raises:
+        ImportError: If a schema is given but jsonschema is not installed
+    """
+    if not (json_path or regex or schema):
+        return None
+    pattern = None
+    if regex:
+        pattern = re.compile(regex if isinstance(regex, bytes) else regex.encode("utf-8"))
+    steps = _parse_json_path(json_path) if json_path else None
+    validator = None
+    if schema:
+        if jsonschema is None:
+            raise ImportError("response_schema requires the 'jsonschema' package")
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema)
+
+    def check(content: bytes) -> Optional[str]:
+        if pattern is not None and not pattern.search(content):
+            return f"FAIL: Body does not match /{pattern.pattern.decode('utf-8', 'replace')}/"
+        if steps is None and validator is None:
+            return None
+        try:
+            # json.loads accepts bytes directly
+            doc = json.loads(content)
+        except ValueError:
+            return f"FAIL: Body is not valid JSON: {body_preview(content, 100)}"
+        if steps is not None and not _resolve(doc, steps):
+            return f"FAIL: JSON path '{json_path}' not found"
+        if validator is not None:
+            error = next(validator.iter_errors(doc), None)
+            if error is not None:
+                return f"FAIL: Schema violation at '{'.'.join(map(str, error.absolute_path))}': {error.message[:200]}"
+        return None
+
+    return check